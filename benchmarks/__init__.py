@@ -0,0 +1 @@
+from .runner import benchmark, compare, run  # noqa: F401
@@ -0,0 +1,36 @@
+import argparse
+import sys
+
+import malevich_coretools as mc
+from malevich_coretools.testing import FakeCore
+
+from . import cases  # noqa: F401
+from .runner import Context, compare, load, run, save
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser("python -m benchmarks", description="malevich-coretools client benchmarks against in-process FakeCore")
+    parser.add_argument("--only", nargs="*", help="benchmark names")
+    parser.add_argument("--group", nargs="*", help="benchmark groups: transport, dataframe, decode, import")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="small sizes, for smoke runs")
+    parser.add_argument("--output", help="save results json to path")
+    parser.add_argument("--baseline", help="compare with results json from path, exit code 1 on regression")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown for --baseline")
+    args = parser.parse_args()
+
+    mc.update_core_credentials("benchmark", "benchmark")
+    with FakeCore() as server:
+        results = run(Context(server.url, server, args.quick), names=args.only, groups=args.group, repeat=args.repeat)
+    if args.output is not None:
+        save(results, args.output)
+    if args.baseline is not None:
+        regressions = compare(results, load(args.baseline), args.threshold)
+        if len(regressions) > 0:
+            print(f"regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
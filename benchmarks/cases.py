@@ -0,0 +1,248 @@
+import asyncio
+import functools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import malevich_coretools as mc
+from malevich_coretools.abstract.abstract import (
+    AppLogs,
+    DocsDataCollection,
+    ResultCollection,
+)
+from malevich_coretools.funcs.helpers import docs_to_df
+from malevich_coretools.secondary import model_from_json
+
+from .runner import Context, benchmark
+
+_ROW = {"a": 1, "b": 2.5, "c": "text"}
+
+# transport
+
+
+def _prepare(ctx: Context) -> str:
+    return mc.task_prepare("bench-task", conn_url=ctx.url).operationId
+
+
+@benchmark("create_doc.sync", group="transport")
+def create_doc_sync(ctx: Context):  # noqa: ANN201
+    n = ctx.size(200, 20)
+    return lambda: [mc.create_doc({"a": i}, conn_url=ctx.url) for i in range(n)], n
+
+
+@benchmark("create_doc.async", group="transport")
+def create_doc_async(ctx: Context):  # noqa: ANN201
+    n = ctx.size(200, 20)
+
+    async def fun() -> None:
+        await asyncio.gather(*[mc.create_doc({"a": i}, conn_url=ctx.url, is_async=True) for i in range(n)])
+    return lambda: asyncio.run(fun()), n
+
+
+@benchmark("create_doc.batcher", group="transport")
+def create_doc_batcher(ctx: Context):  # noqa: ANN201
+    n = ctx.size(200, 20)
+
+    def fun() -> None:
+        with mc.Batcher(conn_url=ctx.url):
+            for i in range(n):
+                mc.create_doc({"a": i})
+    return fun, n
+
+
+@benchmark("create_doc.bulk", group="transport")
+def create_doc_bulk(ctx: Context):  # noqa: ANN201
+    n = ctx.size(200, 20)
+    return lambda: mc.bulk(mc.create_doc, [{"a": i} for i in range(n)], on_error="raise", conn_url=ctx.url), n
+
+
+def _threads(ctx: Context, sync_via_loop: bool):  # noqa: ANN202
+    n = ctx.size(200, 20)
+
+    def fun() -> None:
+        mc.set_sync_via_loop(sync_via_loop)
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(lambda i: mc.create_doc({"a": i}, conn_url=ctx.url), range(n)))
+        finally:
+            mc.set_sync_via_loop(False)
+    return fun, n
+
+
+@benchmark("create_doc.threads", group="transport")
+def create_doc_threads(ctx: Context):  # noqa: ANN201
+    return _threads(ctx, False)
+
+
+@benchmark("create_doc.threads_loop", group="transport")
+def create_doc_threads_loop(ctx: Context):  # noqa: ANN201
+    """sync calls from threads over one background event loop"""
+    return _threads(ctx, True)
+
+
+@benchmark("get_collection.sync", group="transport")
+def get_collection_sync(ctx: Context):  # noqa: ANN201
+    n = ctx.size(50, 5)
+    id = ctx.server.add_collection([_ROW] * 100)
+    return lambda: [mc.get_collection(id, conn_url=ctx.url) for _ in range(n)], n
+
+
+@benchmark("get_collection.async", group="transport")
+def get_collection_async(ctx: Context):  # noqa: ANN201
+    n = ctx.size(50, 5)
+    id = ctx.server.add_collection([_ROW] * 100)
+
+    async def fun() -> None:
+        await asyncio.gather(*[mc.get_collection(id, conn_url=ctx.url, is_async=True) for _ in range(n)])
+    return lambda: asyncio.run(fun()), n
+
+
+@benchmark("get_collection.batcher", group="transport")
+def get_collection_batcher(ctx: Context):  # noqa: ANN201
+    n = ctx.size(50, 5)
+    id = ctx.server.add_collection([_ROW] * 100)
+
+    def fun() -> None:
+        with mc.Batcher(conn_url=ctx.url):
+            for _ in range(n):
+                mc.get_collection(id)
+    return fun, n
+
+
+@benchmark("task_run.sync", group="transport")
+def task_run_sync(ctx: Context):  # noqa: ANN201
+    n = ctx.size(200, 20)
+    operation_id = _prepare(ctx)
+    return lambda: [mc.task_run(operation_id, wait=False, conn_url=ctx.url) for _ in range(n)], n
+
+
+@benchmark("task_run.async", group="transport")
+def task_run_async(ctx: Context):  # noqa: ANN201
+    n = ctx.size(200, 20)
+    operation_id = _prepare(ctx)
+
+    async def fun() -> None:
+        await asyncio.gather(*[mc.task_run(operation_id, wait=False, conn_url=ctx.url, is_async=True) for _ in range(n)])
+    return lambda: asyncio.run(fun()), n
+
+
+@benchmark("task_run.batcher", group="transport")
+def task_run_batcher(ctx: Context):  # noqa: ANN201
+    n = ctx.size(200, 20)
+    operation_id = _prepare(ctx)
+
+    def fun() -> None:
+        with mc.Batcher(conn_url=ctx.url):
+            for _ in range(n):
+                mc.task_run(operation_id, wait=False)
+    return fun, n
+
+# dataframes
+
+
+def _df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "int": rng.integers(0, 1000, rows),
+        "float": rng.random(rows),
+        "str": [f"value {i}" for i in range(rows)],
+        "bool": rng.random(rows) > 0.5,
+    })
+
+
+for __rows in [1_000, 10_000, 100_000]:
+    def __raw_collection_from_df(ctx: Context, rows: int = __rows):  # noqa: ANN202
+        rows = min(rows, ctx.size(rows, 1_000))
+        df = _df(rows)
+        return lambda: mc.raw_collection_from_df(df, None, None), rows
+
+    def __get_collection_to_df(ctx: Context, rows: int = __rows):  # noqa: ANN202
+        rows = min(rows, ctx.size(rows, 1_000))
+        id = ctx.server.add_collection([_ROW] * rows)
+        return lambda: mc.get_collection_to_df(id, conn_url=ctx.url), rows
+
+    def __get_collection_to_df_paged(ctx: Context, rows: int = __rows):  # noqa: ANN202
+        rows = min(rows, ctx.size(rows, 1_000))
+        id = ctx.server.add_collection([_ROW] * rows)
+        return lambda: mc.get_collection_to_df(id, conn_url=ctx.url, paged=True), rows
+
+    def __create_collection_from_df(ctx: Context, rows: int = __rows, chunked: bool = False):  # noqa: ANN202
+        rows = min(rows, ctx.size(rows, 1_000))
+        df = _df(rows)
+        return lambda: mc.create_collection_from_df(df, conn_url=ctx.url, chunked=chunked), rows
+
+    def __create_collection_from_file(ctx: Context, rows: int = __rows, **kwargs):  # noqa: ANN202
+        rows = min(rows, ctx.size(rows, 1_000))
+        file = os.path.join(tempfile.mkdtemp(), "data.csv")
+        _df(rows).to_csv(file, index=False)
+        return lambda: mc.create_collection_from_file(file, conn_url=ctx.url, **kwargs), rows
+
+    def __raw_collection_from_df_iterrows(ctx: Context, rows: int = __rows):  # noqa: ANN202
+        """previous per-row encoder, baseline for `raw_collection_from_df`"""
+        rows = min(rows, ctx.size(rows, 1_000))
+        df = _df(rows)
+        return lambda: DocsDataCollection(data=[row.to_json() for _, row in df.iterrows()]), rows
+
+    def __docs_to_df(ctx: Context, rows: int = __rows):  # noqa: ANN202
+        rows = min(rows, ctx.size(rows, 1_000))
+        docs = [json.dumps(row) for row in _df(rows).to_dict("records")]
+        return lambda: docs_to_df(docs), rows
+
+    def __docs_to_df_from_records(ctx: Context, rows: int = __rows):  # noqa: ANN202
+        """previous per-doc decoder, baseline for `docs_to_df`"""
+        rows = min(rows, ctx.size(rows, 1_000))
+        docs = [json.dumps(row) for row in _df(rows).to_dict("records")]
+        return lambda: pd.DataFrame.from_records([json.loads(doc) for doc in docs]), rows
+
+    benchmark(f"raw_collection_from_df.{__rows}", group="dataframe")(__raw_collection_from_df)
+    benchmark(f"raw_collection_from_df.iterrows.{__rows}", group="dataframe")(__raw_collection_from_df_iterrows)
+    benchmark(f"create_collection_from_df.{__rows}", group="dataframe")(__create_collection_from_df)
+    benchmark(f"create_collection_from_df.chunked.{__rows}", group="dataframe")(functools.partial(__create_collection_from_df, chunked=True))
+    benchmark(f"create_collection_from_file.{__rows}", group="dataframe")(__create_collection_from_file)
+    benchmark(f"create_collection_from_file.chunked.{__rows}", group="dataframe")(functools.partial(__create_collection_from_file, chunked=True))
+    benchmark(f"get_collection_to_df.{__rows}", group="dataframe")(__get_collection_to_df)
+    benchmark(f"get_collection_to_df.paged.{__rows}", group="dataframe")(__get_collection_to_df_paged)
+    benchmark(f"docs_to_df.{__rows}", group="dataframe")(__docs_to_df)
+    benchmark(f"docs_to_df.from_records.{__rows}", group="dataframe")(__docs_to_df_from_records)
+
+# decode
+
+
+@benchmark("model_from_json.ResultCollection", group="decode")
+def decode_collection(ctx: Context):  # noqa: ANN201
+    rows = ctx.size(100_000, 5_000)
+    data = json.dumps({"id": "c", "docs": [{"data": json.dumps({"a": i, "b": "text"}), "name": "", "id": str(i)} for i in range(rows)], "length": rows})
+    return lambda: model_from_json(data, ResultCollection), rows
+
+
+@benchmark("model_from_json.AppLogs", group="decode")
+def decode_app_logs(ctx: Context):  # noqa: ANN201
+    apps = ctx.size(200, 20)
+    log = "\n".join(f"line {i} of application log" for i in range(200))
+    data = json.dumps({
+        "operationId": "op",
+        "dagLogs": log,
+        "data": {f"app{i}": {"data": [{"data": "", "logs": {f"run{j}": log for j in range(5)}, "userLogs": {}}]} for i in range(apps)},
+    })
+    return lambda: model_from_json(data, AppLogs), apps
+
+# import
+
+
+@benchmark("import.malevich_coretools", group="import")
+def import_time(ctx: Context):  # noqa: ANN201
+    code = "import time; start = time.perf_counter(); import malevich_coretools; print(time.perf_counter() - start)"
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True, capture_output=True), 1
+
+
+@benchmark("import.first_call", group="import")
+def import_first_call_time(ctx: Context):  # noqa: ANN201
+    """import and resolve sync api, heavy dependencies (pandas, aiohttp, kafka) should stay unloaded"""
+    code = "import sys, malevich_coretools; malevich_coretools.create_doc; assert not {'pandas', 'aiohttp', 'kafka'} & set(sys.modules)"
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True, capture_output=True), 1
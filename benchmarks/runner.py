@@ -0,0 +1,97 @@
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__all__ = ["Context", "benchmark", "run", "compare", "load", "save", "benchmarks"]
+
+
+class Context:
+    def __init__(self, url: Optional[str], server: Any, quick: bool) -> None:  # noqa: ANN401
+        self.url = url
+        self.server = server
+        self.quick = quick
+
+    def size(self, full: int, quick: int) -> int:
+        return quick if self.quick else full
+
+
+Setup = Callable[[Context], Tuple[Callable[[], Any], int]]
+benchmarks: Dict[str, Tuple[str, Setup]] = {}
+
+
+def benchmark(name: str, group: str) -> Callable[[Setup], Setup]:
+    """register benchmark: decorated function prepares data and returns (function to measure, operations count in it)"""
+    def decorator(setup: Setup) -> Setup:
+        assert name not in benchmarks, f"benchmark {name} already exists"
+        benchmarks[name] = (group, setup)
+        return setup
+    return decorator
+
+
+def _measure(fun: Callable[[], Any], repeat: int) -> List[float]:
+    fun()   # warmup
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fun()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run(ctx: Context, names: Optional[List[str]] = None, groups: Optional[List[str]] = None, repeat: int = 5, log: Callable[[str], None] = print) -> Dict[str, Any]:
+    results = {}
+    for name, (group, setup) in benchmarks.items():
+        if (names is not None and name not in names) or (groups is not None and group not in groups):
+            continue
+        fun, ops = setup(ctx)
+        times = _measure(fun, repeat)
+        median = statistics.median(times)
+        results[name] = {
+            "group": group,
+            "ops": ops,
+            "median": median,
+            "min": min(times),
+            "ops_per_second": ops / median if median > 0 else None,
+        }
+        log(f"{name:<45} {median * 1000:>10.2f} ms  {results[name]['ops_per_second'] or 0:>12.1f} ops/s")
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "quick": ctx.quick,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2, log: Callable[[str], None] = print) -> List[str]:
+    """names of benchmarks slower than in `baseline` by more than `threshold` (relative median time)"""
+    regressions = []
+    for name, res in results["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            log(f"{name:<45} new")
+            continue
+        ratio = res["median"] / base["median"] if base["median"] > 0 else 1
+        status = "REGRESSION" if ratio > 1 + threshold else ("improved" if ratio < 1 - threshold else "ok")
+        log(f"{name:<45} {ratio:>8.2f}x  {status}")
+        if status == "REGRESSION":
+            regressions.append(name)
+    return regressions
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
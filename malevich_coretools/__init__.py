@@ -1,4 +1,39 @@
-from .dm_utils import *  # noqa: F403
-from .secondary import logs_streaming  # noqa: F401
-from .tools import vast_settings  # noqa: F401
-from .utils import *  # noqa: F403
+import importlib
+from typing import Any, Dict, List, Optional
+
+# public api is imported on first use: module -> names (None - all public names of the module), later modules override earlier ones
+__exports: Dict[str, Optional[List[str]]] = {
+    ".dm_utils": None,
+    ".secondary": ["logs_streaming"],
+    ".tools": ["vast_settings"],
+    ".utils": None,
+}
+
+
+def __load() -> Dict[str, Any]:
+    api = {}
+    for module_name, names in __exports.items():
+        module = importlib.import_module(module_name, __name__)
+        if names is None:
+            names = [name for name in vars(module) if not name.startswith("_")]
+        api.update((name, getattr(module, name)) for name in names)
+    globals().update(api)
+    globals()["__all__"] = list(api)
+    return api
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name != "__all__" and name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    api = __load()
+    if name == "__all__":
+        return list(api)
+    if name in api:
+        return api[name]
+    if name in globals():   # submodule
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__getattr__("__all__")))
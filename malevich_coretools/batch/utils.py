@@ -6,8 +6,6 @@ from pydantic import BaseModel, BeforeValidator, GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 from typing_extensions import Annotated
 
-from malevich_coretools.secondary.config import Config
-
 __all__ = ["DefferOperation", "Batcher", "BatchOperation", "BatchOperations", "BatcherRaiseOption"]
 
 
@@ -79,7 +77,7 @@ class DefferOperationInternal(str):
         self.__code = code
         if self.__result_model is not None and self.__code < 400:   # ok
             try:
-                from malevich_coretools.secondary import model_from_json
+                from malevich_coretools.secondary import Config, model_from_json
                 self.__data = model_from_json(res, self.__result_model, is_list=None)
             except BaseException:
                 Config.logger.error(f"parse {self.__alias} failed, model={self.__result_model.__name__}")
@@ -134,6 +132,7 @@ class Batcher:
 
     def __commit(self) -> None:
         from malevich_coretools.funcs.funcs import post_batch
+        from malevich_coretools.secondary.tracing import span
 
         if len(self.__operations) != 0:
             if self.__validate:
@@ -141,7 +140,9 @@ class Batcher:
             for operation in self.__operations.values():
                 operation.dependencies = list(set(operation.dependencies))
             data = BatchOperations(data=self.__operations.values())
-            for item in post_batch(data, auth=self.__auth, conn_url=self.__conn_url).data:
+            with span("Batcher.commit", operations=len(self.__operations)):
+                res = post_batch(data, auth=self.__auth, conn_url=self.__conn_url)
+            for item in res.data:
                 self.__alias_to_operation[item.alias]._set(item.data, item.code)
         self.__committed = True
         if self.__raise_option == BatcherRaiseOption.QUICKLY:
@@ -153,10 +154,12 @@ class Batcher:
         self.__commit()
 
     def __enter__(self) -> 'Batcher':
+        from malevich_coretools.secondary import Config
         self.__previous_batcher, Config.BATCHER = Config.BATCHER, self
         return self
 
     def __exit__(self, type, value, traceback) -> bool:
+        from malevich_coretools.secondary import Config
         Config.BATCHER = self.__previous_batcher
         assert not self.__committed, "already committed"
 
@@ -178,10 +181,11 @@ class Batcher:
 
         if data is not None:
             if isinstance(data, BaseModel):
-                data = data.model_dump_json()
+                from malevich_coretools.secondary.codec import current_codec
+                data = current_codec().encode_model(data).decode(encoding='utf-8')
                 search_values.append(data)
-            elif isinstance(data, bytes):
-                data = data.decode(encoding='utf-8')    # FIXME
+            elif isinstance(data, (bytes, memoryview)):
+                data = str(data, encoding='utf-8')    # FIXME
             else:
                 raise RuntimeError(f"wrong data type: {data}")
         for k, v in vars.items():
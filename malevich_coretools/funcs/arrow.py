@@ -0,0 +1,78 @@
+import json
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["COLLECTION_OBJECT_KEY", "df_to_parquet", "df_from_parquet", "df_to_feather", "df_from_feather", "iter_parquet_dfs", "link_metadata"]
+
+COLLECTION_OBJECT_KEY = "collectionObject"  # collection metadata key with linked collection object: {"path": ..., "format": ...}
+
+
+def __pyarrow():  # noqa: ANN202
+    try:
+        import pyarrow
+    except ImportError as ex:
+        raise ImportError("parquet and feather need pyarrow: pip install pyarrow") from ex
+    return pyarrow
+
+
+def __to_pandas(table: Any) -> "pd.DataFrame":  # noqa: ANN401
+    return table.to_pandas(split_blocks=True, self_destruct=True)   # table is not used after, its buffers are released by columns
+
+
+def df_to_parquet(data: "pd.DataFrame", compression: Optional[str] = "snappy", row_group_size: Optional[int] = None) -> memoryview:
+    """parquet file bytes as view of arrow buffer (not copied to `bytes`), row groups written to it, index dropped"""
+    pa = __pyarrow()
+    import pyarrow.parquet as pq
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), sink, compression=compression, row_group_size=row_group_size)
+    return memoryview(sink.getvalue())
+
+
+def df_from_parquet(data: bytes, columns: Optional[List[str]] = None) -> "pd.DataFrame":
+    """df from parquet file bytes, read without copy of `data`"""
+    pa = __pyarrow()
+    import pyarrow.parquet as pq
+
+    return __to_pandas(pq.read_table(pa.BufferReader(data), columns=columns))
+
+
+def df_to_feather(data: "pd.DataFrame", compression: Optional[str] = "lz4") -> memoryview:
+    """feather (arrow ipc file) bytes as view of arrow buffer (not copied to `bytes`), index dropped"""
+    pa = __pyarrow()
+    import pyarrow.feather as feather
+
+    sink = pa.BufferOutputStream()
+    feather.write_feather(pa.Table.from_pandas(data, preserve_index=False), sink, compression=compression)
+    return memoryview(sink.getvalue())
+
+
+def df_from_feather(data: bytes, columns: Optional[List[str]] = None) -> "pd.DataFrame":
+    """df from feather bytes, uncompressed columns are not copied until pandas conversion"""
+    pa = __pyarrow()
+    import pyarrow.feather as feather
+
+    return __to_pandas(feather.read_table(pa.BufferReader(data), columns=columns, memory_map=False))
+
+
+def iter_parquet_dfs(file: str, batch_size: int = 100_000) -> Iterator["pd.DataFrame"]:
+    """dfs of at most `batch_size` rows from parquet file, read by row groups"""
+    __pyarrow()
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(file).iter_batches(batch_size=batch_size):
+        yield batch.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def link_metadata(metadata: Optional[str], path: str, format: str) -> str:
+    """collection `metadata` json with link to collection object by `path` (other metadata kept if it is json object)"""
+    try:
+        data = json.loads(metadata) if metadata is not None else {}
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    data[COLLECTION_OBJECT_KEY] = {"path": path, "format": format}
+    return json.dumps(data)
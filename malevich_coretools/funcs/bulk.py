@@ -0,0 +1,133 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import itertools
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from malevich_coretools.batch import Batcher, BatcherRaiseOption
+
+__all__ = ["BulkResult", "bulk_async"]
+
+Outcome = Tuple[int, Any, Optional[BaseException]]   # item index, result, error
+
+
+class BulkResult:
+    """`bulk` results: with `ordered` - `results[i]` for i-th item (None if failed), else successful results by completion; `errors` - item index -> exception"""
+    __slots__ = ("results", "errors")
+
+    def __init__(self) -> None:
+        self.results: List[Any] = []
+        self.errors: Dict[int, BaseException] = {}
+
+    @property
+    def ok(self) -> bool:
+        return len(self.errors) == 0
+
+    def __repr__(self) -> str:
+        return f"BulkResult(results={len(self.results)}, errors={len(self.errors)})"
+
+
+def __args(item: Any) -> tuple:  # noqa: ANN401
+    return item if isinstance(item, tuple) else (item,)
+
+
+def __caller(fn: Callable, kwargs: Dict[str, Any]) -> Callable[[Any], Any]:
+    """coroutine function for one item"""
+    parameters = inspect.signature(fn).parameters
+    if "is_async" in parameters:
+        async def call(item: Any) -> Any:  # noqa: ANN401
+            return await fn(*__args(item), is_async=True, **kwargs)
+    elif inspect.iscoroutinefunction(fn):
+        async def call(item: Any) -> Any:  # noqa: ANN401
+            return await fn(*__args(item), **kwargs)
+    else:
+        async def call(item: Any) -> Any:  # noqa: ANN401
+            context = contextvars.copy_context()
+            return await asyncio.get_running_loop().run_in_executor(None, functools.partial(context.run, fn, *__args(item), **kwargs))
+    return call
+
+
+def __batch(fn: Callable, chunk: List[Tuple[int, Any]], kwargs: Dict[str, Any]) -> List[Outcome]:
+    """one `Batcher` commit for `chunk`"""
+    batcher = Batcher(raise_option=BatcherRaiseOption.IGNORE, auth=kwargs.get("auth"), conn_url=kwargs.get("conn_url"))
+    operations = []
+    outcomes = []
+    for index, item in chunk:
+        try:
+            operations.append((index, fn(*__args(item), batcher=batcher, **kwargs)))
+        except Exception as ex:
+            outcomes.append((index, None, ex))
+    if len(operations) > 0:
+        batcher.commit()
+    for index, operation in operations:
+        if operation.ok():
+            outcomes.append((index, operation.get(), None))
+        else:
+            outcomes.append((index, None, Exception(f"code={operation.code()}: {operation.get()}")))
+    return outcomes
+
+
+def __chunks(items: Iterator[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+async def bulk_async(fn: Callable, items: Iterable[Any], concurrency: int = 16, ordered: bool = True, on_error: str = "collect", progress: Optional[Callable[[int, Optional[int]], None]] = None, batch_size: Optional[int] = None, **kwargs) -> BulkResult:
+    """call `fn` for each item (tuple - positional arguments) with `kwargs`, at most `concurrency` at once; items taken lazily"""
+    assert concurrency > 0, "concurrency should be positive"
+    assert on_error in ("collect", "raise"), f"wrong on_error: {on_error}, expected collect or raise"
+    total = len(items) if hasattr(items, "__len__") else None
+    batched = batch_size is not None and "batcher" in inspect.signature(fn).parameters
+    if batched:
+        assert batch_size > 0, "batch_size should be positive"
+        units = __chunks(enumerate(items), batch_size)
+        loop = asyncio.get_running_loop()
+
+        async def run(chunk: List[Tuple[int, Any]]) -> List[Outcome]:
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(None, functools.partial(context.run, __batch, fn, chunk, kwargs))
+    else:
+        units = enumerate(items)
+        call = __caller(fn, kwargs)
+
+        async def run(unit: Tuple[int, Any]) -> List[Outcome]:
+            index, item = unit
+            try:
+                return [(index, await call(item), None)]
+            except Exception as ex:
+                return [(index, None, ex)]
+
+    res = BulkResult()
+    done = 0
+
+    async def worker() -> None:
+        nonlocal done
+        for unit in units:      # shared iterator
+            for index, value, error in await run(unit):
+                if error is not None:
+                    if on_error == "raise":
+                        raise error
+                    res.errors[index] = error
+                elif not ordered:
+                    res.results.append(value)
+                if ordered:
+                    if index >= len(res.results):
+                        res.results.extend([None] * (index + 1 - len(res.results)))
+                    res.results[index] = value
+                done += 1
+            if progress is not None:
+                progress(done, total)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+    if ordered and total is not None and len(res.results) < total:
+        res.results.extend([None] * (total - len(res.results)))
+    return res
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from malevich_coretools.secondary.routes import route_name, route_prefix
+
+__all__ = ["CacheEntry", "CacheStats", "ResponseCache", "DEFAULT_CACHE_TTLS"]
+
+DEFAULT_CACHE_TTLS = {     # endpoint name from `secondary.const` -> second
+    "DOCS_ID": 60,
+    "SCHEMES_ID": 60 * 60,
+    "SCHEMES_ID_RAW": 60 * 60,
+    "SCHEMES_MAPPING_IDS": 60 * 60,
+    "USER_APPS_ID": 60,
+    "USER_APPS_REAL_ID": 60,
+    "ENDPOINTS": 60,
+    "MANAGER_IMAGE_INFO": 24 * 60 * 60,     # only for digest-pinned images
+}
+_CLEAR_ALL_PREFIXES = {route_prefix(path) for path in ["api/v1/batch", "api/v1/admin"]}    # may change anything
+_READ_ONLY_ROUTES = {"MANAGER_IMAGE_INFO"}     # posted, but do not change anything
+
+
+class CacheEntry:
+    __slots__ = ("content", "encoding", "etag", "expires")
+
+    def __init__(self, content: bytes, encoding: Optional[str], etag: Optional[str], expires: float) -> None:
+        self.content = content
+        self.encoding = encoding
+        self.etag = etag
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0      # stale entries confirmed by core with 304
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0               # bytes in memory
+    count: int = 0              # entries in memory
+
+
+class _DiskTier:
+    """entries as files in `path/<controller hash>/<key hash>`: json header line and raw content, credentials are only hashed into the file name; least recently used removed above `max_size` bytes"""
+
+    def __init__(self, path: str, max_size: int) -> None:
+        self.__path = path
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self.__size = sum(entry.stat().st_size for entry in self.__files())
+
+    def __files(self) -> list:
+        files = []
+        for directory in os.scandir(self.__path):
+            if directory.is_dir():
+                files.extend(entry for entry in os.scandir(directory.path) if entry.is_file())
+        return files
+
+    def __dir(self, prefix: str) -> str:
+        return os.path.join(self.__path, hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16])
+
+    def __file(self, key: Tuple[str, Hashable, str]) -> str:
+        host, auth, path = key
+        auth = "" if auth is None else hashlib.sha256(":".join(auth).encode("utf-8")).hexdigest()
+        name = hashlib.sha256("\n".join([host, auth, path]).encode("utf-8")).hexdigest()
+        return os.path.join(self.__dir(route_prefix(path)), name)
+
+    def get(self, key: Tuple[str, Hashable, str]) -> Optional[CacheEntry]:
+        path = self.__file(key)
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                content = f.read()
+            os.utime(path)
+            return CacheEntry(content, header["encoding"], header["etag"], header["expires"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: Tuple[str, Hashable, str], entry: CacheEntry) -> None:
+        path = self.__file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}"
+        with open(tmp, "wb") as f:
+            f.write(json.dumps({"encoding": entry.encoding, "etag": entry.etag, "expires": entry.expires}).encode("utf-8"))
+            f.write(b"\n")
+            f.write(entry.content)
+        size = os.path.getsize(tmp)
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp, path)
+        with self.__lock:
+            self.__size += size - old_size
+            if self.__size > self.__max_size:
+                self.__evict()
+
+    def __evict(self) -> None:
+        for entry in sorted(self.__files(), key=lambda entry: entry.stat().st_mtime):
+            if self.__size <= self.__max_size * 0.9:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self.__size -= size
+            except OSError:
+                pass
+
+    def invalidate(self, prefix: Optional[str]) -> None:
+        """all if `prefix` is None"""
+        with self.__lock:
+            if prefix is None:
+                shutil.rmtree(self.__path, ignore_errors=True)
+                os.makedirs(self.__path, exist_ok=True)
+            else:
+                shutil.rmtree(self.__dir(prefix), ignore_errors=True)
+            self.__size = sum(entry.stat().st_size for entry in self.__files())
+
+
+class ResponseCache:
+    """client-side cache of core GET responses by (host, auth, path): ttl by endpoint name (`ttls`, see `DEFAULT_CACHE_TTLS`), in memory LRU up to `max_size` bytes and optional disk tier in `path` up to `disk_max_size` bytes; stale entries with ETag are revalidated with If-None-Match; writes with the same client invalidate entries of the same controller"""
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = 64 * 1024 * 1024, path: Optional[str] = None, disk_max_size: int = 1024 * 1024 * 1024) -> None:
+        self.ttls = DEFAULT_CACHE_TTLS if ttls is None else ttls
+        self.__max_size = max_size
+        self.__entries: OrderedDict[Tuple[str, Hashable, str], CacheEntry] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__stats = CacheStats()
+        self.__disk = None if path is None else _DiskTier(path, disk_max_size)
+
+    def ttl(self, path: str) -> Optional[float]:
+        """None - not cached"""
+        name = route_name(path)
+        return None if name is None else self.ttls.get(name)
+
+    def get(self, key: Tuple[str, Hashable, str]) -> Optional[CacheEntry]:
+        """entry (mb stale) or None, fresh entries are counted as hits, others - as misses"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+        if entry is None and self.__disk is not None:
+            entry = self.__disk.get(key)
+            if entry is not None:
+                self.__put_memory(key, entry)
+        with self.__lock:
+            if entry is not None and entry.fresh:
+                self.__stats.hits += 1
+            else:
+                self.__stats.misses += 1
+        return entry
+
+    def put(self, key: Tuple[str, Hashable, str], content: bytes, encoding: Optional[str], etag: Optional[str], ttl: float) -> None:
+        entry = CacheEntry(content, encoding, etag, time.time() + ttl)
+        self.__put_memory(key, entry)
+        if self.__disk is not None:
+            self.__disk.put(key, entry)
+
+    def revalidated(self, key: Tuple[str, Hashable, str], entry: CacheEntry, ttl: float) -> None:
+        """core confirmed stale `entry` (304 Not Modified)"""
+        with self.__lock:
+            self.__stats.revalidations += 1
+        self.put(key, entry.content, entry.encoding, entry.etag, ttl)
+
+    def __put_memory(self, key: Tuple[str, Hashable, str], entry: CacheEntry) -> None:
+        size = len(entry.content)
+        if size > self.__max_size:
+            return
+        with self.__lock:
+            old = self.__entries.pop(key, None)
+            if old is not None:
+                self.__stats.size -= len(old.content)
+            self.__entries[key] = entry
+            self.__stats.size += size
+            while self.__stats.size > self.__max_size:
+                _, old = self.__entries.popitem(last=False)
+                self.__stats.size -= len(old.content)
+                self.__stats.evictions += 1
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """forget entries of the controller of `path` (all for batch and admin, nothing for read only posts), all if `path` is None"""
+        if path is not None and route_name(path) in _READ_ONLY_ROUTES:
+            return
+        prefix = None if path is None else route_prefix(path)
+        if prefix in _CLEAR_ALL_PREFIXES:
+            prefix = None
+        with self.__lock:
+            if prefix is None:
+                self.__entries.clear()
+                self.__stats.size = 0
+            else:
+                for key in [key for key in self.__entries if route_prefix(key[2]) == prefix]:
+                    self.__stats.size -= len(self.__entries.pop(key).content)
+            self.__stats.invalidations += 1
+        if self.__disk is not None:
+            self.__disk.invalidate(prefix)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> CacheStats:
+        with self.__lock:
+            return self.__stats.model_copy(update={"count": len(self.__entries)})
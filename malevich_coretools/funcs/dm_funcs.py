@@ -1,13 +1,21 @@
 from http import HTTPStatus
-from typing import Any, AsyncIterable, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterable, Iterable, List, Optional, Union
 
-import aiohttp
-import requests
 from requests.models import Response
 
+from malevich_coretools.funcs.loop import background_loop
+from malevich_coretools.funcs.sessions import async_sessions, sync_sessions
+from malevich_coretools.funcs.transport import (
+    RequestPolicy,
+    request,
+    request_async,
+)
 from malevich_coretools.secondary import Config
 from malevich_coretools.secondary.const import *  # noqa: F403
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 def dm_stream(operation_id: str, run_id: str, bind_id: str, conn_url: Optional[str]=None) -> Iterable:
     return send_to_dm_stream(DM_STREAM(operation_id, run_id, bind_id), conn_url=conn_url)
@@ -66,7 +74,7 @@ def __check_response(path: str, response: Response):  # noqa: ANN202
     response.raise_for_status()
 
 
-async def __async_check_response(response: aiohttp.ClientResponse, path: Optional[str] = None):  # noqa: ANN202
+async def __async_check_response(response: "aiohttp.ClientResponse", path: Optional[str] = None):  # noqa: ANN202
     if not response.ok:
         text = await response.text()
         if path is not None:
@@ -80,10 +88,12 @@ async def __async_check_response(response: aiohttp.ClientResponse, path: Optiona
     response.raise_for_status()
 
 
-def send_to_dm_get(path: str, is_text: bool=True, conn_url: Optional[str]=None) -> Optional[Union[str, bytes]]:
+def send_to_dm_get(path: str, is_text: bool=True, conn_url: Optional[str]=None, policy: Optional[RequestPolicy]=None) -> Optional[Union[str, bytes]]:
+    if Config.SYNC_VIA_LOOP:
+        return background_loop.run(send_to_dm_get_async(path, is_text=is_text, conn_url=conn_url, policy=policy))
     host = Config.DM_HOST_PORT if conn_url is None else conn_url
     assert host is not None, "dm host port not set"
-    response = requests.get(f"{host}{path}", headers=HEADERS)
+    response = request(sync_sessions.get(host), "GET", f"{host}{path}", headers=HEADERS, policy=policy)
     __check_response(f"{host}{path}", response)
     if response.status_code == HTTPStatus.NO_CONTENT:
         return None
@@ -95,49 +105,51 @@ def send_to_dm_get(path: str, is_text: bool=True, conn_url: Optional[str]=None)
         return response.content
 
 
-async def send_to_dm_get_async(path: str, is_text: bool=True, conn_url: Optional[str]=None, async_session = None) -> Optional[Union[str, bytes]]:
+async def send_to_dm_get_async(path: str, is_text: bool=True, conn_url: Optional[str]=None, async_session = None, policy: Optional[RequestPolicy]=None) -> Optional[Union[str, bytes]]:
     host = Config.DM_HOST_PORT if conn_url is None else conn_url
     assert host is not None, "dm host port not set"
-    async with async_session or aiohttp.ClientSession(connector=aiohttp.TCPConnector(verify_ssl=False), timeout=aiohttp.ClientTimeout(total=None)) as session:
-        async with session.get(f"{host}{path}", headers=HEADERS) as response:
-            await __async_check_response(response, f"{host}{path}")
-            if response.status == HTTPStatus.NO_CONTENT:
-                return None
-            if is_text is True:
-                return await response.text()
-            elif is_text is False:
-                return await response.json()
-            else:
-                return await response.read()
+    session = async_session or async_sessions.get(host)
+    response = await request_async(session, "GET", f"{host}{path}", headers=HEADERS, policy=policy)
+    await __async_check_response(response, f"{host}{path}")
+    if response.status == HTTPStatus.NO_CONTENT:
+        return None
+    if is_text is True:
+        return await response.text()
+    elif is_text is False:
+        return await response.json()
+    else:
+        return await response.read()
 
 
-def send_to_dm_post(path: str, operation: Optional[Any] = None, conn_url: Optional[str]=None) -> Optional[str]:  # noqa: ANN401
+def send_to_dm_post(path: str, operation: Optional[Any] = None, conn_url: Optional[str]=None, policy: Optional[RequestPolicy]=None) -> Optional[str]:  # noqa: ANN401
+    if Config.SYNC_VIA_LOOP:
+        return background_loop.run(send_to_dm_post_async(path, operation, conn_url=conn_url, policy=policy))
     host = Config.DM_HOST_PORT if conn_url is None else conn_url
     assert host is not None, "dm host port not set"
-    response = requests.post(f"{host}{path}", data=operation, headers=HEADERS)
+    response = request(sync_sessions.get(host), "POST", f"{host}{path}", data=operation, headers=HEADERS, policy=policy)
     __check_response(f"{host}{path}", response)
     if response.status_code == HTTPStatus.NO_CONTENT:
         return None
     return response.text
 
 
-async def send_to_dm_post_async(path: str, operation: Optional[Any] = None, conn_url: Optional[str]=None, async_session=None) -> str:  # noqa: ANN401
+async def send_to_dm_post_async(path: str, operation: Optional[Any] = None, conn_url: Optional[str]=None, async_session=None, policy: Optional[RequestPolicy]=None) -> str:  # noqa: ANN401
     host = Config.DM_HOST_PORT if conn_url is None else conn_url
     assert host is not None, "dm host port not set"
-    async with async_session or aiohttp.ClientSession(connector=aiohttp.TCPConnector(verify_ssl=False), timeout=aiohttp.ClientTimeout(total=None)) as session:
-        async with session.post(f"{host}{path}", data=operation, headers=HEADERS) as response:
-            await __async_check_response(response, f"{host}{path}")
-            if response.status == HTTPStatus.NO_CONTENT:
-                return None
-            return response.text()
+    session = async_session or async_sessions.get(host)
+    response = await request_async(session, "POST", f"{host}{path}", data=operation, headers=HEADERS, policy=policy)
+    await __async_check_response(response, f"{host}{path}")
+    if response.status == HTTPStatus.NO_CONTENT:
+        return None
+    return await response.text()
 
 
-def send_to_dm_stream(path: str, conn_url: Optional[str]=None) -> Iterable:
+def send_to_dm_stream(path: str, conn_url: Optional[str]=None, policy: Optional[RequestPolicy]=None) -> Iterable:
     host = Config.DM_HOST_PORT if conn_url is None else conn_url
     assert host is not None, "dm host port not set"
 
     def stream_generator() -> None:
-        with requests.get(f"{host}{path}", headers=HEADERS, stream=True) as response:
+        with request(sync_sessions.get(host), "GET", f"{host}{path}", headers=HEADERS, stream=True, policy=policy) as response:
             __check_response(f"{host}{path}", response)
             if response.status_code == HTTPStatus.NO_CONTENT:
                 return
@@ -147,16 +159,16 @@ def send_to_dm_stream(path: str, conn_url: Optional[str]=None) -> Iterable:
     return stream_generator()
 
 
-async def send_to_dm_stream_async(path: str, conn_url: Optional[str]=None, async_session = None) -> AsyncIterable:
+async def send_to_dm_stream_async(path: str, conn_url: Optional[str]=None, async_session = None, policy: Optional[RequestPolicy]=None) -> AsyncIterable:
     host = Config.DM_HOST_PORT if conn_url is None else conn_url
     assert host is not None, "dm host port not set"
 
     async def stream_generator() -> None:
-        async with async_session or aiohttp.ClientSession(connector=aiohttp.TCPConnector(verify_ssl=False), timeout=aiohttp.ClientTimeout(total=None)) as session:
-            async with session.get(f"{host}{path}", headers=HEADERS) as response:
-                await __async_check_response(response, f"{host}{path}")
-                if response.status == HTTPStatus.NO_CONTENT:
-                    return
-                async for chunk in response.content.iter_any():
-                    yield chunk.decode("utf-8", errors="ignore")
+        session = async_session or async_sessions.get(host)
+        async with await request_async(session, "GET", f"{host}{path}", headers=HEADERS, stream=True, policy=policy) as response:
+            await __async_check_response(response, f"{host}{path}")
+            if response.status == HTTPStatus.NO_CONTENT:
+                return
+            async for chunk in response.content.iter_any():
+                yield chunk.decode("utf-8", errors="ignore")
     return stream_generator()
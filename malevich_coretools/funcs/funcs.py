@@ -1,12 +1,20 @@
 import asyncio
-import datetime
-import json
+import hashlib
+import time
 from asyncio import exceptions
 from http import HTTPStatus
-from typing import Any, Callable, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
 
-import aiohttp
-import requests
 from requests.models import Response
 
 from malevich_coretools.abstract.abstract import *  # noqa: F403
@@ -16,39 +24,62 @@ from malevich_coretools.abstract.pipeline import (
     Pipeline,
     RunInfo,
 )
+from malevich_coretools.funcs.cache import CacheEntry
 from malevich_coretools.funcs.checks import check_profile_mode
-from malevich_coretools.secondary import Config, model_from_json, show_logs_func
+from malevich_coretools.funcs.loop import background_loop
+from malevich_coretools.funcs.sessions import async_sessions, sync_sessions
+from malevich_coretools.funcs.singleflight import async_flights, sync_flights
+from malevich_coretools.funcs.transport import (
+    RequestPolicy,
+    long_wait_policy,
+    request,
+    request_async,
+)
+from malevich_coretools.funcs.wait import (
+    OperationEvent,
+    WaitPolicy,
+    as_completed,
+    wait_for,
+)
+from malevich_coretools.secondary import Config, const, model_from_json, show_logs_func
+from malevich_coretools.secondary.codec import current_codec
 from malevich_coretools.secondary.const import *  # noqa: F403
 from malevich_coretools.secondary.helpers import (
     show_fail_app_info,
     show_logs_flatten_func_endpoint,
 )
+from malevich_coretools.secondary.metrics import CodecEvent, emit
+from malevich_coretools.secondary.routes import route_name
+from malevich_coretools.secondary.stream import JsonArrayReader
+
+if TYPE_CHECKING:
+    import aiohttp
 
 # DocsController
 
 
 def get_docs(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(DOCS(None), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(DOCS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_docs_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(DOCS(None), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(DOCS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_docs_id(id: str, *args, **kwargs) -> ResultDoc:
-    return model_from_json(send_to_core_get(DOCS_ID(id, None), *args, **kwargs), ResultDoc)
+    return model_from_json(send_to_core_get(DOCS_ID(id, None), *args, is_text=None, **kwargs), ResultDoc)
 
 
 async def get_docs_id_async(id: str, *args, **kwargs) -> ResultDoc:
-    return model_from_json(await send_to_core_get_async(DOCS_ID(id, None), *args, **kwargs), ResultDoc)
+    return model_from_json(await send_to_core_get_async(DOCS_ID(id, None), *args, is_text=None, **kwargs), ResultDoc)
 
 
 def get_docs_name(name: str, *args, **kwargs) -> ResultDoc:
-    return model_from_json(send_to_core_get(DOCS_NAME(name, None), *args, **kwargs), ResultDoc)
+    return model_from_json(send_to_core_get(DOCS_NAME(name, None), *args, is_text=None, **kwargs), ResultDoc)
 
 
 async def get_docs_name_async(name: str, *args, **kwargs) -> ResultDoc:
-    return model_from_json(await send_to_core_get_async(DOCS_NAME(name, None), *args, **kwargs), ResultDoc)
+    return model_from_json(await send_to_core_get_async(DOCS_NAME(name, None), *args, is_text=None, **kwargs), ResultDoc)
 
 
 def post_docs(data: DocWithName, wait: bool, *args, **kwargs) -> Alias.Id:
@@ -86,59 +117,75 @@ async def delete_docs_async(wait: bool, *args, **kwargs) -> Alias.Info:
 
 
 def get_collections(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(send_to_core_get(COLLECTIONS(None), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(send_to_core_get(COLLECTIONS(None), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 async def get_collections_async(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(await send_to_core_get_async(COLLECTIONS(None), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(await send_to_core_get_async(COLLECTIONS(None), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 def get_collections_name(name: str, operation_id: Optional[str], run_id: Optional[str], *args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(send_to_core_get(COLLECTIONS_IDS_NAME(name, operation_id, run_id), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(send_to_core_get(COLLECTIONS_IDS_NAME(name, operation_id, run_id), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 async def get_collections_name_async(name: str, operation_id: Optional[str], run_id: Optional[str], *args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(await send_to_core_get_async(COLLECTIONS_IDS_NAME(name, operation_id, run_id), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(await send_to_core_get_async(COLLECTIONS_IDS_NAME(name, operation_id, run_id), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 def get_collection_name(name: str, operation_id: Optional[str], run_id: Optional[str], offset: int, limit: int, *args, **kwargs) -> ResultCollection:
-    return model_from_json(send_to_core_get(COLLECTIONS_NAME(name, operation_id, run_id, offset, limit), *args, **kwargs), ResultCollection)
+    return model_from_json(send_to_core_get(COLLECTIONS_NAME(name, operation_id, run_id, offset, limit), *args, is_text=None, **kwargs), ResultCollection)
 
 
 async def get_collection_name_async(name: str, operation_id: Optional[str], run_id: Optional[str], offset: int, limit: int, *args, **kwargs) -> ResultCollection:
-    return model_from_json(await send_to_core_get_async(COLLECTIONS_NAME(name, operation_id, run_id, offset, limit), *args, **kwargs), ResultCollection)
+    return model_from_json(await send_to_core_get_async(COLLECTIONS_NAME(name, operation_id, run_id, offset, limit), *args, is_text=None, **kwargs), ResultCollection)
+
+
+def stream_collection_name(name: str, operation_id: Optional[str], run_id: Optional[str], offset: int, limit: int, rows: bool, *args, **kwargs) -> Iterator[Union[ResultDoc, Dict[str, Any]]]:
+    return __collection_docs(send_to_core_get_stream(COLLECTIONS_NAME(name, operation_id, run_id, offset, limit), *args, **kwargs), rows)
+
+
+async def stream_collection_name_async(name: str, operation_id: Optional[str], run_id: Optional[str], offset: int, limit: int, rows: bool, *args, **kwargs) -> AsyncIterable[Union[ResultDoc, Dict[str, Any]]]:
+    return __collection_docs_async(await send_to_core_get_stream_async(COLLECTIONS_NAME(name, operation_id, run_id, offset, limit), *args, **kwargs), rows)
 
 
 def get_collections_ids_groupName(name: str, operation_id: str, run_id: str, *args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(COLLECTIONS_IDS_GROUP_NAME(name, operation_id, run_id), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(COLLECTIONS_IDS_GROUP_NAME(name, operation_id, run_id), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_collections_ids_groupName_async(name: str, operation_id: str, run_id: str, *args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(COLLECTIONS_IDS_GROUP_NAME(name, operation_id, run_id), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(COLLECTIONS_IDS_GROUP_NAME(name, operation_id, run_id), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_collections_groupName(name: str, operation_id: str, run_id: str, *args, **kwargs) -> ResultCollections:
-    return model_from_json(send_to_core_get(COLLECTIONS_GROUP_NAME(name, operation_id, run_id), *args, **kwargs), ResultCollections)
+    return model_from_json(send_to_core_get(COLLECTIONS_GROUP_NAME(name, operation_id, run_id), *args, is_text=None, **kwargs), ResultCollections)
 
 
 async def get_collections_groupName_async(name: str, operation_id: str, run_id: str, *args, **kwargs) -> ResultCollections:
-    return model_from_json(await send_to_core_get_async(COLLECTIONS_GROUP_NAME(name, operation_id, run_id), *args, **kwargs), ResultCollections)
+    return model_from_json(await send_to_core_get_async(COLLECTIONS_GROUP_NAME(name, operation_id, run_id), *args, is_text=None, **kwargs), ResultCollections)
 
 
 def get_collections_id(id: str, offset: int, limit: int, raw: bool, *args, **kwargs) -> Union[ResultCollection, Alias.Json]:
-    res = send_to_core_get(COLLECTIONS_ID(id, offset, limit, raw), *args, is_text=raw, **kwargs)
+    res = send_to_core_get(COLLECTIONS_ID(id, offset, limit, raw), *args, is_text=True if raw else None, **kwargs)
     if not raw:
         res = model_from_json(res, ResultCollection)
     return res
 
 
 async def get_collections_id_async(id: str, offset: int, limit: int, raw: bool, *args, **kwargs) -> Union[ResultCollection, Alias.Json]:
-    res = await send_to_core_get_async(COLLECTIONS_ID(id, offset, limit, raw), *args, is_text=raw, **kwargs)
+    res = await send_to_core_get_async(COLLECTIONS_ID(id, offset, limit, raw), *args, is_text=True if raw else None, **kwargs)
     if not raw:
         res = model_from_json(res, ResultCollection)
     return res
 
 
+def stream_collections_id(id: str, offset: int, limit: int, rows: bool, *args, **kwargs) -> Iterator[Union[ResultDoc, Dict[str, Any]]]:
+    return __collection_docs(send_to_core_get_stream(COLLECTIONS_ID(id, offset, limit, False), *args, **kwargs), rows)
+
+
+async def stream_collections_id_async(id: str, offset: int, limit: int, rows: bool, *args, **kwargs) -> AsyncIterable[Union[ResultDoc, Dict[str, Any]]]:
+    return __collection_docs_async(await send_to_core_get_stream_async(COLLECTIONS_ID(id, offset, limit, False), *args, **kwargs), rows)
+
+
 def post_collections(data: DocsCollection, wait: bool, *args, **kwargs) -> Alias.Id:
     return send_to_core_modify(COLLECTIONS(wait), data, *args, **kwargs)
 
@@ -262,11 +309,11 @@ async def delete_collections_id_del_async(id: str, data: DocsCollectionChange, w
 
 
 def get_collection_objects(path: Optional[str], recursive: Optional[bool], *args, **kwargs) -> FilesDirs:
-    return model_from_json(send_to_core_get(COLLECTION_OBJECTS_ALL_GET(path, recursive), *args, **kwargs), FilesDirs)
+    return model_from_json(send_to_core_get(COLLECTION_OBJECTS_ALL_GET(path, recursive), *args, is_text=None, **kwargs), FilesDirs)
 
 
 async def get_collection_objects_async(path: Optional[str], recursive: Optional[bool], *args, **kwargs) -> FilesDirs:
-    return model_from_json(await send_to_core_get_async(COLLECTION_OBJECTS_ALL_GET(path, recursive), *args, **kwargs), FilesDirs)
+    return model_from_json(await send_to_core_get_async(COLLECTION_OBJECTS_ALL_GET(path, recursive), *args, is_text=None, **kwargs), FilesDirs)
 
 
 def get_collection_object(path: str, *args, **kwargs) -> bytes:
@@ -336,27 +383,27 @@ async def delete_collection_object_async(path: str, wait: bool, *args, **kwargs)
 
 
 def get_endpoints(*args, **kwargs) -> Endpoints:
-    return model_from_json(send_to_core_get(ENDPOINTS_ALL(None), *args, **kwargs), Endpoints)
+    return model_from_json(send_to_core_get(ENDPOINTS_ALL(None), *args, is_text=None, **kwargs), Endpoints)
 
 
 async def get_endpoints_async(*args, **kwargs) -> Endpoints:
-    return model_from_json(await send_to_core_get_async(ENDPOINTS_ALL(None), *args, **kwargs), Endpoints)
+    return model_from_json(await send_to_core_get_async(ENDPOINTS_ALL(None), *args, is_text=None, **kwargs), Endpoints)
 
 
 def get_endpoint_by_hash(hash: str, *args, **kwargs) -> Endpoint:
-    return model_from_json(send_to_core_get(ENDPOINTS(hash, None), *args, **kwargs), Endpoint)
+    return model_from_json(send_to_core_get(ENDPOINTS(hash, None), *args, is_text=None, **kwargs), Endpoint)
 
 
 async def get_endpoint_by_hash_async(hash: str, *args, **kwargs) -> Endpoint:
-    return model_from_json(await send_to_core_get_async(ENDPOINTS(hash, None), *args, **kwargs), Endpoint)
+    return model_from_json(await send_to_core_get_async(ENDPOINTS(hash, None), *args, is_text=None, **kwargs), Endpoint)
 
 
 def get_endpoint_run(hash: str, *args, **kwargs) -> Endpoint:
-    return model_from_json(send_to_core_get(ENDPOINTS_RUN(hash), *args, **kwargs), EndpointRunInfo)
+    return model_from_json(send_to_core_get(ENDPOINTS_RUN(hash), *args, is_text=None, **kwargs), EndpointRunInfo)
 
 
 async def get_endpoint_run_async(hash: str, *args, **kwargs) -> Endpoint:
-    return model_from_json(await send_to_core_get_async(ENDPOINTS_RUN(hash), *args, **kwargs), EndpointRunInfo)
+    return model_from_json(await send_to_core_get_async(ENDPOINTS_RUN(hash), *args, is_text=None, **kwargs), EndpointRunInfo)
 
 
 def run_endpoint(hash: str, data: Optional[EndpointOverride], with_show: bool, *args, **kwargs) -> Union[AppLogsWithResults, FlattenAppLogsWithResults, Any]:
@@ -436,19 +483,19 @@ async def delete_endpoint_async(hash: str, wait: bool, *args, **kwargs) -> Alias
 
 
 def get_schemes(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(send_to_core_get(SCHEMES(None), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(send_to_core_get(SCHEMES(None), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 async def get_schemes_async(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(await send_to_core_get_async(SCHEMES(None), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(await send_to_core_get_async(SCHEMES(None), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 def get_schemes_id(id: str, *args, **kwargs) -> ResultScheme:
-    return model_from_json(send_to_core_get(SCHEMES_ID(id, None), *args, **kwargs), ResultScheme)
+    return model_from_json(send_to_core_get(SCHEMES_ID(id, None), *args, is_text=None, **kwargs), ResultScheme)
 
 
 async def get_schemes_id_async(id: str, *args, **kwargs) -> ResultScheme:
-    return model_from_json(await send_to_core_get_async(SCHEMES_ID(id, None), *args, **kwargs), ResultScheme)
+    return model_from_json(await send_to_core_get_async(SCHEMES_ID(id, None), *args, is_text=None, **kwargs), ResultScheme)
 
 
 def get_schemes_id_raw(id: str, *args, **kwargs) -> Alias.Json:
@@ -460,11 +507,11 @@ async def get_schemes_id_raw_async(id: str, *args, **kwargs) -> Alias.Json:
 
 
 def get_schemes_mapping(scheme_from_id: str, scheme_to_id: str, *args, **kwargs) -> ResultMapping:
-    return model_from_json(send_to_core_get(SCHEMES_MAPPING_IDS(scheme_from_id, scheme_to_id), *args, **kwargs), ResultMapping)
+    return model_from_json(send_to_core_get(SCHEMES_MAPPING_IDS(scheme_from_id, scheme_to_id), *args, is_text=None, **kwargs), ResultMapping)
 
 
 async def get_schemes_mapping_async(scheme_from_id: str, scheme_to_id: str, *args, **kwargs) -> ResultMapping:
-    return model_from_json(await send_to_core_get_async(SCHEMES_MAPPING_IDS(scheme_from_id, scheme_to_id), *args, **kwargs), ResultMapping)
+    return model_from_json(await send_to_core_get_async(SCHEMES_MAPPING_IDS(scheme_from_id, scheme_to_id), *args, is_text=None, **kwargs), ResultMapping)
 
 
 def post_schemes(data: SchemeWithName, wait: bool, *args, **kwargs) -> Alias.Id:
@@ -534,11 +581,11 @@ async def get_ping_async(*args, **kwargs) -> Alias.Info:
 
 
 def get_secret_keys(*args, **kwargs) -> ResultNames:
-    return model_from_json(send_to_core_get(SECRET_KEYS_MAIN, *args, **kwargs), ResultNames)
+    return model_from_json(send_to_core_get(SECRET_KEYS_MAIN, *args, is_text=None, **kwargs), ResultNames)
 
 
 async def get_secret_keys_async(*args, **kwargs) -> ResultNames:
-    return model_from_json(await send_to_core_get_async(SECRET_KEYS_MAIN, *args, **kwargs), ResultNames)
+    return model_from_json(await send_to_core_get_async(SECRET_KEYS_MAIN, *args, is_text=None, **kwargs), ResultNames)
 
 
 def post_secret_keys_name(name: str, wait: bool, *args, **kwargs) -> Alias.Info:
@@ -569,35 +616,35 @@ async def delete_secret_keys_async(wait: bool, *args, **kwargs) -> Alias.Info:
 
 
 def get_share_collection_id(id: str, *args, **kwargs) -> ResultLogins:
-    return model_from_json(send_to_core_get(SHARE_COLLECTION_ID(id, None), *args, **kwargs), ResultLogins)
+    return model_from_json(send_to_core_get(SHARE_COLLECTION_ID(id, None), *args, is_text=None, **kwargs), ResultLogins)
 
 
 async def get_share_collection_id_async(id: str, *args, **kwargs) -> ResultLogins:
-    return model_from_json(await send_to_core_get_async(SHARE_COLLECTION_ID(id, None), *args, **kwargs), ResultLogins)
+    return model_from_json(await send_to_core_get_async(SHARE_COLLECTION_ID(id, None), *args, is_text=None, **kwargs), ResultLogins)
 
 
 def get_share_scheme_id(id: str, *args, **kwargs) -> ResultLogins:
-    return model_from_json(send_to_core_get(SHARE_SCHEME_ID(id, None), *args, **kwargs), ResultLogins)
+    return model_from_json(send_to_core_get(SHARE_SCHEME_ID(id, None), *args, is_text=None, **kwargs), ResultLogins)
 
 
 async def get_share_scheme_id_async(id: str, *args, **kwargs) -> ResultLogins:
-    return model_from_json(await send_to_core_get_async(SHARE_SCHEME_ID(id, None), *args, **kwargs), ResultLogins)
+    return model_from_json(await send_to_core_get_async(SHARE_SCHEME_ID(id, None), *args, is_text=None, **kwargs), ResultLogins)
 
 
 def get_share_userApp_id(id: str, *args, **kwargs) -> ResultLogins:
-    return model_from_json(send_to_core_get(SHARE_USER_APP_ID(id, None), *args, **kwargs), ResultLogins)
+    return model_from_json(send_to_core_get(SHARE_USER_APP_ID(id, None), *args, is_text=None, **kwargs), ResultLogins)
 
 
 async def get_share_userApp_id_async(id: str, *args, **kwargs) -> ResultLogins:
-    return model_from_json(await send_to_core_get_async(SHARE_USER_APP_ID(id, None), *args, **kwargs), ResultLogins)
+    return model_from_json(await send_to_core_get_async(SHARE_USER_APP_ID(id, None), *args, is_text=None, **kwargs), ResultLogins)
 
 
 def get_share_login(login: str, *args, **kwargs) -> ResultSharedForLogin:
-    return model_from_json(send_to_core_get(SHARE_LOGIN(login), *args, **kwargs), ResultSharedForLogin)
+    return model_from_json(send_to_core_get(SHARE_LOGIN(login), *args, is_text=None, **kwargs), ResultSharedForLogin)
 
 
 async def get_share_login_async(login: str, *args, **kwargs) -> ResultSharedForLogin:
-    return model_from_json(await send_to_core_get_async(SHARE_LOGIN(login), *args, **kwargs), ResultSharedForLogin)
+    return model_from_json(await send_to_core_get_async(SHARE_LOGIN(login), *args, is_text=None, **kwargs), ResultSharedForLogin)
 
 
 def post_share_collection_id(id: str, data: SharedWithUsers, wait: bool, *args, **kwargs) -> Alias.Info:
@@ -659,11 +706,11 @@ async def get_register_login_async(login: str, *args, **kwargs) -> Alias.Info:
 
 
 def get_register_all(*args, **kwargs) -> ResultLogins:
-    return model_from_json(send_to_core_get(REGISTER_ALL, *args, **kwargs), ResultLogins)
+    return model_from_json(send_to_core_get(REGISTER_ALL, *args, is_text=None, **kwargs), ResultLogins)
 
 
 async def get_register_all_async(*args, **kwargs) -> ResultLogins:
-    return model_from_json(await send_to_core_get_async(REGISTER_ALL, *args, **kwargs), ResultLogins)
+    return model_from_json(await send_to_core_get_async(REGISTER_ALL, *args, is_text=None, **kwargs), ResultLogins)
 
 
 def post_register(data: User, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> Alias.Info:
@@ -717,11 +764,11 @@ async def delete_register_login_async(login: str, wait: bool, *args, **kwargs) -
 
 
 def get_register_keys(*args, **kwargs) -> Keys:
-    return model_from_json(send_to_core_get(REGISTER_KEYS(None), *args, **kwargs), Keys)
+    return model_from_json(send_to_core_get(REGISTER_KEYS(None), *args, is_text=None, **kwargs), Keys)
 
 
 async def get_register_keys_async(*args, **kwargs) -> Keys:
-    return model_from_json(await send_to_core_get_async(REGISTER_KEYS(None), *args, **kwargs), Keys)
+    return model_from_json(await send_to_core_get_async(REGISTER_KEYS(None), *args, is_text=None, **kwargs), Keys)
 
 
 def get_register_keys_name(name: str, *args, **kwargs) -> str:
@@ -760,27 +807,27 @@ async def delete_register_keys_async(wait: bool, *args, **kwargs) -> Alias.Info:
 
 
 def get_userApps(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(send_to_core_get(USER_APPS(None), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(send_to_core_get(USER_APPS(None), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 async def get_userApps_async(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(await send_to_core_get_async(USER_APPS(None), *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(await send_to_core_get_async(USER_APPS(None), *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 def get_userApps_realIds(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(send_to_core_get(USER_APPS_REAL_IDS, *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(send_to_core_get(USER_APPS_REAL_IDS, *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 async def get_userApps_realIds_async(*args, **kwargs) -> ResultOwnAndSharedIds:
-    return model_from_json(await send_to_core_get_async(USER_APPS_REAL_IDS, *args, **kwargs), ResultOwnAndSharedIds)
+    return model_from_json(await send_to_core_get_async(USER_APPS_REAL_IDS, *args, is_text=None, **kwargs), ResultOwnAndSharedIds)
 
 
 def get_userApps_mapIds(*args, **kwargs) -> ResultOwnAndSharedIdsMap:
-    return model_from_json(send_to_core_get(USER_APPS_MAP_IDS, *args, **kwargs), ResultOwnAndSharedIdsMap)
+    return model_from_json(send_to_core_get(USER_APPS_MAP_IDS, *args, is_text=None, **kwargs), ResultOwnAndSharedIdsMap)
 
 
 async def get_userApps_mapIds_async(*args, **kwargs) -> ResultOwnAndSharedIdsMap:
-    return model_from_json(await send_to_core_get_async(USER_APPS_MAP_IDS, *args, **kwargs), ResultOwnAndSharedIdsMap)
+    return model_from_json(await send_to_core_get_async(USER_APPS_MAP_IDS, *args, is_text=None, **kwargs), ResultOwnAndSharedIdsMap)
 
 
 def get_userApps_mapId(id, *args, **kwargs) -> Alias.Id:
@@ -792,19 +839,19 @@ async def get_userApps_mapId_async(id, *args, **kwargs) -> Alias.Id:
 
 
 def get_userApps_id(id: str, *args, **kwargs) -> UserApp:
-    return model_from_json(send_to_core_get(USER_APPS_ID(id, None), *args, **kwargs), UserApp)
+    return model_from_json(send_to_core_get(USER_APPS_ID(id, None), *args, is_text=None, **kwargs), UserApp)
 
 
 async def get_userApps_id_async(id: str, *args, **kwargs) -> UserApp:
-    return model_from_json(await send_to_core_get_async(USER_APPS_ID(id, None), *args, **kwargs), UserApp)
+    return model_from_json(await send_to_core_get_async(USER_APPS_ID(id, None), *args, is_text=None, **kwargs), UserApp)
 
 
 def get_userApps_realId(id: str, *args, **kwargs) -> UserApp:
-    return model_from_json(send_to_core_get(USER_APPS_REAL_ID(id), *args, **kwargs), UserApp)
+    return model_from_json(send_to_core_get(USER_APPS_REAL_ID(id), *args, is_text=None, **kwargs), UserApp)
 
 
 async def get_userApps_realId_async(id: str, *args, **kwargs) -> UserApp:
-    return model_from_json(await send_to_core_get_async(USER_APPS_REAL_ID(id), *args, **kwargs), UserApp)
+    return model_from_json(await send_to_core_get_async(USER_APPS_REAL_ID(id), *args, is_text=None, **kwargs), UserApp)
 
 
 def post_userApps(data: UserApp, wait: bool, *args, **kwargs) -> Alias.Id:
@@ -842,27 +889,27 @@ async def delete_userApps_id_async(id: str, wait: bool, *args, **kwargs) -> Alia
 
 
 def get_userTasks(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_TASKS(None), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_TASKS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userTasks_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_TASKS(None), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_TASKS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_userTasks_realIds(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_TASKS_REAL_IDS, *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_TASKS_REAL_IDS, *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userTasks_realIds_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_TASKS_REAL_IDS, *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_TASKS_REAL_IDS, *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_userTasks_mapIds(*args, **kwargs) -> ResultIdsMap:
-    return model_from_json(send_to_core_get(USER_TASKS_MAP_IDS, *args, **kwargs), ResultIdsMap)
+    return model_from_json(send_to_core_get(USER_TASKS_MAP_IDS, *args, is_text=None, **kwargs), ResultIdsMap)
 
 
 async def get_userTasks_mapIds_async(*args, **kwargs) -> ResultIdsMap:
-    return model_from_json(await send_to_core_get_async(USER_TASKS_MAP_IDS, *args, **kwargs), ResultIdsMap)
+    return model_from_json(await send_to_core_get_async(USER_TASKS_MAP_IDS, *args, is_text=None, **kwargs), ResultIdsMap)
 
 
 def get_userTasks_mapId(id: str, *args, **kwargs) -> Alias.Id:
@@ -874,19 +921,19 @@ async def get_userTasks_mapId_async(id: str, *args, **kwargs) -> Alias.Id:
 
 
 def get_userTasks_id(id: str, *args, **kwargs) -> UserTask:
-    return model_from_json(send_to_core_get(USER_TASKS_ID(id, None), *args, **kwargs), UserTask)
+    return model_from_json(send_to_core_get(USER_TASKS_ID(id, None), *args, is_text=None, **kwargs), UserTask)
 
 
 async def get_userTasks_id_async(id: str, *args, **kwargs) -> UserTask:
-    return model_from_json(await send_to_core_get_async(USER_TASKS_ID(id, None), *args, **kwargs), UserTask)
+    return model_from_json(await send_to_core_get_async(USER_TASKS_ID(id, None), *args, is_text=None, **kwargs), UserTask)
 
 
 def get_userTasks_realId(id: str, *args, **kwargs) -> UserTask:
-    return model_from_json(send_to_core_get(USER_TASKS_REAL_ID(id), *args, **kwargs), UserTask)
+    return model_from_json(send_to_core_get(USER_TASKS_REAL_ID(id), *args, is_text=None, **kwargs), UserTask)
 
 
 async def get_userTasks_realId_async(id: str, *args, **kwargs) -> UserTask:
-    return model_from_json(await send_to_core_get_async(USER_TASKS_REAL_ID(id), *args, **kwargs), UserTask)
+    return model_from_json(await send_to_core_get_async(USER_TASKS_REAL_ID(id), *args, is_text=None, **kwargs), UserTask)
 
 
 def post_userTasks(data: UserTask, wait: bool, *args, **kwargs) -> Alias.Id:
@@ -924,27 +971,27 @@ async def delete_userTasks_id_async(id: str, wait: bool, *args, **kwargs) -> Ali
 
 
 def get_userPipelines(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_PIPELINES(None), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_PIPELINES(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userPipelines_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_PIPELINES(None), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_PIPELINES(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_userPipelines_realIds(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_PIPELINES_REAL_IDS, *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_PIPELINES_REAL_IDS, *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userPipelines_realIds_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_PIPELINES_REAL_IDS, *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_PIPELINES_REAL_IDS, *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_userPipelines_mapIds(*args, **kwargs) -> ResultIdsMap:
-    return model_from_json(send_to_core_get(USER_PIPELINES_MAP_IDS, *args, **kwargs), ResultIdsMap)
+    return model_from_json(send_to_core_get(USER_PIPELINES_MAP_IDS, *args, is_text=None, **kwargs), ResultIdsMap)
 
 
 async def get_userPipelines_mapIds_async(*args, **kwargs) -> ResultIdsMap:
-    return model_from_json(await send_to_core_get_async(USER_PIPELINES_MAP_IDS, *args, **kwargs), ResultIdsMap)
+    return model_from_json(await send_to_core_get_async(USER_PIPELINES_MAP_IDS, *args, is_text=None, **kwargs), ResultIdsMap)
 
 
 def get_userPipelines_mapId(id: str, *args, **kwargs) -> Alias.Id:
@@ -956,35 +1003,35 @@ async def get_userPipelines_mapId_async(id: str, *args, **kwargs) -> Alias.Id:
 
 
 def get_userPipelines_id(id: str, *args, **kwargs) -> Pipeline:
-    return model_from_json(send_to_core_get(USER_PIPELINES_ID(id, None), *args, **kwargs), Pipeline).simplify()
+    return model_from_json(send_to_core_get(USER_PIPELINES_ID(id, None), *args, is_text=None, **kwargs), Pipeline).simplify()
 
 
 async def get_userPipelines_id_async(id: str, *args, **kwargs) -> Pipeline:
-    return model_from_json(await send_to_core_get_async(USER_PIPELINES_ID(id, None), *args, **kwargs), Pipeline).simplify()
+    return model_from_json(await send_to_core_get_async(USER_PIPELINES_ID(id, None), *args, is_text=None, **kwargs), Pipeline).simplify()
 
 
 def get_userPipelines_realId(id: str, *args, **kwargs) -> Pipeline:
-    return model_from_json(send_to_core_get(USER_PIPELINES_REAL_ID(id), *args, **kwargs), Pipeline).simplify()
+    return model_from_json(send_to_core_get(USER_PIPELINES_REAL_ID(id), *args, is_text=None, **kwargs), Pipeline).simplify()
 
 
 async def get_userPipelines_realId_async(id: str, *args, **kwargs) -> Pipeline:
-    return model_from_json(await send_to_core_get_async(USER_PIPELINES_REAL_ID(id), *args, **kwargs), Pipeline).simplify()
+    return model_from_json(await send_to_core_get_async(USER_PIPELINES_REAL_ID(id), *args, is_text=None, **kwargs), Pipeline).simplify()
 
 
 def get_userPipelines_imageTag(tag: str, *args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_PIPELINES_IMAGE_TAG(tag), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_PIPELINES_IMAGE_TAG(tag), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userPipelines_imageTag_async(tag: str, *args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_PIPELINES_IMAGE_TAG(tag), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_PIPELINES_IMAGE_TAG(tag), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_userPipelines_realIds_imageTag(tag: str, *args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_PIPELINES_IMAGE_TAG_REAL_IDS(tag), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_PIPELINES_IMAGE_TAG_REAL_IDS(tag), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userPipelines_realIds_imageTag_async(tag: str, *args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_PIPELINES_IMAGE_TAG_REAL_IDS(tag), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_PIPELINES_IMAGE_TAG_REAL_IDS(tag), *args, is_text=None, **kwargs), ResultIds)
 
 
 def post_userPipelines_tags(data: Tags, *args, **kwargs) -> ResultIds:
@@ -1047,27 +1094,27 @@ async def delete_userPipelines_tags_async(data: Tags, wait: bool, *args, **kwarg
 
 
 def get_userCfgs(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_CFGS(None), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_CFGS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userCfgs_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_CFGS(None), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_CFGS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_userCfgs_realIds(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(USER_CFGS_REAL_IDS, *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(USER_CFGS_REAL_IDS, *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_userCfgs_realIds_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(USER_CFGS_REAL_IDS, *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(USER_CFGS_REAL_IDS, *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_userCfgs_mapIds(*args, **kwargs) -> ResultIdsMap:
-    return model_from_json(send_to_core_get(USER_CFGS_MAP_IDS, *args, **kwargs), ResultIdsMap)
+    return model_from_json(send_to_core_get(USER_CFGS_MAP_IDS, *args, is_text=None, **kwargs), ResultIdsMap)
 
 
 async def get_userCfgs_mapIds_async(*args, **kwargs) -> ResultIdsMap:
-    return model_from_json(await send_to_core_get_async(USER_CFGS_MAP_IDS, *args, **kwargs), ResultIdsMap)
+    return model_from_json(await send_to_core_get_async(USER_CFGS_MAP_IDS, *args, is_text=None, **kwargs), ResultIdsMap)
 
 
 def get_userCfgs_mapId(id: str, *args, **kwargs) -> Alias.Id:
@@ -1079,19 +1126,19 @@ async def get_userCfgs_mapId_async(id: str, *args, **kwargs) -> Alias.Id:
 
 
 def get_userCfgs_id(id: str, *args, **kwargs) -> ResultUserCfg:
-    return model_from_json(send_to_core_get(USER_CFGS_ID(id, None), *args, **kwargs), ResultUserCfg)
+    return model_from_json(send_to_core_get(USER_CFGS_ID(id, None), *args, is_text=None, **kwargs), ResultUserCfg)
 
 
 async def get_userCfgs_id_async(id: str, *args, **kwargs) -> ResultUserCfg:
-    return model_from_json(await send_to_core_get_async(USER_CFGS_ID(id, None), *args, **kwargs), ResultUserCfg)
+    return model_from_json(await send_to_core_get_async(USER_CFGS_ID(id, None), *args, is_text=None, **kwargs), ResultUserCfg)
 
 
 def get_userCfgs_realId(id: str, *args, **kwargs) -> ResultUserCfg:
-    return model_from_json(send_to_core_get(USER_CFGS_REAL_ID(id), *args, **kwargs), ResultUserCfg)
+    return model_from_json(send_to_core_get(USER_CFGS_REAL_ID(id), *args, is_text=None, **kwargs), ResultUserCfg)
 
 
 async def get_userCfgs_realId_async(id: str, *args, **kwargs) -> ResultUserCfg:
-    return model_from_json(await send_to_core_get_async(USER_CFGS_REAL_ID(id), *args, **kwargs), ResultUserCfg)
+    return model_from_json(await send_to_core_get_async(USER_CFGS_REAL_ID(id), *args, is_text=None, **kwargs), ResultUserCfg)
 
 
 def post_userCfgs(data: UserCfg, wait: bool, *args, **kwargs) -> Alias.Id:
@@ -1129,11 +1176,11 @@ async def delete_userCfgs_id_async(id: str, wait: bool, *args, **kwargs) -> Alia
 
 
 def get_operationResults(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(OPERATION_RESULTS(None), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(OPERATION_RESULTS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_operationResults_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(OPERATION_RESULTS(None), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(OPERATION_RESULTS(None), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_operationResults_id(id: str, is_text=True, *args, **kwargs) -> Optional[str]:
@@ -1144,6 +1191,59 @@ async def get_operationResults_id_async(id: str, is_text=True, *args, **kwargs)
     return await send_to_core_get_async(OPERATION_RESULTS_ID(id, None), is_text=is_text, *args, **kwargs)
 
 
+def wait_operationResults_id(id: str, timeout: Optional[float], policy: Optional[WaitPolicy], auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> str:
+    return background_loop.run(__get_result(id, timeout=timeout, auth=auth, conn_url=conn_url, policy=policy))
+
+
+async def wait_operationResults_id_async(id: str, timeout: Optional[float], policy: Optional[WaitPolicy], auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> str:
+    return await __get_result(id, timeout=timeout, auth=auth, conn_url=conn_url, policy=policy)
+
+
+__RESULT_PENDING_STATUSES = {HTTPStatus.NOT_FOUND, HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.TOO_MANY_REQUESTS}   # and 5xx
+
+
+def __result_status(code: int) -> str:
+    """operation result response `code` -> SUCCESS, PENDING (not ready yet, rate limited or server error - poll again) or FAILED"""
+    if code < 400:
+        return "SUCCESS"
+    if code in __RESULT_PENDING_STATUSES or code >= 500:
+        return "PENDING"
+    return "FAILED"
+
+
+async def __poll_operations(ids: List[str], with_statuses: bool, batch_size: int, auth: Optional[AUTH], conn_url: Optional[str]) -> Dict[str, OperationEvent]:
+    """results (and runs statuses) of `ids` by batch requests of `batch_size` ids"""
+    async def poll(chunk: List[str]) -> List[OperationEvent]:
+        operations = [BatchOperation(type="getOperationResultById", vars={"id": id}, alias=f"result{i}") for i, id in enumerate(chunk)]
+        if with_statuses:
+            operations.extend(BatchOperation(type="getStatuses", vars={"operationId": id}, alias=f"statuses{i}") for i, id in enumerate(chunk))
+        responses = {response.alias: response for response in (await post_batch_async(BatchOperations(data=operations), auth=auth, conn_url=conn_url)).data}
+        events = []
+        for i, id in enumerate(chunk):
+            response = responses[f"result{i}"]
+            status = __result_status(response.code)
+            if status != "PENDING":
+                events.append(OperationEvent(id, status, response.data))
+            else:
+                statuses = responses.get(f"statuses{i}")
+                statuses = model_from_json(statuses.data, Statuses).data if statuses is not None and statuses.code < 400 else None
+                events.append(OperationEvent(id, "IN_PROGRESS" if statuses else "PENDING", statuses=statuses))
+        return events
+
+    chunks = await asyncio.gather(*[poll(ids[i:i + batch_size]) for i in range(0, len(ids), batch_size)])
+    return {event.operation_id: event for events in chunks for event in events}
+
+
+async def as_completed_operationResults_async(ids: Iterable[str], timeout: Optional[float], policy: Optional[WaitPolicy], with_statuses: bool, on_event: Optional[Callable[[OperationEvent], None]], batch_size: int, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> AsyncIterator[OperationEvent]:
+    poll = lambda pending: __poll_operations(pending, with_statuses, batch_size, auth, conn_url)
+    async for event in as_completed(poll, ids, timeout=timeout, policy=policy, on_event=on_event):
+        yield event
+
+
+def as_completed_operationResults(ids: Iterable[str], timeout: Optional[float], policy: Optional[WaitPolicy], with_statuses: bool, on_event: Optional[Callable[[OperationEvent], None]], batch_size: int, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> Iterator[OperationEvent]:
+    return background_loop.iterate(as_completed_operationResults_async(ids, timeout, policy, with_statuses, on_event, batch_size, auth=auth, conn_url=conn_url))
+
+
 def delete_operationResults(wait: bool, *args, **kwargs) -> Alias.Info:
     return send_to_core_modify(OPERATION_RESULTS(wait), *args, **kwargs, is_post=False)
 
@@ -1163,19 +1263,19 @@ async def delete_operationResults_id_async(id: str, wait: bool, *args, **kwargs)
 
 
 def get_run_condition(id: str, *args, **kwargs) -> Condition:
-    return model_from_json(send_to_core_get(TEMP_RUN_CONDITION(id), *args, **kwargs), Condition)
+    return model_from_json(send_to_core_get(TEMP_RUN_CONDITION(id), *args, is_text=None, **kwargs), Condition)
 
 
 async def get_run_condition_async(id: str, *args, **kwargs) -> Condition:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_CONDITION(id), *args, **kwargs), Condition)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_CONDITION(id), *args, is_text=None, **kwargs), Condition)
 
 
 def get_run_activeRuns(id: Optional[str], *args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(TEMP_RUN_ACTIVE_RUNS(id), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(TEMP_RUN_ACTIVE_RUNS(id), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_run_activeRuns_async(id: Optional[str], *args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_ACTIVE_RUNS(id), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_ACTIVE_RUNS(id), *args, is_text=None, **kwargs), ResultIds)
 
 
 def post_run_activeRuns(data: RunsFilter, *args, **kwargs) -> Union[ResultIds, ResultTags]:
@@ -1187,11 +1287,11 @@ async def post_run_activeRuns_async(data: RunsFilter, *args, **kwargs) -> Union[
 
 
 def get_run_allRuns(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(TEMP_RUN_ALL_RUNS, *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(TEMP_RUN_ALL_RUNS, *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_run_allRuns_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_ALL_RUNS, *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_ALL_RUNS, *args, is_text=None, **kwargs), ResultIds)
 
 
 def post_run_allRuns(data: RunsFilter, *args, **kwargs) -> Union[ResultIds, ResultTags]:
@@ -1203,35 +1303,35 @@ async def post_run_allRuns_async(data: RunsFilter, *args, **kwargs) -> Union[Res
 
 
 def get_run_mainTaskCfg(id: str, *args, **kwargs) -> MainTaskCfg:
-    return model_from_json(send_to_core_get(TEMP_RUN_MAIN_TASK_CFG(id), *args, **kwargs), MainTaskCfg)
+    return model_from_json(send_to_core_get(TEMP_RUN_MAIN_TASK_CFG(id), *args, is_text=None, **kwargs), MainTaskCfg)
 
 
 async def get_run_mainTaskCfg_async(id: str, *args, **kwargs) -> MainTaskCfg:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_MAIN_TASK_CFG(id), *args, **kwargs), MainTaskCfg)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_MAIN_TASK_CFG(id), *args, is_text=None, **kwargs), MainTaskCfg)
 
 
 def get_run_mainPipelineCfg(id: str, *args, **kwargs) -> MainPipelineCfg:
-    return model_from_json(send_to_core_get(TEMP_RUN_MAIN_PIPELINE_CFG(id), *args, **kwargs), MainPipelineCfg)
+    return model_from_json(send_to_core_get(TEMP_RUN_MAIN_PIPELINE_CFG(id), *args, is_text=None, **kwargs), MainPipelineCfg)
 
 
 async def get_run_mainPipelineCfg_async(id: str, *args, **kwargs) -> MainPipelineCfg:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_MAIN_PIPELINE_CFG(id), *args, **kwargs), MainPipelineCfg)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_MAIN_PIPELINE_CFG(id), *args, is_text=None, **kwargs), MainPipelineCfg)
 
 
 def get_run_operationsIds(task_id: str, cfg_id: Optional[str]=None, all: bool = False, *args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(TEMP_RUN_OPERATIONS_IDS(task_id, cfg_id, all), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(TEMP_RUN_OPERATIONS_IDS(task_id, cfg_id, all), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_run_operationsIds_async(task_id: str, cfg_id: Optional[str]=None, all: bool = False, *args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_OPERATIONS_IDS(task_id, cfg_id, all), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_OPERATIONS_IDS(task_id, cfg_id, all), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_run_statuses(id: str, *args, **kwargs) -> Statuses:
-    return model_from_json(send_to_core_get(TEMP_RUN_STATUSES(id), *args, **kwargs), Statuses)
+    return model_from_json(send_to_core_get(TEMP_RUN_STATUSES(id), *args, is_text=None, **kwargs), Statuses)
 
 
 async def get_run_statuses_async(id: str, *args, **kwargs) -> Statuses:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_STATUSES(id), *args, **kwargs), Statuses)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_STATUSES(id), *args, is_text=None, **kwargs), Statuses)
 
 
 def get_run_status(id: str, run_id: str, *args, **kwargs) -> str:
@@ -1243,22 +1343,22 @@ async def get_run_status_async(id: str, run_id: str, *args, **kwargs) -> str:
 
 
 def get_operation_run_info(id: str, run_id: Optional[str], logs: bool, *args, **kwargs) -> RunInfo:
-    return model_from_json(send_to_core_get(TEMP_RUN_OPERATION_RUN_INFO(id, run_id, logs), *args, **kwargs), RunInfo)
+    return model_from_json(send_to_core_get(TEMP_RUN_OPERATION_RUN_INFO(id, run_id, logs), *args, is_text=None, **kwargs), RunInfo)
 
 
 async def get_operation_run_info_async(id: str, run_id: Optional[str], logs: bool, *args, **kwargs) -> RunInfo:
-    return model_from_json(await send_to_core_get_async(TEMP_RUN_OPERATION_RUN_INFO(id, run_id, logs), *args, **kwargs), RunInfo)
+    return model_from_json(await send_to_core_get_async(TEMP_RUN_OPERATION_RUN_INFO(id, run_id, logs), *args, is_text=None, **kwargs), RunInfo)
 
 
 # AdminController
 
 
 def get_admin_runs(*args, **kwargs) -> AdminRunsInfo:
-    return model_from_json(send_to_core_get(ADMIN_RUNS, *args, **kwargs), AdminRunsInfo)
+    return model_from_json(send_to_core_get(ADMIN_RUNS, *args, is_text=None, **kwargs), AdminRunsInfo)
 
 
 async def get_admin_runs_async(*args, **kwargs) -> AdminRunsInfo:
-    return model_from_json(await send_to_core_get_async(ADMIN_RUNS, *args, **kwargs), AdminRunsInfo)
+    return model_from_json(await send_to_core_get_async(ADMIN_RUNS, *args, is_text=None, **kwargs), AdminRunsInfo)
 
 
 def get_admin_runs_info(data: AdminRunInfoReq, *args, **kwargs) -> Alias.Json:
@@ -1372,25 +1472,37 @@ async def get_app_info_by_real_id_async(id: str, parse: bool, *args, **kwargs) -
 
 
 def get_image_info(data: JsonImage, parse: bool, *args, **kwargs) -> Union[Alias.Json, AppFunctionsInfo]:
-    res = send_to_core_modify(MANAGER_IMAGE_INFO, data, with_auth=False, with_show=False, show_func = show_fail_app_info, *args, **kwargs)
+    key, ttl, entry = __image_info_cache_lookup(data, kwargs.get("conn_url"))
+    if entry is not None and entry.fresh:
+        res = entry.content.decode("utf-8")
+    else:
+        res = send_to_core_modify(MANAGER_IMAGE_INFO, data, with_auth=False, with_show=False, show_func = show_fail_app_info, *args, **kwargs)
+        if key is not None:
+            Config.CACHE.put(key, res.encode("utf-8"), "utf-8", None, ttl)
     if parse:
         res = model_from_json(res, AppFunctionsInfo)
     return res
 
 
 async def get_image_info_async(data: JsonImage, parse: bool, *args, **kwargs) -> Union[Alias.Json, AppFunctionsInfo]:
-    res = await send_to_core_modify_async(MANAGER_IMAGE_INFO, data, with_auth=False, with_show=False, show_func = show_fail_app_info, *args, **kwargs)
+    key, ttl, entry = __image_info_cache_lookup(data, kwargs.get("conn_url"))
+    if entry is not None and entry.fresh:
+        res = entry.content.decode("utf-8")
+    else:
+        res = await send_to_core_modify_async(MANAGER_IMAGE_INFO, data, with_auth=False, with_show=False, show_func = show_fail_app_info, *args, **kwargs)
+        if key is not None:
+            Config.CACHE.put(key, res.encode("utf-8"), "utf-8", None, ttl)
     if parse:
         res = model_from_json(res, AppFunctionsInfo)
     return res
 
 
 def get_task_schedules(*args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(MANAGER_TASK_SCHEDULES, *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(MANAGER_TASK_SCHEDULES, *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_task_schedules_async(*args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(MANAGER_TASK_SCHEDULES, *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(MANAGER_TASK_SCHEDULES, *args, is_text=None, **kwargs), ResultIds)
 
 
 def post_task_schedules(data: Operation, with_show: bool, *args, **kwargs) -> Schedules:
@@ -1409,9 +1521,9 @@ async def post_task_schedules_async(data: Operation, with_show: bool, *args, **k
 
 def post_manager_task(data: MainTask, with_show: bool, long: bool, long_timeout: int, wait: bool, auth: Optional[AUTH], conn_url: Optional[str]=None, *args, **kwargs) -> Union[Alias.Id, AppLogs]:
     check_profile_mode(data.profileMode)
-    res = send_to_core_modify(MANAGER_TASK(wait and not long), data, with_show=with_show, show_func=show_logs_func, auth=auth, conn_url=conn_url, *args, **kwargs)
+    res = send_to_core_modify(MANAGER_TASK(wait and not long), data, with_show=with_show, show_func=show_logs_func, policy=long_wait_policy() if wait and not long else None, auth=auth, conn_url=conn_url, *args, **kwargs)
     if wait and long:
-        res = asyncio.run(__get_result(res, timeout=long_timeout, auth=auth))
+        res = background_loop.run(__get_result(res, timeout=long_timeout, auth=auth, conn_url=conn_url))
     if not wait:
         return res
     return AppLogs.model_validate_json(res)
@@ -1419,9 +1531,9 @@ def post_manager_task(data: MainTask, with_show: bool, long: bool, long_timeout:
 
 async def post_manager_task_async(data: MainTask, with_show: bool, long: bool, long_timeout: int, wait: bool, auth: Optional[AUTH], conn_url: Optional[str]=None, *args, **kwargs) -> Union[Alias.Id, AppLogs]:
     check_profile_mode(data.profileMode)
-    res = await send_to_core_modify_async(MANAGER_TASK(wait and not long), data, with_show=with_show, show_func=show_logs_func, auth=auth, conn_url=conn_url, *args, **kwargs)
+    res = await send_to_core_modify_async(MANAGER_TASK(wait and not long), data, with_show=with_show, show_func=show_logs_func, policy=long_wait_policy() if wait and not long else None, auth=auth, conn_url=conn_url, *args, **kwargs)
     if wait and long:
-        res = await __get_result(res, timeout=long_timeout, auth=auth)
+        res = await __get_result(res, timeout=long_timeout, auth=auth, conn_url=conn_url)
     if not wait:
         return res
     return AppLogs.model_validate_json(res)
@@ -1429,9 +1541,9 @@ async def post_manager_task_async(data: MainTask, with_show: bool, long: bool, l
 
 def post_manager_task_run(data: RunTask, with_show: bool, long: bool, long_timeout: int, wait: bool, auth: Optional[AUTH], conn_url: Optional[str]=None, *args, **kwargs) -> Union[Alias.Id, AppLogs]:
     check_profile_mode(data.profileMode)
-    res = send_to_core_modify(MANAGER_TASK_RUN(wait and not long), data, with_show=with_show, show_func=show_logs_func, auth=auth, conn_url=conn_url, *args, **kwargs)
+    res = send_to_core_modify(MANAGER_TASK_RUN(wait and not long), data, with_show=with_show, show_func=show_logs_func, policy=long_wait_policy() if wait and not long else None, auth=auth, conn_url=conn_url, *args, **kwargs)
     if wait and long:
-        res = asyncio.run(__get_result(res, timeout=long_timeout, auth=auth))
+        res = background_loop.run(__get_result(res, timeout=long_timeout, auth=auth, conn_url=conn_url))
     if not wait:
         return res
     return AppLogs.model_validate_json(res)
@@ -1439,9 +1551,9 @@ def post_manager_task_run(data: RunTask, with_show: bool, long: bool, long_timeo
 
 async def post_manager_task_run_async(data: RunTask, with_show: bool, long: bool, long_timeout: int, wait: bool, auth: Optional[AUTH], conn_url: Optional[str]=None, *args, **kwargs) -> Union[Alias.Id, AppLogs]:
     check_profile_mode(data.profileMode)
-    res = await send_to_core_modify_async(MANAGER_TASK_RUN(wait and not long), data, with_show=with_show, show_func=show_logs_func, auth=auth, conn_url=conn_url, *args, **kwargs)
+    res = await send_to_core_modify_async(MANAGER_TASK_RUN(wait and not long), data, with_show=with_show, show_func=show_logs_func, policy=long_wait_policy() if wait and not long else None, auth=auth, conn_url=conn_url, *args, **kwargs)
     if wait and long:
-        res = await __get_result(res, timeout=long_timeout, auth=auth)
+        res = await __get_result(res, timeout=long_timeout, auth=auth, conn_url=conn_url)
     if not wait:
         return res
     return AppLogs.model_validate_json(res)
@@ -1449,11 +1561,11 @@ async def post_manager_task_run_async(data: RunTask, with_show: bool, long: bool
 
 def post_manager_pipeline(data: MainPipeline, with_show: bool, long: bool, long_timeout: int, return_response: bool, wait: bool, auth: Optional[AUTH], conn_url: Optional[str]=None, *args, **kwargs) -> Union[Alias.Id, AppLogs]:
     check_profile_mode(data.profileMode)
-    res = send_to_core_modify(MANAGER_PIPELINE(wait and not long), data, with_show=with_show, show_func=show_logs_func, return_response=return_response, auth=auth, conn_url=conn_url, *args, **kwargs)
+    res = send_to_core_modify(MANAGER_PIPELINE(wait and not long), data, with_show=with_show, show_func=show_logs_func, policy=long_wait_policy() if wait and not long else None, return_response=return_response, auth=auth, conn_url=conn_url, *args, **kwargs)
     if return_response:
         return res
     if wait and long:
-        res = asyncio.run(__get_result(res, timeout=long_timeout, auth=auth))
+        res = background_loop.run(__get_result(res, timeout=long_timeout, auth=auth, conn_url=conn_url))
     if not wait:
         return res
     return AppLogs.model_validate_json(res)
@@ -1461,11 +1573,11 @@ def post_manager_pipeline(data: MainPipeline, with_show: bool, long: bool, long_
 
 async def post_manager_pipeline_async(data: MainPipeline, with_show: bool, long: bool, long_timeout: int, return_response: bool, wait: bool, auth: Optional[AUTH], conn_url: Optional[str]=None, *args, **kwargs) -> Union[Alias.Id, AppLogs]:
     check_profile_mode(data.profileMode)
-    res = await send_to_core_modify_async(MANAGER_PIPELINE(wait and not long), data, with_show=with_show, show_func=show_logs_func, return_response=return_response, auth=auth, conn_url=conn_url, *args, **kwargs)
+    res = await send_to_core_modify_async(MANAGER_PIPELINE(wait and not long), data, with_show=with_show, show_func=show_logs_func, policy=long_wait_policy() if wait and not long else None, return_response=return_response, auth=auth, conn_url=conn_url, *args, **kwargs)
     if return_response:
         return res
     if wait and long:
-        res = await __get_result(res, timeout=long_timeout, auth=auth)
+        res = await __get_result(res, timeout=long_timeout, auth=auth, conn_url=conn_url)
     if not wait:
         return res
     return AppLogs.model_validate_json(res)
@@ -1546,11 +1658,11 @@ async def post_manager_app_pause_async(data: AppManage, wait: bool, *args, **kwa
 
 
 def get_limits(*args, **kwargs) -> UserLimits:
-    return model_from_json(send_to_core_get(LIMITS(True), *args, **kwargs), UserLimits)
+    return model_from_json(send_to_core_get(LIMITS(True), *args, is_text=None, **kwargs), UserLimits)
 
 
 async def get_limits_async(*args, **kwargs) -> UserLimits:
-    return model_from_json(await send_to_core_get_async(LIMITS(True), *args, **kwargs), UserLimits)
+    return model_from_json(await send_to_core_get_async(LIMITS(True), *args, is_text=None, **kwargs), UserLimits)
 
 
 def post_limits(data: Limits, wait: bool, *args, **kwargs) -> Alias.Info:
@@ -1586,27 +1698,27 @@ async def post_handler_url_async(url: Optional[str], wait: bool, *args, **kwargs
 
 
 def get_analytics(*args, **kwargs) -> UserAnalyticsBatch:
-    return model_from_json(send_to_core_get(ANALYTICS(None), *args, **kwargs), UserAnalyticsBatch)
+    return model_from_json(send_to_core_get(ANALYTICS(None), *args, is_text=None, **kwargs), UserAnalyticsBatch)
 
 
 async def get_analytics_async(*args, **kwargs) -> UserAnalyticsBatch:
-    return model_from_json(await send_to_core_get_async(ANALYTICS(None), *args, **kwargs), UserAnalyticsBatch)
+    return model_from_json(await send_to_core_get_async(ANALYTICS(None), *args, is_text=None, **kwargs), UserAnalyticsBatch)
 
 
 def get_analytics_by_id(id: str, *args, **kwargs) -> UserAnalytics:
-    return model_from_json(send_to_core_get(ANALYTICS_ID(id, None), *args, **kwargs), UserAnalytics)
+    return model_from_json(send_to_core_get(ANALYTICS_ID(id, None), *args, is_text=None, **kwargs), UserAnalytics)
 
 
 async def get_analytics_by_id_async(id: str, *args, **kwargs) -> UserAnalytics:
-    return model_from_json(await send_to_core_get_async(ANALYTICS_ID(id, None), *args, **kwargs), UserAnalytics)
+    return model_from_json(await send_to_core_get_async(ANALYTICS_ID(id, None), *args, is_text=None, **kwargs), UserAnalytics)
 
 
 def get_analytics_by_name(name: str, *args, **kwargs) -> UserAnalyticsBatch:
-    return model_from_json(send_to_core_get(ANALYTICS_NAME(name, None), *args, **kwargs), UserAnalyticsBatch)
+    return model_from_json(send_to_core_get(ANALYTICS_NAME(name, None), *args, is_text=None, **kwargs), UserAnalyticsBatch)
 
 
 async def get_analytics_by_name_async(name: str, *args, **kwargs) -> UserAnalyticsBatch:
-    return model_from_json(await send_to_core_get_async(ANALYTICS_NAME(name, None), *args, **kwargs), UserAnalyticsBatch)
+    return model_from_json(await send_to_core_get_async(ANALYTICS_NAME(name, None), *args, is_text=None, **kwargs), UserAnalyticsBatch)
 
 
 def post_analytics(data: UserAnalytics, wait: bool, *args, **kwargs) -> Alias.Id:
@@ -1626,35 +1738,35 @@ async def post_analytics_many_async(data: UserAnalyticsBatch, wait: bool, *args,
 
 
 def get_runsInfo_last_operation_ids(count: int, *args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(RUNS_INFO_LAST(count), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(RUNS_INFO_LAST(count), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_runsInfo_last_operation_ids_async(count: int, *args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(RUNS_INFO_LAST(count), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(RUNS_INFO_LAST(count), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_runsInfo_last_failed_operation_ids(count: int, *args, **kwargs) -> ResultIds:
-    return model_from_json(send_to_core_get(RUNS_INFO_LAST_FAILED(count), *args, **kwargs), ResultIds)
+    return model_from_json(send_to_core_get(RUNS_INFO_LAST_FAILED(count), *args, is_text=None, **kwargs), ResultIds)
 
 
 async def get_runsInfo_last_failed_operation_ids_async(count: int, *args, **kwargs) -> ResultIds:
-    return model_from_json(await send_to_core_get_async(RUNS_INFO_LAST_FAILED(count), *args, **kwargs), ResultIds)
+    return model_from_json(await send_to_core_get_async(RUNS_INFO_LAST_FAILED(count), *args, is_text=None, **kwargs), ResultIds)
 
 
 def get_ws_apps(only_active: bool = False, full: bool = False, *args, **kwargs) -> Union[ResultIds, WSApps]:
-    return model_from_json(send_to_core_get(WS_APPS(only_active, full), *args, **kwargs), WSApps if full else ResultIds)
+    return model_from_json(send_to_core_get(WS_APPS(only_active, full), *args, is_text=None, **kwargs), WSApps if full else ResultIds)
 
 
 async def get_ws_apps_async(only_active: bool = False, full: bool = False, *args, **kwargs) -> Union[ResultIds, WSApps]:
-    return model_from_json(await send_to_core_get_async(WS_APPS(only_active, full), *args, **kwargs), WSApps if full else ResultIds)
+    return model_from_json(await send_to_core_get_async(WS_APPS(only_active, full), *args, is_text=None, **kwargs), WSApps if full else ResultIds)
 
 
 def get_ws_apps_id(id: str, *args, **kwargs) -> WSApp:
-    return model_from_json(send_to_core_get(WS_APPS_ID(id, None), *args, **kwargs), WSApp)
+    return model_from_json(send_to_core_get(WS_APPS_ID(id, None), *args, is_text=None, **kwargs), WSApp)
 
 
 async def get_ws_apps_id_async(id: str, *args, **kwargs) -> WSApp:
-    return model_from_json(await send_to_core_get_async(WS_APPS_ID(id, None), *args, **kwargs), WSApp)
+    return model_from_json(await send_to_core_get_async(WS_APPS_ID(id, None), *args, is_text=None, **kwargs), WSApp)
 
 
 def post_ws_apps(wait: bool, *args, **kwargs) -> WSApp:
@@ -1682,27 +1794,27 @@ async def delete_ws_apps_async(only_not_active: bool, wait: bool, *args, **kwarg
 
 
 def get_mcp_tools(*args, **kwargs) -> List[MCPTool]:
-    return model_from_json(send_to_core_get(MCP_TOOLS_ALL(None), *args, **kwargs), MCPTool, is_list=True)
+    return model_from_json(send_to_core_get(MCP_TOOLS_ALL(None), *args, is_text=None, **kwargs), MCPTool, is_list=True)
 
 
 async def get_mcp_tools_async(*args, **kwargs) -> List[MCPTool]:
-    return model_from_json(await send_to_core_get_async(MCP_TOOLS_ALL(None), *args, **kwargs), MCPTool, is_list=True)
+    return model_from_json(await send_to_core_get_async(MCP_TOOLS_ALL(None), *args, is_text=None, **kwargs), MCPTool, is_list=True)
 
 
 def get_mcp_tools_list(*args, **kwargs) -> List[MCPToolSimple]:
-    return model_from_json(send_to_core_get(MCP_TOOLS_LIST, *args, **kwargs), MCPToolSimple, is_list=True)
+    return model_from_json(send_to_core_get(MCP_TOOLS_LIST, *args, is_text=None, **kwargs), MCPToolSimple, is_list=True)
 
 
 async def get_mcp_tools_list_async(*args, **kwargs) -> List[MCPToolSimple]:
-    return model_from_json(await send_to_core_get_async(MCP_TOOLS_LIST, *args, **kwargs), MCPToolSimple, is_list=True)
+    return model_from_json(await send_to_core_get_async(MCP_TOOLS_LIST, *args, is_text=None, **kwargs), MCPToolSimple, is_list=True)
 
 
 def get_mcp_tool_id_name(id: Optional[str], name: Optional[str], *args, **kwargs) -> MCPTool:
-    return model_from_json(send_to_core_get(MCP_TOOLS(id, name, None), *args, **kwargs), MCPTool)
+    return model_from_json(send_to_core_get(MCP_TOOLS(id, name, None), *args, is_text=None, **kwargs), MCPTool)
 
 
 async def get_mcp_tool_id_name_async(id: Optional[str], name: Optional[str], *args, **kwargs) -> MCPTool:
-    return model_from_json(await send_to_core_get_async(MCP_TOOLS(id, name, None), *args, **kwargs), MCPTool)
+    return model_from_json(await send_to_core_get_async(MCP_TOOLS(id, name, None), *args, is_text=None, **kwargs), MCPTool)
 
 
 def post_mcp_tool(data, wait: bool, *args, **kwargs) -> Alias.Id:
@@ -1792,36 +1904,94 @@ async def post_batch_async(data: BatchOperations, *args, **kwargs) -> BatchRespo
 ##################################
 
 
-async def __get_result(id: str, is_text: bool = True, check_time: float = LONG_SLEEP_TIME, timeout: int = WAIT_RESULT_TIMEOUT, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> str:      # FIXME
+def __cache_lookup(host: str, auth: Optional[AUTH], path: str) -> Tuple[Optional[Tuple], Optional[float], Optional[CacheEntry]]:
+    """(key, ttl, mb stale entry) if `path` cached by `Config.CACHE`"""
+    cache = Config.CACHE
+    ttl = None if cache is None else cache.ttl(path)
+    if ttl is None:
+        return None, None, None
+    key = (host, None if auth is None else tuple(auth), path)
+    return key, ttl, cache.get(key)
+
+
+def __image_info_cache_lookup(data: JsonImage, conn_url: Optional[str]) -> Tuple[Optional[Tuple], Optional[float], Optional[CacheEntry]]:
+    """image info is immutable only for digest-pinned images"""
+    if Config.CACHE is None or "@sha256:" not in data.ref:
+        return None, None, None
+    host = Config.HOST_PORT if conn_url is None else conn_url
+    key = hashlib.sha256(current_codec().encode_model(data)).hexdigest()    # with credentials
+    return __cache_lookup(host, None, f"{MANAGER_IMAGE_INFO}?{key}")
+
+
+def __cached_body(entry: CacheEntry, is_text: Optional[bool]) -> Union[str, bytes, Any]:
+    if is_text is True:
+        return entry.content.decode(entry.encoding or "utf-8")
+    elif is_text is False:
+        return current_codec().loads(entry.content)
+    else:
+        return entry.content
+
+
+def __encode(path: str, operation: BaseModel) -> bytes:
+    if not Config.METRICS_LISTENERS:
+        return current_codec().encode_model(operation)
+    start = time.perf_counter()
+    data = current_codec().encode_model(operation)
+    emit(CodecEvent(route_name(path), "serialize", time.perf_counter() - start, len(data)))
+    return data
+
+
+def __cache_invalidate(path: str) -> None:
+    if Config.CACHE is not None:
+        Config.CACHE.invalidate(path)
+
+
+def __collection_docs_decode(docs: List[Dict[str, Any]], rows: bool) -> List[Union[ResultDoc, Dict[str, Any]]]:
+    if rows:
+        loads = current_codec().loads
+        return [loads(doc["data"]) for doc in docs]
+    return current_codec().decode_model(docs, ResultDoc, is_list=True)
+
+
+def __collection_docs(chunks: Iterable[bytes], rows: bool) -> Iterator[Union[ResultDoc, Dict[str, Any]]]:
+    """decode `ResultCollection` body by chunks, yield docs (or its data if `rows`) as soon as they are received"""
+    reader = JsonArrayReader("docs")
+    for chunk in chunks:
+        yield from __collection_docs_decode(reader.feed(chunk), rows)
+    yield from __collection_docs_decode(reader.close(), rows)
+
+
+async def __collection_docs_async(chunks: AsyncIterable[bytes], rows: bool) -> AsyncIterable[Union[ResultDoc, Dict[str, Any]]]:
+    reader = JsonArrayReader("docs")
+    async for chunk in chunks:
+        for doc in __collection_docs_decode(reader.feed(chunk), rows):
+            yield doc
+    for doc in __collection_docs_decode(reader.close(), rows):
+        yield doc
+
+
+async def __get_result(id: str, is_text: bool = True, timeout: Optional[float] = WAIT_RESULT_TIMEOUT, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, policy: Optional[WaitPolicy]=None) -> str:
+    """wait operation result by `WaitPolicy`"""
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD)
-    auth = aiohttp.BasicAuth(login=auth[0], password=auth[1], encoding='utf-8')
 
-    timeout_deadline = None if timeout is None else datetime.datetime.now() + datetime.timedelta(0, timeout)
-    while True:
+    async def poll() -> Optional[str]:
         try:
-            async with aiohttp.ClientSession(auth=auth, connector=aiohttp.TCPConnector(verify_ssl=False), timeout=AIOHTTP_TIMEOUT_MINI) as session:
-                while True:
-                    async with session.get(f"{host}{OPERATION_RESULTS_ID(id, None)}", headers=HEADERS) as response:
-                        if response.ok:
-                            if is_text:
-                                result = await response.text()
-                            else:
-                                result = await response.json()
-                            return result
-                        else:
-                            if timeout_deadline is not None:
-                                now = datetime.datetime.now()
-                                if now >= timeout_deadline:
-                                    raise Exception("wait get result timeout")
-                            await asyncio.sleep(check_time)
+            response = await request_async(async_sessions.get(host, auth), "GET", f"{host}{OPERATION_RESULTS_ID(id, None)}", headers=HEADERS, timeout=const.AIOHTTP_TIMEOUT_MINI)
         except exceptions.TimeoutError:
-            pass    # recreate ClientSession
+            return None     # repeat request
+        status = __result_status(response.status)
+        if status == "PENDING":
+            return None
+        if status == "FAILED":
+            await __async_check_response(response, path=OPERATION_RESULTS_ID(id, None))
+        return await response.text() if is_text else await response.json()
+    return await wait_for(poll, timeout=timeout, policy=policy, operation_id=id)
 
 
-async def __async_check_response(response: aiohttp.ClientResponse, show_func: Optional[Callable]=None, path: Optional[str] = None):  # noqa: ANN202
+async def __async_check_response(response: "aiohttp.ClientResponse", show_func: Optional[Callable]=None, path: Optional[str] = None):  # noqa: ANN202
     if not response.ok:
         text = await response.text()
         if show_func is None:
@@ -1855,12 +2025,25 @@ def __check_response(path: str, response: Response, show_func: Optional[Callable
     response.raise_for_status()
 
 
-def send_to_core_get(path: str, with_auth=True, show_func: Optional[Callable]=None, is_text=False, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> Optional[Union[str, bytes]]:
+def send_to_core_get(path: str, with_auth=True, show_func: Optional[Callable]=None, is_text=False, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, policy: Optional[RequestPolicy]=None) -> Optional[Union[str, bytes]]:
+    if Config.SYNC_VIA_LOOP:
+        return background_loop.run(send_to_core_get_async(path, with_auth=with_auth, show_func=show_func, is_text=is_text, auth=auth, conn_url=conn_url, policy=policy))
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None or not with_auth:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD) if with_auth else None
-    response = requests.get(f"{host}{path}", headers=HEADERS, auth=auth)
+    key, ttl, entry = __cache_lookup(host, auth, path)
+    if entry is not None and entry.fresh:
+        return __cached_body(entry, is_text)
+    headers = HEADERS if entry is None or entry.etag is None else {**HEADERS, "If-None-Match": entry.etag}
+    get = lambda: request(sync_sessions.get(host, auth), "GET", f"{host}{path}", headers=headers, policy=policy)
+    response = sync_flights.do((host, auth, path), get) if Config.SINGLE_FLIGHT else get()
+    if key is not None:
+        if response.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+            Config.CACHE.revalidated(key, entry, ttl)
+            return __cached_body(entry, is_text)
+        if response.status_code == HTTPStatus.OK:
+            Config.CACHE.put(key, response.content, response.encoding, response.headers.get("ETag"), ttl)
     __check_response(f"{host}{path}", response, show_func)
     if response.status_code == HTTPStatus.NO_CONTENT:
         return None
@@ -1872,39 +2055,84 @@ def send_to_core_get(path: str, with_auth=True, show_func: Optional[Callable]=No
         return response.content
 
 
-# FIXME copypaste
-async def send_to_core_get_async(path: str, with_auth=True, show_func: Optional[Callable]=None, is_text=False, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, async_session = None) -> Optional[Union[str, bytes]]:
+def send_to_core_get_stream(path: str, with_auth=True, show_func: Optional[Callable]=None, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, chunk_size: Optional[int]=None, policy: Optional[RequestPolicy]=None) -> Iterable[bytes]:
+    """body by chunks of `chunk_size` bytes (`Config.STREAM_CHUNK_SIZE` by default), request sent on iteration"""
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None or not with_auth:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD) if with_auth else None
-    if auth is not None:
-        auth = aiohttp.BasicAuth(login=auth[0], password=auth[1], encoding='utf-8')
-    async with async_session or aiohttp.ClientSession(auth=auth, connector=aiohttp.TCPConnector(verify_ssl=False), timeout=aiohttp.ClientTimeout(total=None)) as session:
-        async with session.get(f"{host}{path}", headers=HEADERS) as response:
+
+    def stream_generator() -> Iterator[bytes]:
+        with request(sync_sessions.get(host, auth), "GET", f"{host}{path}", headers=HEADERS, stream=True, policy=policy) as response:
+            __check_response(f"{host}{path}", response, show_func)
+            if response.status_code == HTTPStatus.NO_CONTENT:
+                return
+            for chunk in response.iter_content(chunk_size=chunk_size or Config.STREAM_CHUNK_SIZE):
+                if chunk:
+                    yield chunk
+    return stream_generator()
+
+
+async def send_to_core_get_stream_async(path: str, with_auth=True, show_func: Optional[Callable]=None, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, async_session = None, chunk_size: Optional[int]=None, policy: Optional[RequestPolicy]=None) -> AsyncIterable[bytes]:
+    host = Config.HOST_PORT if conn_url is None else conn_url
+    assert host is not None, "host port not set"
+    if auth is None or not with_auth:
+        auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD) if with_auth else None
+
+    async def stream_generator() -> AsyncIterable[bytes]:
+        session = async_session or async_sessions.get(host, auth)
+        async with await request_async(session, "GET", f"{host}{path}", headers=HEADERS, stream=True, policy=policy) as response:
             await __async_check_response(response, show_func, f"{host}{path}")
             if response.status == HTTPStatus.NO_CONTENT:
-                return None
-            if is_text is True:
-                return await response.text()
-            elif is_text is False:
-                return await response.json()
-            else:
-                return await response.read()
+                return
+            async for chunk in response.content.iter_chunked(chunk_size or Config.STREAM_CHUNK_SIZE):
+                yield chunk
+    return stream_generator()
+
+
+# FIXME copypaste
+async def send_to_core_get_async(path: str, with_auth=True, show_func: Optional[Callable]=None, is_text=False, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, async_session = None, policy: Optional[RequestPolicy]=None) -> Optional[Union[str, bytes]]:
+    host = Config.HOST_PORT if conn_url is None else conn_url
+    assert host is not None, "host port not set"
+    if auth is None or not with_auth:
+        auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD) if with_auth else None
+    key, ttl, entry = __cache_lookup(host, auth, path)
+    if entry is not None and entry.fresh:
+        return __cached_body(entry, is_text)
+    headers = HEADERS if entry is None or entry.etag is None else {**HEADERS, "If-None-Match": entry.etag}
+    session = async_session or async_sessions.get(host, auth)
+    get = lambda: request_async(session, "GET", f"{host}{path}", headers=headers, policy=policy)
+    response = await (async_flights.do((host, auth, path), get) if Config.SINGLE_FLIGHT else get())
+    if key is not None:
+        if response.status == HTTPStatus.NOT_MODIFIED and entry is not None:
+            Config.CACHE.revalidated(key, entry, ttl)
+            return __cached_body(entry, is_text)
+        if response.status == HTTPStatus.OK:
+            Config.CACHE.put(key, await response.read(), response.get_encoding(), response.headers.get("ETag"), ttl)
+    await __async_check_response(response, show_func, f"{host}{path}")
+    if response.status == HTTPStatus.NO_CONTENT:
+        return None
+    if is_text is True:
+        return await response.text()
+    elif is_text is False:
+        return await response.json()
+    else:
+        return await response.read()
 
 
-def send_to_core_modify(path: str, operation: Optional[Any] = None, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, return_response: bool = False, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> str:  # noqa: ANN401
+def send_to_core_modify(path: str, operation: Optional[Any] = None, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, return_response: bool = False, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, policy: Optional[RequestPolicy]=None) -> str:  # noqa: ANN401
     """modify: post by default, else - delete"""
+    if Config.SYNC_VIA_LOOP and not return_response:    # response is returned as `requests.Response`
+        return background_loop.run(send_to_core_modify_async(path, operation, with_auth=with_auth, with_show=with_show, show_func=show_func, is_post=is_post, auth=auth, conn_url=conn_url, policy=policy))
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD)
     if operation is not None:
-        operation = json.dumps(operation.model_dump())
-    if is_post:
-        response = requests.post(f"{host}{path}", data=operation, headers=HEADERS, auth=auth if with_auth else None)
-    else:   # delete
-        response = requests.delete(f"{host}{path}", data=operation, headers=HEADERS, auth=auth if with_auth else None)
+        operation = __encode(path, operation)
+    session = sync_sessions.get(host, auth if with_auth else None)
+    response = request(session, "POST" if is_post else "DELETE", f"{host}{path}", data=operation, headers=HEADERS, policy=policy)
+    __cache_invalidate(path)
     if return_response:
         return response
     __check_response(f"{host}{path}", response, show_func=show_func)
@@ -1921,28 +2149,24 @@ def send_to_core_modify(path: str, operation: Optional[Any] = None, with_auth: b
     return result
 
 
-async def send_to_core_modify_async(path: str, operation: Optional[Any] = None, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, return_response: bool = False, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, async_session=None) -> str:  # noqa: ANN401
+async def send_to_core_modify_async(path: str, operation: Optional[Any] = None, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, return_response: bool = False, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, async_session=None, policy: Optional[RequestPolicy]=None) -> str:  # noqa: ANN401
     """modify: post by default, else - delete"""
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD)
-    auth = aiohttp.BasicAuth(login=auth[0], password=auth[1], encoding='utf-8')
     if operation is not None:
-        operation = json.dumps(operation.model_dump())
+        operation = __encode(path, operation)
 
-    async with async_session or aiohttp.ClientSession(auth=auth if with_auth else None, connector=aiohttp.TCPConnector(verify_ssl=False), timeout=aiohttp.ClientTimeout(total=None)) as session:
-        if is_post:
-            response_cm = session.post(f"{host}{path}", data=operation, headers=HEADERS)
-        else:
-            response_cm = session.delete(f"{host}{path}", data=operation, headers=HEADERS)
-        async with response_cm as response:
-            if return_response:
-                return response
-            await __async_check_response(response, show_func, f"{host}{path}")
-            if response.status == HTTPStatus.NO_CONTENT:
-                return ""
-            result = await response.text()
+    session = async_session or async_sessions.get(host, auth if with_auth else None)
+    response = await request_async(session, "POST" if is_post else "DELETE", f"{host}{path}", data=operation, headers=HEADERS, policy=policy)
+    __cache_invalidate(path)
+    if return_response:
+        return response
+    await __async_check_response(response, show_func, f"{host}{path}")
+    if response.status == HTTPStatus.NO_CONTENT:
+        return ""
+    result = await response.text()
     if with_show is None:
         with_show = Config.VERBOSE
     if with_show:
@@ -1953,16 +2177,17 @@ async def send_to_core_modify_async(path: str, operation: Optional[Any] = None,
     return result
 
 
-def send_to_core_modify_raw(path: str, data: bytes, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> str:  # noqa: ANN401
+def send_to_core_modify_raw(path: str, data: bytes, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, policy: Optional[RequestPolicy]=None) -> str:  # noqa: ANN401
     """modify: post by default, else - delete"""
+    if Config.SYNC_VIA_LOOP:
+        return background_loop.run(send_to_core_modify_raw_async(path, data, with_auth=with_auth, with_show=with_show, show_func=show_func, is_post=is_post, auth=auth, conn_url=conn_url, policy=policy))
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD)
-    if is_post:
-        response = requests.post(f"{host}{path}", data=data, headers=HEADERS_RAW, auth=auth if with_auth else None)
-    else:   # delete
-        response = requests.delete(f"{host}{path}", data=data, headers=HEADERS_RAW, auth=auth if with_auth else None)
+    session = sync_sessions.get(host, auth if with_auth else None)
+    response = request(session, "POST" if is_post else "DELETE", f"{host}{path}", data=data, headers=HEADERS_RAW, policy=policy)
+    __cache_invalidate(path)
     __check_response(f"{host}{path}", response, show_func=show_func)
     if response.status_code == HTTPStatus.NO_CONTENT:
         return ""
@@ -1977,24 +2202,20 @@ def send_to_core_modify_raw(path: str, data: bytes, with_auth: bool=True, with_s
     return result
 
 
-async def send_to_core_modify_raw_async(path: str, data: bytes, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, async_session=None) -> str:  # noqa: ANN401
+async def send_to_core_modify_raw_async(path: str, data: bytes, with_auth: bool=True, with_show: Optional[bool]=None, show_func: Optional[Callable]=None, is_post: bool=True, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, async_session=None, policy: Optional[RequestPolicy]=None) -> str:  # noqa: ANN401
     """modify: post by default, else - delete"""
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD)
-    auth = aiohttp.BasicAuth(login=auth[0], password=auth[1], encoding='utf-8')
 
-    async with async_session or aiohttp.ClientSession(auth=auth if with_auth else None, connector=aiohttp.TCPConnector(verify_ssl=False), timeout=aiohttp.ClientTimeout(total=None)) as session:
-        if is_post:
-            response_cm = session.post(f"{host}{path}", data=data, headers=HEADERS_RAW)
-        else:
-            response_cm = session.delete(f"{host}{path}", data=data, headers=HEADERS_RAW)
-        async with response_cm as response:
-            await __async_check_response(response, show_func, f"{host}{path}")
-            if response.status == HTTPStatus.NO_CONTENT:
-                return ""
-            result = await response.text()
+    session = async_session or async_sessions.get(host, auth if with_auth else None)
+    response = await request_async(session, "POST" if is_post else "DELETE", f"{host}{path}", data=data, headers=HEADERS_RAW, policy=policy)
+    __cache_invalidate(path)
+    await __async_check_response(response, show_func, f"{host}{path}")
+    if response.status == HTTPStatus.NO_CONTENT:
+        return ""
+    result = await response.text()
     if with_show is None:
         with_show = Config.VERBOSE
     if with_show:
@@ -2005,20 +2226,18 @@ async def send_to_core_modify_raw_async(path: str, data: bytes, with_auth: bool=
     return result
 
 
-async def send_to_core_post_async(path: str, operation: Optional[str] = None, with_auth=True, with_show=True, show_func: Optional[Callable]=None, auth: Optional[AUTH]=None, conn_url: Optional[str]=None) -> str:
+async def send_to_core_post_async(path: str, operation: Optional[str] = None, with_auth=True, with_show=True, show_func: Optional[Callable]=None, auth: Optional[AUTH]=None, conn_url: Optional[str]=None, policy: Optional[RequestPolicy]=None) -> str:
     host = Config.HOST_PORT if conn_url is None else conn_url
     assert host is not None, "host port not set"
     if auth is None or not with_auth:
         auth = (Config.CORE_USERNAME, Config.CORE_PASSWORD) if with_auth else None
-    if auth is not None:
-        auth = aiohttp.BasicAuth(login=auth[0], password=auth[1], encoding='utf-8')
     if operation is not None:
-        operation = json.dumps(operation.model_dump())
+        operation = __encode(path, operation)
 
-    async with aiohttp.ClientSession(auth=auth, connector=aiohttp.TCPConnector(verify_ssl=False), timeout=AIOHTTP_TIMEOUT) as session:
-        async with session.post(f"{host}{path}", data=operation, headers=HEADERS) as response:
-            await __async_check_response(response, show_func=show_func)
-            result = await response.text()
+    response = await request_async(async_sessions.get(host, auth), "POST", f"{host}{path}", data=operation, headers=HEADERS, timeout=const.AIOHTTP_TIMEOUT, policy=policy)
+    __cache_invalidate(path)
+    await __async_check_response(response, show_func=show_func)
+    result = await response.text()
     if with_show:
         if show_func is None:
             Config.logger.info(result)
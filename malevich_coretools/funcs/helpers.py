@@ -1,9 +1,26 @@
+import asyncio
+import collections
+import io
+import itertools
 import json
-from typing import Any, Coroutine, Dict, List, Literal, Optional, Union, overload
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
 from uuid import uuid4
 
-import pandas as pd
-
 from malevich_coretools.abstract.abstract import (
     DEFAULT_MSG_URL,
     Alias,
@@ -13,13 +30,16 @@ from malevich_coretools.abstract.abstract import (
     DocsDataCollection,
     EndpointOverride,
     Restrictions,
+    ResultCollection,
     RunSettings,
     ScaleInfo,
+    Scheme,
     TaskComponent,
     TaskPolicy,
     UserConfig,
 )
 from malevich_coretools.batch import Batcher
+from malevich_coretools.funcs.arrow import iter_parquet_dfs
 from malevich_coretools.funcs.checks import check_profile_mode
 from malevich_coretools.funcs.funcs import (
     post_collections_data,
@@ -27,7 +47,13 @@ from malevich_coretools.funcs.funcs import (
     post_collections_data_id,
     post_collections_data_id_async,
 )
+from malevich_coretools.funcs.loop import background_loop
+from malevich_coretools.funcs.upload import UploadPolicy, upload_docs_async
 from malevich_coretools.secondary import Config, to_json
+from malevich_coretools.secondary.codec import current_codec
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 __all__ = ["create_collection_from_file_df", "update_collection_from_file_df", "raw_collection_from_df", "raw_collection_from_file", "create_collection_from_df", "update_collection_from_df", "create_app_settings", "create_user_config", "create_task_component", "create_task_policy", "create_restrictions", "create_run_settings", "create_endpoint_override", "create_cfg_struct"]
 
@@ -39,6 +65,9 @@ def create_collection_from_file_df(
     metadata: Optional[Union[Dict[str, Any], str]],
     *args,
     is_async: Literal[False] = False,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     **kwargs
 ) -> Alias.Id:
     pass
@@ -51,6 +80,9 @@ def create_collection_from_file_df(
     metadata: Optional[Union[Dict[str, Any], str]],
     *args,
     is_async: Literal[True],
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     **kwargs
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
@@ -62,15 +94,21 @@ def create_collection_from_file_df(
     metadata: Optional[Union[Dict[str, Any], str]],
     *args,
     is_async: bool = False,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     **kwargs
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
-    try:
-        data = pd.read_csv(file)
-    except pd.errors.EmptyDataError:
-        data = pd.DataFrame()
+    """collection from csv, jsonl or parquet `file`, see `raw_collection_from_file`; `chunked` - read by chunks and upload them as they are ready, csv chunks parsed in `processes` if set"""
     if name is None:
         name = file
-    return create_collection_from_df(data, name=file, metadata=metadata, *args, is_async=is_async, **kwargs)
+    batcher = kwargs.pop("batcher", None)
+    if chunked is not False:
+        assert batcher is None and Config.BATCHER is None, "chunked upload in batcher is not supported"
+        data = DocsDataCollection(data=[], name=name, metadata=__metadata(metadata))
+        docs = iter_file_docs_async(file, format, processes=processes)
+        return __upload_chunked(docs, lambda docs: post_collections_data_async(data.model_copy(update={"data": docs}), *args, **kwargs), chunked, is_async, **kwargs)
+    return __post_collection(None, raw_collection_from_file(file, name, metadata, format), batcher, is_async, *args, **kwargs)
 
 
 @overload
@@ -81,6 +119,9 @@ def update_collection_from_file_df(
     metadata: Optional[Union[Dict[str, Any], str]],
     *args,
     is_async: Literal[False] = False,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     **kwargs
 ) -> Alias.Id:
     pass
@@ -94,6 +135,9 @@ def update_collection_from_file_df(
     metadata: Optional[Union[Dict[str, Any], str]],
     *args,
     is_async: Literal[True],
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     **kwargs
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
@@ -106,40 +150,215 @@ def update_collection_from_file_df(
     metadata: Optional[Union[Dict[str, Any], str]],
     *args,
     is_async: bool = False,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     **kwargs
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
-    try:
-        data = pd.read_csv(file)
-    except pd.errors.EmptyDataError:
-        data = pd.DataFrame()
+    """update collection `id` from csv, jsonl or parquet `file`, see `create_collection_from_file_df`"""
     if name is None:
         name = file
-    return update_collection_from_df(id, data, name=file, metadata=metadata, *args, is_async=is_async, **kwargs)
-
-
-def raw_collection_from_df(
-    data: pd.DataFrame,
-    name: Optional[str],
-    metadata: Optional[Union[Dict[str, Any], str]],
-) -> DocsDataCollection:
+    batcher = kwargs.pop("batcher", None)
+    if chunked is not False:
+        assert batcher is None and Config.BATCHER is None, "chunked upload in batcher is not supported"
+        data = DocsDataCollection(data=[], name=name, metadata=__metadata(metadata))
+        docs = iter_file_docs_async(file, format, processes=processes)
+        return __upload_chunked(docs, lambda docs: post_collections_data_id_async(id, data.model_copy(update={"data": docs}), *args, **kwargs), chunked, is_async, **kwargs)
+    return __post_collection(id, raw_collection_from_file(file, name, metadata, format), batcher, is_async, *args, **kwargs)
+
+
+def df_to_docs(data: "pd.DataFrame", chunk_size: int = 100_000) -> List[str]:
+    """json doc for each row by pandas vectorized writer (as `row.to_json()`: NaN - null, datetimes - epoch ms, column names - strings, ints of all-numeric rows with floats - floats), by chunks of `chunk_size` rows"""
+    row_dtype = data.iloc[:0].values.dtype    # dtype of `iterrows` rows
+    upcast = row_dtype.kind == "f" and any(dtype != row_dtype for dtype in data.dtypes)
+    docs = []
+    for start in range(0, len(data), chunk_size):
+        chunk = data.iloc[start:start + chunk_size]
+        if upcast:
+            chunk = chunk.astype(row_dtype)
+        docs.extend(chunk.to_json(orient="records", lines=True).rstrip("\n").split("\n"))
+    return docs
+
+
+__SCHEME_DTYPES = {
+    "int": "Int64",
+    "integer": "Int64",
+    "float": "float64",
+    "number": "float64",
+    "str": "string",
+    "string": "string",
+    "bool": "boolean",
+    "boolean": "boolean",
+}
+
+
+def scheme_dtypes(scheme: Optional[Scheme]) -> Dict[str, str]:
+    """pandas dtypes for scheme fields with simple types: scheme data - json schema with `properties` or field -> type name"""
+    if scheme is None:
+        return {}
+    try:
+        data = json.loads(scheme.data)
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    fields = data.get("properties", data)
+    if not isinstance(fields, dict):
+        return {}
+    dtypes = {}
+    for field, field_type in fields.items():
+        if isinstance(field_type, dict):
+            field_type = field_type.get("type")
+        if isinstance(field_type, str) and field_type.lower() in __SCHEME_DTYPES:
+            dtypes[field] = __SCHEME_DTYPES[field_type.lower()]
+    return dtypes
+
+
+def docs_to_df(docs: Iterable[str], dtypes: Optional[Dict[str, Any]] = None, chunk_size: int = 100_000, strict: bool = True) -> "pd.DataFrame":
+    """df from json docs (same as `from_records` of loaded docs): each chunk of `chunk_size` docs parsed by current codec as one json array (orjson codec is ~1.5x faster), `dtypes` applied to existing columns (not `strict` - failed ones are kept as is); `pd.read_json(lines=True)` is not used: it is slower, takes ~5x memory and fails on ints out of int64/uint64"""
+    import pandas as pd
+
+    codec = current_codec()
+    docs = docs if isinstance(docs, list) else list(docs)
+    if len(docs) <= chunk_size:
+        df = pd.DataFrame.from_records(codec.loads(f"[{','.join(docs)}]"))
+    else:
+        df = pd.concat([pd.DataFrame.from_records(codec.loads(f"[{','.join(docs[start:start + chunk_size])}]")) for start in range(0, len(docs), chunk_size)], ignore_index=True)
+    for column, dtype in (dtypes or {}).items():
+        if column not in df.columns:
+            continue
+        try:
+            df[column] = df[column].astype(dtype)
+        except (TypeError, ValueError) as ex:
+            if strict:
+                raise
+            if Config.WITH_WARNINGS:
+                Config.logger.warning(f"column {column} is not {dtype}, ignore: {ex}")
+    return df
+
+
+def collection_to_df(collection: ResultCollection, dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None) -> "pd.DataFrame":
+    """df from collection docs, `dtypes` - explicit, "scheme" - by collection scheme if it set, otherwise inferred as `from_records`"""
+    if dtypes == "scheme":
+        return docs_to_df([doc.data for doc in collection.docs], scheme_dtypes(collection.scheme), strict=False)
+    return docs_to_df([doc.data for doc in collection.docs], dtypes)
+
+
+def __metadata(metadata: Optional[Union[Dict[str, Any], str]]) -> Optional[Alias.Json]:
+    """metadata json from dict or json file path"""
     if metadata is not None:
         if isinstance(metadata, str):
             with open(metadata) as f:
                 metadata = json.load(f)
             metadata = json.dumps(metadata)
-        elif isinstance(data, dict):
+        elif isinstance(metadata, dict):
             metadata = json.dumps(metadata)
         elif Config.WITH_WARNINGS:
             Config.logger.warning("wrong metadata type, ignore")
             metadata = None
-    return DocsDataCollection(data=[row.to_json() for _, row in data.iterrows()], name=name, metadata=metadata)
+    return metadata
+
+
+def raw_collection_from_df(
+    data: "pd.DataFrame",
+    name: Optional[str],
+    metadata: Optional[Union[Dict[str, Any], str]],
+) -> DocsDataCollection:
+    return DocsDataCollection(data=df_to_docs(data), name=name, metadata=__metadata(metadata))
+
+
+__FILE_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet", ".pq": "parquet"}
+
+
+def file_format(file: str, format: Optional[str] = None) -> str:
+    """`format` or by `file` extension: csv (default), jsonl or parquet"""
+    if format is None:
+        format = __FILE_FORMATS.get(os.path.splitext(file)[1].lower(), "csv")
+    assert format in ("csv", "jsonl", "parquet"), f"wrong format: {format}, expected csv, jsonl or parquet"
+    return format
+
+
+def __csv_block_docs(header: bytes, block: bytes) -> List[Alias.Doc]:
+    """docs from csv lines `block`, in worker process"""
+    import pandas as pd
+
+    return df_to_docs(pd.read_csv(io.BytesIO(header + block)))
+
+
+def __iter_csv_docs_processes(file: str, chunk_rows: int, processes: int) -> Iterator[List[Alias.Doc]]:
+    """csv split by lines into blocks of about `chunk_rows` rows, parsed in `processes` processes, at most `processes` blocks ahead"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with open(file, "rb") as f, ProcessPoolExecutor(processes) as pool:
+        header = f.readline()
+        block = b"".join(itertools.islice(f, chunk_rows))
+        block_bytes = max(len(block), 1)    # next blocks by size
+        pending = collections.deque()
+        while len(block) > 0 or len(pending) > 0:
+            if len(block) > 0:
+                pending.append(pool.submit(__csv_block_docs, header, block))
+                block = f.read(block_bytes)
+                if len(block) > 0 and not block.endswith(b"\n"):
+                    block += f.readline()
+            if len(pending) > processes or len(block) == 0:
+                yield pending.popleft().result()
+
+
+def __iter_file_docs(file: str, format: str, chunk_rows: int, processes: Optional[int]) -> Iterator[List[Alias.Doc]]:
+    import pandas as pd
+
+    if format == "jsonl":
+        with open(file) as f:
+            while True:
+                lines = list(itertools.islice(f, chunk_rows))
+                if len(lines) == 0:
+                    return
+                yield [line for line in map(str.strip, lines) if line != ""]   # lines are docs as is
+    elif format == "parquet":
+        for data in iter_parquet_dfs(file, chunk_rows):
+            yield df_to_docs(data)
+    elif processes is not None:
+        yield from __iter_csv_docs_processes(file, chunk_rows, processes)
+    else:
+        try:
+            reader = pd.read_csv(file, chunksize=chunk_rows)
+        except pd.errors.EmptyDataError:
+            return
+        with reader:
+            for data in reader:
+                yield df_to_docs(data)
+
+
+async def iter_file_docs_async(file: str, format: Optional[str] = None, chunk_rows: int = 100_000, processes: Optional[int] = None) -> AsyncIterator[List[Alias.Doc]]:
+    """docs from csv, jsonl (lines as is) or parquet `file` by chunks of about `chunk_rows` rows, read in executor; `processes` - parse csv in process pool (quoted values should not contain line breaks)"""
+    loop = asyncio.get_running_loop()
+    docs = __iter_file_docs(file, file_format(file, format), chunk_rows, processes)
+    end = object()
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, next, docs, end)
+            if chunk is end:
+                return
+            yield chunk
+    finally:
+        try:
+            docs.close()
+        except ValueError:  # still read in executor
+            pass
 
 
 def raw_collection_from_file(
     file: str,
     name: Optional[str] = None,
     metadata: Optional[Union[Dict[str, Any], str]] = None,
+    format: Optional[str] = None,
 ) -> DocsDataCollection:
+    """collection with docs from csv, jsonl (lines as is) or parquet `file`, `format` by extension if not set"""
+    import pandas as pd
+
+    format = file_format(file, format)
+    if format != "csv":
+        return DocsDataCollection(data=[doc for docs in __iter_file_docs(file, format, 100_000, None) for doc in docs], name=name, metadata=__metadata(metadata))
     try:
         data = pd.read_csv(file)
     except pd.errors.EmptyDataError:
@@ -147,14 +366,52 @@ def raw_collection_from_file(
     return raw_collection_from_df(data, name, metadata)
 
 
+def __upload_chunked(
+    docs: Union[List[Alias.Doc], AsyncIterator[List[Alias.Doc]]],
+    create: Callable[[List[Alias.Doc]], Coroutine[Any, Any, Alias.Id]],
+    chunked: Union[bool, UploadPolicy],
+    is_async: bool,
+    **kwargs,
+) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
+    coroutine = upload_docs_async(docs, create, chunked if isinstance(chunked, UploadPolicy) else None, **kwargs)
+    if is_async:
+        return coroutine
+    return background_loop.run(coroutine)
+
+
+def __post_collection(
+    id: Optional[str],
+    data: DocsDataCollection,
+    batcher: Optional[Batcher],
+    is_async: bool,
+    *args,
+    **kwargs,
+) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
+    """create collection from `data` or update it by `id` in one request"""
+    if batcher is None:
+        batcher = Config.BATCHER
+    if id is None:
+        if batcher is not None:
+            return batcher.add("postCollectionByDocs", data=data)
+        if is_async:
+            return post_collections_data_async(data, *args, **kwargs)
+        return post_collections_data(data, *args, **kwargs)
+    if batcher is not None:
+        return batcher.add("postCollectionByDocsAndId", data=data, vars={"id": id})
+    if is_async:
+        return post_collections_data_id_async(id, data, *args, **kwargs)
+    return post_collections_data_id(id, data, *args, **kwargs)
+
+
 @overload
 def create_collection_from_df(
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str],
     metadata: Optional[Union[Dict[str, Any], str]],
     batcher: Optional[Batcher] = None,
     *args,
     is_async: Literal[False] = False,
+    chunked: Union[bool, UploadPolicy] = False,
     **kwargs
 ) -> Alias.Id:
     pass
@@ -162,45 +419,47 @@ def create_collection_from_df(
 
 @overload
 def create_collection_from_df(
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str],
     metadata: Optional[Union[Dict[str, Any], str]],
     batcher: Optional[Batcher] = None,
     *args,
     is_async: Literal[True],
+    chunked: Union[bool, UploadPolicy] = False,
     **kwargs
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
 
 
 def create_collection_from_df(
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str],
     metadata: Optional[Union[Dict[str, Any], str]],
     batcher: Optional[Batcher] = None,
     *args,
     is_async: bool = False,
+    chunked: Union[bool, UploadPolicy] = False,
     **kwargs
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
     if batcher is None:
         batcher = Config.BATCHER
     data = raw_collection_from_df(data, name, metadata)
-    if batcher is not None:
-        return batcher.add("postCollectionByDocs", data=data)
-    if is_async:
-        return post_collections_data_async(data, *args, **kwargs)
-    return post_collections_data(data, *args, **kwargs)
+    if chunked is not False:
+        assert batcher is None, "chunked upload in batcher is not supported"
+        return __upload_chunked(data.data, lambda docs: post_collections_data_async(data.model_copy(update={"data": docs}), *args, **kwargs), chunked, is_async, **kwargs)
+    return __post_collection(None, data, batcher, is_async, *args, **kwargs)
 
 
 @overload
 def update_collection_from_df(
     id: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str],
     metadata: Optional[Union[Dict[str, Any], str]],
     batcher: Optional[Batcher] = None,
     *args,
     is_async: Literal[False] = False,
+    chunked: Union[bool, UploadPolicy] = False,
     **kwargs
 ) -> Alias.Id:
     pass
@@ -209,12 +468,13 @@ def update_collection_from_df(
 @overload
 def update_collection_from_df(
     id: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str],
     metadata: Optional[Union[Dict[str, Any], str]],
     batcher: Optional[Batcher] = None,
     *args,
     is_async: Literal[True],
+    chunked: Union[bool, UploadPolicy] = False,
     **kwargs
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
@@ -222,22 +482,22 @@ def update_collection_from_df(
 
 def update_collection_from_df(
     id: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str],
     metadata: Optional[Union[Dict[str, Any], str]],
     batcher: Optional[Batcher] = None,
     *args,
     is_async: bool = False,
+    chunked: Union[bool, UploadPolicy] = False,
     **kwargs
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
     if batcher is None:
         batcher = Config.BATCHER
     data = raw_collection_from_df(data, name, metadata)
-    if batcher is not None:
-        return batcher.add("postCollectionByDocsAndId", data=data, vars={"id": id})
-    if is_async:
-        return post_collections_data_id_async(id, data, *args, **kwargs)
-    return post_collections_data_id(id, data, *args, **kwargs)
+    if chunked is not False:
+        assert batcher is None, "chunked upload in batcher is not supported"
+        return __upload_chunked(data.data, lambda docs: post_collections_data_id_async(id, data.model_copy(update={"data": docs}), *args, **kwargs), chunked, is_async, **kwargs)
+    return __post_collection(id, data, batcher, is_async, *args, **kwargs)
 
 
 def create_app_settings(
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+from malevich_coretools.funcs.sessions import on_loop_close
+from malevich_coretools.secondary import Config
+
+__all__ = ["RateLimits", "TokenBucket", "lane", "current_lane", "admission", "admission_async", "Slot", "DEFAULT_LANE"]
+
+DEFAULT_LANE = "default"
+
+
+class RateLimits(BaseModel):
+    max_in_flight: Optional[int] = None     # requests to host at the same time (for threads and for each event loop), None - unlimited
+    rps: Optional[float] = None             # requests to host per second, None - unlimited
+    burst: int = 1                          # requests allowed at once over `rps`
+
+
+class TokenBucket:
+    """thread-safe, shared by threads and event loops; tokens are reserved in advance, so waiters are served in order"""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        assert rate > 0, "wrong rate"
+        self.__rate = rate
+        self.__capacity = max(burst, 1)
+        self.__tokens = float(self.__capacity)
+        self.__time = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """take token, return seconds to wait before use"""
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__time) * self.__rate)
+            self.__time = now
+            self.__tokens -= 1
+            return 0 if self.__tokens >= 0 else -self.__tokens / self.__rate
+
+
+class Slot:
+    """in-flight slot, released at the end of admission unless `detach`ed"""
+
+    def __init__(self, release: Optional[Callable[[], None]] = None) -> None:
+        self.__release = release
+
+    def detach(self) -> Callable[[], None]:
+        """keep the slot after admission, returned function releases it (once)"""
+        release, self.__release = self.__release, None
+        if release is None:
+            return lambda: None
+        released = []
+
+        def release_once() -> None:
+            if not released:
+                released.append(True)
+                release()
+        return release_once
+
+    def _release(self) -> None:
+        release, self.__release = self.__release, None
+        if release is not None:
+            release()
+
+
+class _Limiter:
+    def __init__(self, limits: RateLimits) -> None:
+        self.limits = limits
+        self.__bucket = None if limits.rps is None else TokenBucket(limits.rps, limits.burst)
+        self.__semaphore = None if limits.max_in_flight is None else threading.BoundedSemaphore(limits.max_in_flight)
+        self.__loop_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Slot]:
+        if self.__bucket is not None:
+            delay = self.__bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        if self.__semaphore is None:
+            yield Slot()
+            return
+        self.__semaphore.acquire()
+        slot = Slot(self.__semaphore.release)
+        try:
+            yield slot
+        finally:
+            slot._release()
+
+    @asynccontextmanager
+    async def acquire_async(self) -> AsyncIterator[Slot]:
+        if self.__bucket is not None:
+            delay = self.__bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if self.limits.max_in_flight is None:
+            yield Slot()
+            return
+        loop = asyncio.get_running_loop()
+        semaphore = self.__loop_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self.__loop_semaphores[loop] = asyncio.Semaphore(self.limits.max_in_flight)
+            on_loop_close(loop, lambda: self.__loop_semaphores.pop(loop, None))
+        await semaphore.acquire()
+        slot = Slot(semaphore.release)
+        try:
+            yield slot
+        finally:
+            slot._release()
+
+
+__lane: ContextVar[str] = ContextVar("malevich_lane", default=DEFAULT_LANE)
+__limiters: Dict[Tuple[str, str], _Limiter] = {}
+__limiters_lock = threading.Lock()
+
+
+@contextmanager
+def lane(name: str) -> Iterator[str]:
+    """requests inside use limits of lane `name` from `Config.RATE_LIMITS` (sync and async), e.g. separate bulk traffic from interactive calls"""
+    token = __lane.set(name)
+    try:
+        yield name
+    finally:
+        __lane.reset(token)
+
+
+def current_lane() -> str:
+    return __lane.get()
+
+
+def _limiter(url: str) -> Optional[_Limiter]:
+    if Config.RATE_LIMITS is None:
+        return None
+    name = __lane.get()
+    limits = Config.RATE_LIMITS.get(name, Config.RATE_LIMITS.get(DEFAULT_LANE))
+    if limits is None:
+        return None
+    parts = urlsplit(url)
+    key = (f"{parts.scheme}://{parts.netloc}", name)
+    limiter = __limiters.get(key)
+    if limiter is None or limiter.limits is not limits:
+        with __limiters_lock:
+            limiter = __limiters.get(key)
+            if limiter is None or limiter.limits is not limits:
+                limiter = __limiters[key] = _Limiter(limits)
+    return limiter
+
+
+@contextmanager
+def admission(url: str) -> Iterator[Slot]:
+    """wait for rate limit and in-flight slot for `url` host in current lane"""
+    limiter = _limiter(url)
+    if limiter is None:
+        yield Slot()
+        return
+    with limiter.acquire() as slot:
+        yield slot
+
+
+@asynccontextmanager
+async def admission_async(url: str) -> AsyncIterator[Slot]:
+    limiter = _limiter(url)
+    if limiter is None:
+        yield Slot()
+        return
+    async with limiter.acquire_async() as slot:
+        yield slot
@@ -0,0 +1,152 @@
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import queue
+import threading
+from typing import Any, AsyncIterable, Coroutine, Iterator, Optional, TypeVar
+
+from malevich_coretools.funcs.sessions import async_sessions
+
+__all__ = ["BackgroundLoop", "background_loop"]
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """one long-lived event loop in a daemon thread: sync code from any thread runs coroutines there and shares its pooled aiohttp sessions"""
+
+    def __init__(self) -> None:
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__lock = threading.Lock()
+
+    def __start(self) -> asyncio.AbstractEventLoop:
+        with self.__lock:
+            if self.__loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self.__thread = threading.Thread(target=run, name="malevich-loop", daemon=True)
+                self.__thread.start()
+                started.wait()
+                self.__loop = loop
+            return self.__loop
+
+    @property
+    def running(self) -> bool:
+        return self.__loop is not None
+
+    def in_loop(self) -> bool:
+        """called from the loop thread"""
+        return self.__thread is not None and self.__thread is threading.current_thread()
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """schedule `coroutine` with context variables of the caller (request policy, lane, span)"""
+        loop = self.__start()
+        future = concurrent.futures.Future()
+        context = contextvars.copy_context()
+
+        def on_done(task: asyncio.Task) -> None:
+            if task.cancelled():
+                future.cancel()
+                return
+            try:
+                if task.exception() is not None:
+                    future.set_exception(task.exception())
+                else:
+                    future.set_result(task.result())
+            except concurrent.futures.InvalidStateError:
+                pass    # cancelled by caller
+
+        def create() -> None:   # future stays pending until done, so the caller can cancel it
+            if future.cancelled():
+                coroutine.close()
+                return
+            task = context.run(loop.create_task, coroutine)
+            task.add_done_callback(on_done)
+            future.add_done_callback(lambda f: f.cancelled() and loop.call_soon_threadsafe(task.cancel))
+
+        loop.call_soon_threadsafe(create)
+        return future
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """run `coroutine` in the loop and wait for result, cancelled on timeout or interrupt"""
+        assert not self.in_loop(), "blocking call in background loop, use async api"
+        future = self.submit(coroutine)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, iterable: AsyncIterable[T], maxsize: int = 16) -> Iterator[T]:
+        """iterate `iterable` in the loop with at most `maxsize` items ahead of the caller; closing the iterator cancels it"""
+        assert not self.in_loop(), "blocking call in background loop, use async api"
+        loop = self.__start()
+        items = queue.Queue()
+        end = object()
+        space: Optional[asyncio.Semaphore] = None
+
+        async def pump() -> None:
+            nonlocal space
+            space = asyncio.Semaphore(maxsize)
+            try:
+                async for item in iterable:
+                    await space.acquire()
+                    items.put((item, None))
+            except Exception as ex:
+                items.put((end, ex))
+            else:
+                items.put((end, None))
+
+        future = self.submit(pump())
+        try:
+            while True:
+                item, ex = items.get()
+                if ex is not None:
+                    raise ex
+                if item is end:
+                    return
+                loop.call_soon_threadsafe(space.release)
+                yield item
+        finally:
+            future.cancel()
+
+    def close(self) -> None:
+        """close loop sessions and stop loop, next call starts it again"""
+        with self.__lock:
+            loop, thread, self.__loop, self.__thread = self.__loop, self.__thread, None, None
+        if loop is None:
+            return
+
+        async def shutdown() -> None:
+            await async_sessions.aclose()
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(5)
+        except BaseException:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        if not loop.is_running():
+            loop.close()
+
+    def _reset(self) -> None:
+        """forget loop without closing: after fork the thread does not exist in child"""
+        self.__loop = None
+        self.__thread = None
+        self.__lock = threading.Lock()
+
+
+background_loop = BackgroundLoop()
+atexit.register(background_loop.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=background_loop._reset)
@@ -0,0 +1,114 @@
+import asyncio
+import collections
+import itertools
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from malevich_coretools.abstract.abstract import ResultCollection, ResultDoc
+from malevich_coretools.secondary import Config
+
+__all__ = ["PagePolicy", "current_page_policy", "get_collection_paged_async", "iter_collection_pages_async"]
+
+
+class PagePolicy(BaseModel):
+    page_size: int = 10_000             # docs in first page, next ones adapt to latency
+    min_page_size: int = 1_000
+    max_page_size: int = 200_000
+    concurrency: int = 8                # pages in flight
+    target_latency: float = 2           # second per page
+    memory_budget: int = 256 * 2 ** 20  # bytes, pages in flight estimated by first page
+
+    def adapt(self, size: int, latency: float) -> int:
+        """next page size: towards `target_latency`, at most twice as big or small at once"""
+        next_size = min(max(size * self.target_latency / max(latency, 1e-3), size / 2), size * 2)
+        return int(min(max(next_size, self.min_page_size), self.max_page_size))
+
+
+def current_page_policy(policy: Optional[PagePolicy] = None) -> PagePolicy:
+    if policy is not None:
+        return policy
+    return Config.PAGE_POLICY if Config.PAGE_POLICY is not None else PagePolicy()
+
+
+async def get_collection_paged_async(
+    get_first: Callable[[int, int], Awaitable[ResultCollection]],
+    get_page: Callable[[str, int, int], Awaitable[ResultCollection]],
+    offset: int = 0,
+    limit: int = -1,
+    policy: Optional[PagePolicy] = None,
+) -> ResultCollection:
+    """collection by pages: `get_first(offset, limit)` gives length, then `get_page(id, offset, limit)` concurrently within `policy` window and memory budget; docs in order"""
+    policy = current_page_policy(policy)
+    assert policy.concurrency > 0, "concurrency should be positive"
+    size = policy.page_size if limit < 0 else min(limit, policy.page_size)
+    started = time.monotonic()
+    first = await get_first(offset, size)
+    end = first.length if limit < 0 else min(first.length, offset + limit)
+    next_offset = offset + len(first.docs)
+    if len(first.docs) == 0 or next_offset >= end:
+        return first
+    size = policy.adapt(size, time.monotonic() - started)
+    doc_bytes = max(1, sum(len(doc.data) for doc in first.docs) // len(first.docs))
+    size = max(1, min(size, policy.memory_budget // doc_bytes))
+
+    pages: Dict[int, List[ResultDoc]] = {offset: first.docs}
+    tasks: Dict[asyncio.Future, Tuple[int, int, float]] = {}    # task -> page offset, limit, start time
+    in_flight = 0   # estimated bytes
+    try:
+        while next_offset < end or len(tasks) > 0:
+            while next_offset < end and len(tasks) < policy.concurrency and (len(tasks) == 0 or in_flight + size * doc_bytes <= policy.memory_budget):
+                count = min(size, end - next_offset)
+                tasks[asyncio.ensure_future(get_page(first.id, next_offset, count))] = (next_offset, count, time.monotonic())
+                in_flight += count * doc_bytes
+                next_offset += count
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                page_offset, count, page_started = tasks.pop(task)
+                in_flight -= count * doc_bytes
+                pages[page_offset] = task.result().docs
+                size = max(1, min(policy.adapt(count, time.monotonic() - page_started), policy.memory_budget // doc_bytes))
+    finally:
+        for task in tasks:
+            task.cancel()
+    return first.model_copy(update={"docs": list(itertools.chain.from_iterable(pages[key] for key in sorted(pages)))})
+
+
+async def iter_collection_pages_async(
+    get_first: Callable[[int, int], Awaitable[ResultCollection]],
+    get_page: Callable[[str, int, int], Awaitable[ResultCollection]],
+    offset: int = 0,
+    limit: int = -1,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+) -> AsyncIterator[ResultCollection]:
+    """collection pages of `page_size` docs in order: `get_first(offset, limit)`, then `get_page(id, offset, limit)`; next `prefetch` pages are requested before current one is yielded"""
+    assert page_size > 0, "page_size should be positive"
+    assert prefetch >= 0, "prefetch should not be negative"
+    page = await get_first(offset, page_size if limit < 0 else min(limit, page_size))
+    id = page.id
+    end = page.length if limit < 0 else min(page.length, offset + limit)
+    next_offset = offset + len(page.docs)
+    pending: collections.deque = collections.deque()
+
+    def fetch() -> Awaitable[ResultCollection]:
+        nonlocal next_offset
+        count = min(page_size, end - next_offset)
+        next_offset += count
+        return get_page(id, next_offset - count, count)
+
+    try:
+        while len(page.docs) > 0:   # empty page - collection shrank
+            while next_offset < end and len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(fetch()))
+            yield page
+            if len(pending) > 0:
+                page = await pending.popleft()
+            elif next_offset < end:
+                page = await fetch()
+            else:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,165 @@
+import asyncio
+import os
+import threading
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from malevich_coretools.secondary import Config
+
+if TYPE_CHECKING:
+    import aiohttp
+
+__all__ = ["SessionRegistry", "AsyncSessionRegistry", "sync_sessions", "async_sessions", "on_loop_close"]
+
+
+def on_loop_close(loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> bool:
+    """call `callback` in `loop.close` before the loop is closed (not running, so it may run coroutines); False if `loop` close can not be hooked"""
+    callbacks = getattr(loop, "_malevich_close_callbacks", None)
+    if callbacks is None:
+        callbacks = []
+        close = loop.close
+
+        def hooked_close() -> None:
+            if not loop.is_running() and not loop.is_closed():
+                while len(callbacks) > 0:
+                    try:
+                        callbacks.pop(0)()
+                    except Exception as ex:
+                        Config.logger.warning(f"loop close callback failed: {ex}")
+            close()
+
+        try:
+            loop.close = hooked_close   # kept by the loop only: freed with it
+            loop._malevich_close_callbacks = callbacks
+        except AttributeError:
+            return False
+    callbacks.append(callback)
+    return True
+
+
+class SessionRegistry:
+    """pooled keep-alive `requests.Session` by (host, auth), safe to use after fork"""
+
+    def __init__(self) -> None:
+        self.__sessions: Dict[Tuple[str, Optional[Tuple[str, str]]], requests.Session] = {}
+        self.__lock = threading.Lock()
+        self.__pid = os.getpid()
+
+    @staticmethod
+    def __create(auth: Optional[Tuple[str, str]]) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=Config.POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.auth = auth
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))  # requests stay stateless, as without session
+        if not Config.KEEP_ALIVE:
+            session.headers["Connection"] = "close"
+        return session
+
+    def get(self, host: str, auth: Optional[Tuple[str, str]] = None) -> requests.Session:
+        if self.__pid != os.getpid():
+            self._reset()
+        key = (host, None if auth is None else tuple(auth))
+        session = self.__sessions.get(key)
+        if session is None:
+            with self.__lock:
+                session = self.__sessions.get(key)
+                if session is None:
+                    session = self.__create(key[1])
+                    self.__sessions[key] = session
+        return session
+
+    def close(self) -> None:
+        with self.__lock:
+            sessions, self.__sessions = self.__sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def _reset(self) -> None:
+        """forget sessions without closing: after fork connections are still used by the parent"""
+        self.__sessions = {}
+        self.__lock = threading.Lock()
+        self.__pid = os.getpid()
+
+
+sync_sessions = SessionRegistry()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=sync_sessions._reset)
+
+
+class AsyncSessionRegistry:
+    """shared `aiohttp.ClientSession` by event loop and (host, auth) with bounded connection pool; sessions are closed at the end of `asyncio.run` or in `loop.close`"""
+
+    def __init__(self) -> None:
+        self.__loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def __create(auth: Optional[Tuple[str, str]]) -> "aiohttp.ClientSession":
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            ssl=False,
+            limit=Config.ASYNC_POOL_SIZE,
+            ttl_dns_cache=Config.DNS_CACHE_TTL,
+            force_close=not Config.KEEP_ALIVE,
+        )
+        return aiohttp.ClientSession(
+            auth=None if auth is None else aiohttp.BasicAuth(login=auth[0], password=auth[1], encoding='utf-8'),
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=None),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+
+    @staticmethod
+    async def __close_on_shutdown(sessions: Dict[Tuple[str, Optional[Tuple[str, str]]], "aiohttp.ClientSession"]) -> AsyncGenerator[None, None]:
+        """finalized by `loop.shutdown_asyncgens` (at the end of `asyncio.run`)"""
+        try:
+            yield
+        finally:
+            for session in list(sessions.values()):
+                await session.close()
+            sessions.clear()
+
+    def __loop_sessions(self) -> Dict[Tuple[str, Optional[Tuple[str, str]]], "aiohttp.ClientSession"]:
+        loop = asyncio.get_running_loop()
+        loop_data = self.__loops.get(loop)
+        if loop_data is None:
+            sessions = {}
+            closer = self.__close_on_shutdown(sessions)
+            try:
+                closer.__anext__().send(None)   # run until yield, registers in loop asyncgens
+            except StopIteration:
+                pass
+            loop_data = self.__loops[loop] = (sessions, closer)
+            on_loop_close(loop, lambda: self.__close_loop(loop))
+        return loop_data[0]
+
+    def __close_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """close sessions and forget `loop`: its entry would be kept alive by sessions that refer to it"""
+        loop_data = self.__loops.pop(loop, None)
+        if loop_data is not None:
+            loop.run_until_complete(loop_data[1].aclose())  # runs `finally` of not finalized closer
+
+    def get(self, host: str, auth: Optional[Tuple[str, str]] = None) -> "aiohttp.ClientSession":
+        """should be called in running event loop"""
+        sessions = self.__loop_sessions()
+        key = (host, None if auth is None else tuple(auth))
+        session = sessions.get(key)
+        if session is None or session.closed:
+            session = sessions[key] = self.__create(key[1])
+        return session
+
+    async def aclose(self) -> None:
+        """close sessions of running event loop"""
+        sessions = self.__loop_sessions()
+        for session in list(sessions.values()):
+            await session.close()
+        sessions.clear()
+
+
+async_sessions = AsyncSessionRegistry()
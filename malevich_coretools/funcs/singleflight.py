@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+__all__ = ["SingleFlight", "AsyncSingleFlight", "sync_flights", "async_flights"]
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """collapse concurrent calls with the same key (from different threads) into one, result shared with all callers"""
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.__calls[key] = _Call()
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.event.set()
+        return call.result
+
+
+def _retrieve(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()    # all callers may be cancelled, so nobody retrieves
+
+
+class AsyncSingleFlight:
+    """collapse concurrent calls with the same key (in one event loop) into one task, result shared with all callers; cancellation of a caller does not cancel the task"""
+
+    def __init__(self) -> None:
+        self.__loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        tasks = self.__loops.get(loop)
+        if tasks is None:
+            tasks = self.__loops[loop] = {}
+        task = tasks.get(key)
+        if task is None:
+            task = tasks[key] = loop.create_task(fn())
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+            task.add_done_callback(_retrieve)
+        return await asyncio.shield(task)
+
+
+sync_flights = SingleFlight()
+async_flights = AsyncSingleFlight()
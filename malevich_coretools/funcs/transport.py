@@ -0,0 +1,383 @@
+import asyncio
+import gzip
+import random
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+import requests
+from pydantic import BaseModel
+
+from malevich_coretools.funcs.limits import Slot, admission, admission_async
+from malevich_coretools.secondary import Config
+from malevich_coretools.secondary.metrics import (
+    RequestEvent,
+    emit,
+    set_route,
+    url_route,
+)
+from malevich_coretools.secondary.tracing import traceparent
+
+if TYPE_CHECKING:
+    import aiohttp
+
+__all__ = ["RequestPolicy", "CircuitOpenError", "request_policy", "current_policy", "long_wait_policy", "compressor", "request", "request_async"]
+
+__FAILURE_STATUSES = {HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT}
+
+
+class RequestPolicy(BaseModel):
+    connect_timeout: Optional[float] = 30       # second, None - unlimited
+    read_timeout: Optional[float] = 300         # second, None - unlimited; requests waiting for operation run use `long_wait_policy`
+    retries: int = 3
+    backoff_factor: float = 0.5                 # delay = backoff_factor * 2^attempt
+    backoff_max: float = 30                     # second
+    jitter: bool = True
+    retry_methods: Set[str] = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}  # idempotent, retried on connection errors and `retry_statuses`
+    retry_statuses: Set[int] = {429, 502, 503, 504}
+    retry_any_method_statuses: Set[int] = {429, 503}    # request not processed - safe to repeat any method
+    circuit_failures: int = 5                   # consecutive failures to open circuit for host, 0 - disabled
+    circuit_reset: float = 30                   # second, fail fast while circuit open
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        delay = min(self.backoff_factor * (2 ** attempt), self.backoff_max)
+        if self.jitter:
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+    def should_retry(self, method: str, attempt: int, status: Optional[int] = None) -> bool:
+        """`status` is None - connection error or timeout"""
+        if attempt >= self.retries:
+            return False
+        if status is None:
+            return method in self.retry_methods
+        return (method in self.retry_methods and status in self.retry_statuses) or status in self.retry_any_method_statuses
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """closed -> open after `circuit_failures` consecutive failures -> half-open after `circuit_reset` (one trial request) -> closed on success; trial without result (cancelled) is released to next request"""
+
+    def __init__(self, host: str) -> None:
+        self.__host = host
+        self.__lock = threading.Lock()
+        self.__failures = 0
+        self.__open_until: Optional[float] = None
+        self.__trial = False
+
+    def check(self, policy: RequestPolicy) -> bool:
+        """raise if circuit open, return True if request is half-open trial, it should be released after"""
+        if policy.circuit_failures <= 0:
+            return False
+        with self.__lock:
+            if self.__open_until is None:
+                return False
+            if time.monotonic() < self.__open_until or self.__trial:
+                raise CircuitOpenError(f"circuit open for {self.__host}: too many failed requests")
+            self.__trial = True
+            return True
+
+    def release(self, trial: bool) -> None:
+        """allow next trial if `trial` request ended without `success` or `failure`"""
+        if trial:
+            with self.__lock:
+                self.__trial = False
+
+    def success(self) -> None:
+        with self.__lock:
+            self.__failures = 0
+            self.__open_until = None
+            self.__trial = False
+
+    def failure(self, policy: RequestPolicy) -> None:
+        if policy.circuit_failures <= 0:
+            return
+        with self.__lock:
+            self.__failures += 1
+            if self.__trial or self.__failures >= policy.circuit_failures:
+                if self.__open_until is None or self.__trial:
+                    Config.logger.warning(f"circuit open for {self.__host} for {policy.circuit_reset}s")
+                self.__open_until = time.monotonic() + policy.circuit_reset
+                self.__trial = False
+
+
+__breakers: Dict[str, CircuitBreaker] = {}
+__breakers_lock = threading.Lock()
+__policy: ContextVar[Optional[RequestPolicy]] = ContextVar("malevich_request_policy", default=None)
+__default_policy = RequestPolicy()
+
+
+def _breaker(url: str) -> CircuitBreaker:
+    parts = urlsplit(url)
+    host = f"{parts.scheme}://{parts.netloc}"
+    breaker = __breakers.get(host)
+    if breaker is None:
+        with __breakers_lock:
+            breaker = __breakers.setdefault(host, CircuitBreaker(host))
+    return breaker
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _zstd_compressor() -> Callable[[bytes], bytes]:
+    try:
+        from compression import zstd  # python 3.14+
+        return zstd.compress
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as ex:
+        raise ImportError("zstd compression need zstandard: pip install zstandard") from ex
+    return zstandard.ZstdCompressor().compress
+
+
+__compressors: Dict[str, Callable[[], Callable[[bytes], bytes]]] = {
+    "gzip": lambda: lambda data: gzip.compress(data, compresslevel=6),
+    "zstd": _zstd_compressor,
+}
+__body_compressors: Dict[str, Tuple[str, Callable[[bytes], bytes]]] = {}
+
+
+def compressor(algorithm: str) -> Callable[[bytes], bytes]:
+    """request body compression function: gzip or zstd (need zstandard before python 3.14)"""
+    factory = __compressors.get(algorithm)
+    assert factory is not None, f"unknown compression: {algorithm}, expected one of {list(__compressors.keys())}"
+    return factory()
+
+
+def _body_compressor(algorithm: str) -> Tuple[str, Callable[[bytes], bytes]]:
+    """(Content-Encoding, compression function) for `algorithm`, gzip if zstd is not installed"""
+    resolved = __body_compressors.get(algorithm)
+    if resolved is None:
+        try:
+            resolved = (algorithm, compressor(algorithm))
+        except ImportError as ex:
+            Config.logger.warning(f"{ex}, gzip is used instead")
+            resolved = ("gzip", compressor("gzip"))
+        __body_compressors[algorithm] = resolved
+    return resolved
+
+
+def _compress(kwargs: Dict[str, Any]) -> None:
+    """compress `data` in `kwargs` inplace by `Config.COMPRESSION` if it is not less than `Config.COMPRESSION_THRESHOLD`"""
+    data = kwargs.get("data")
+    if Config.COMPRESSION is None or not isinstance(data, (str, bytes, memoryview)) or _body_size(data) < Config.COMPRESSION_THRESHOLD:
+        return
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    encoding, compress = _body_compressor(Config.COMPRESSION)
+    kwargs["data"] = compress(data)
+    kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Encoding": encoding}
+
+
+def _trace(kwargs: Dict[str, Any]) -> None:
+    """add `traceparent` header of current span"""
+    header = traceparent()
+    if header is not None:
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), "traceparent": header}
+
+
+def current_policy(policy: Optional[RequestPolicy] = None) -> RequestPolicy:
+    """`policy` if set, else from `request_policy` context, else `Config.REQUEST_POLICY`, else default"""
+    if policy is not None:
+        return policy
+    policy = __policy.get()
+    if policy is not None:
+        return policy
+    return __default_policy if Config.REQUEST_POLICY is None else Config.REQUEST_POLICY
+
+
+def long_wait_policy(policy: Optional[RequestPolicy] = None) -> RequestPolicy:
+    """current policy without read timeout: for requests that wait for operation run"""
+    policy = current_policy(policy)
+    return policy if policy.read_timeout is None else policy.model_copy(update={"read_timeout": None})
+
+
+@contextmanager
+def request_policy(policy: RequestPolicy) -> Iterator[RequestPolicy]:
+    """override request policy for all requests inside (sync and async)"""
+    token = __policy.set(policy)
+    try:
+        yield policy
+    finally:
+        __policy.reset(token)
+
+
+def _body_size(data: Any) -> int:  # noqa: ANN401
+    if isinstance(data, memoryview):
+        return data.nbytes
+    return len(data) if isinstance(data, (str, bytes)) else 0
+
+
+def _hold_slot(response: Any, slot: Slot, *closers: str) -> None:  # noqa: ANN401
+    """streamed body is read after admission: in-flight slot is released by `closers` of `response` (or when it is collected)"""
+    release = weakref.finalize(response, slot.detach())
+    for name in closers:
+        close = getattr(response, name)
+
+        def closing(*args, close: Callable = close, **kwargs) -> Any:  # noqa: ANN401
+            try:
+                return close(*args, **kwargs)
+            finally:
+                release()
+        setattr(response, name, closing)
+
+
+def request(session: requests.Session, method: str, url: str, *, policy: Optional[RequestPolicy] = None, **kwargs) -> requests.Response:
+    """request with timeouts, retries and circuit breaker by `policy`, rate limits by `Config.RATE_LIMITS`, body compressed by `Config.COMPRESSION`; compressed responses are decoded by requests; reported to `Config.METRICS_LISTENERS`"""
+    policy = current_policy(policy)
+    kwargs.setdefault("timeout", (policy.connect_timeout, policy.read_timeout))
+    _compress(kwargs)
+    _trace(kwargs)
+    if not Config.METRICS_LISTENERS:
+        return _send(session, method, url, policy, [0], kwargs)
+
+    host, route = url_route(url)
+    set_route(route)
+    attempts = [0]
+    start = time.perf_counter()
+    try:
+        response = _send(session, method, url, policy, attempts, kwargs)
+    except Exception as ex:
+        emit(RequestEvent(route, method, host, None, time.perf_counter() - start, _body_size(kwargs.get("data")), 0, attempts[0], type(ex).__name__))
+        raise
+    received = int(response.headers.get("Content-Length", 0)) if kwargs.get("stream") else len(response.content)
+    emit(RequestEvent(route, method, host, response.status_code, time.perf_counter() - start, _body_size(kwargs.get("data")), received, attempts[0]))
+    return response
+
+
+def _send(session: requests.Session, method: str, url: str, policy: RequestPolicy, attempts: List[int], kwargs: Dict[str, Any]) -> requests.Response:
+    """`attempts` - retries count, updated inplace"""
+    breaker = _breaker(url)
+    attempt = 0
+    while True:
+        trial = breaker.check(policy)
+        try:
+            with admission(url) as slot:
+                response = session.request(method, url, **kwargs)
+                if kwargs.get("stream"):
+                    _hold_slot(response, slot, "close")
+        except (requests.ConnectionError, requests.Timeout) as ex:
+            breaker.failure(policy)
+            if not policy.should_retry(method, attempt):
+                raise
+            delay = policy.delay(attempt)
+            Config.logger.warning(f"{method} {url} failed: {ex}, retry in {delay:.2f}s")
+        except Exception:
+            breaker.failure(policy)
+            raise
+        except BaseException:
+            breaker.release(trial)
+            raise
+        else:
+            if response.status_code in __FAILURE_STATUSES:
+                breaker.failure(policy)
+            else:
+                breaker.success()
+            if not policy.should_retry(method, attempt, response.status_code):
+                return response
+            delay = policy.delay(attempt, _retry_after(response.headers.get("Retry-After")))
+            response.close()
+            Config.logger.warning(f"{method} {url} failed with {response.status_code}, retry in {delay:.2f}s")
+        time.sleep(delay)
+        attempt += 1
+        attempts[0] = attempt
+
+
+async def request_async(session: "aiohttp.ClientSession", method: str, url: str, *, policy: Optional[RequestPolicy] = None, stream: bool = False, **kwargs) -> "aiohttp.ClientResponse":
+    """request with timeouts, retries and circuit breaker by `policy`, rate limits by `Config.RATE_LIMITS`, body compressed by `Config.COMPRESSION`; response body is read and connection released if not `stream`, else response should be released by caller; reported to `Config.METRICS_LISTENERS`"""
+    import aiohttp
+
+    policy = current_policy(policy)
+    kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=None, sock_connect=policy.connect_timeout, sock_read=policy.read_timeout))
+    _compress(kwargs)
+    _trace(kwargs)
+    if not Config.METRICS_LISTENERS:
+        return await _send_async(session, method, url, policy, stream, [0], kwargs)
+
+    host, route = url_route(url)
+    set_route(route)
+    attempts = [0]
+    start = time.perf_counter()
+    try:
+        response = await _send_async(session, method, url, policy, stream, attempts, kwargs)
+    except Exception as ex:
+        emit(RequestEvent(route, method, host, None, time.perf_counter() - start, _body_size(kwargs.get("data")), 0, attempts[0], type(ex).__name__))
+        raise
+    received = (response.content_length or 0) if stream else len(await response.read())
+    emit(RequestEvent(route, method, host, response.status, time.perf_counter() - start, _body_size(kwargs.get("data")), received, attempts[0]))
+    return response
+
+
+async def _send_async(session: "aiohttp.ClientSession", method: str, url: str, policy: RequestPolicy, stream: bool, attempts: List[int], kwargs: Dict[str, Any]) -> "aiohttp.ClientResponse":
+    import aiohttp
+
+    breaker = _breaker(url)
+    attempt = 0
+    while True:
+        trial = breaker.check(policy)
+        try:
+            async with admission_async(url) as slot:
+                response = await session.request(method, url, **kwargs)
+                if stream:
+                    _hold_slot(response, slot, "release", "close")
+                else:
+                    await response.read()   # connection released after body is read, not `release` - it forbids reading the cached body
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as ex:
+            breaker.failure(policy)
+            if not policy.should_retry(method, attempt):
+                raise
+            delay = policy.delay(attempt)
+            Config.logger.warning(f"{method} {url} failed: {ex!r}, retry in {delay:.2f}s")
+        except Exception:
+            breaker.failure(policy)
+            raise
+        except BaseException:   # cancelled or interrupted - neither success nor failure
+            breaker.release(trial)
+            raise
+        else:
+            if response.status in __FAILURE_STATUSES:
+                breaker.failure(policy)
+            else:
+                breaker.success()
+            if not policy.should_retry(method, attempt, response.status):
+                return response
+            delay = policy.delay(attempt, _retry_after(response.headers.get("Retry-After")))
+            response.release()
+            Config.logger.warning(f"{method} {url} failed with {response.status}, retry in {delay:.2f}s")
+        await asyncio.sleep(delay)
+        attempt += 1
+        attempts[0] = attempt
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from malevich_coretools.abstract.abstract import (
+    Alias,
+    BatchOperation,
+    BatchOperations,
+    DocsCollectionChange,
+)
+from malevich_coretools.funcs.funcs import (
+    get_collections_id_async,
+    post_batch_async,
+    post_collections_id_add_async,
+)
+from malevich_coretools.secondary import Config
+from malevich_coretools.secondary.codec import current_codec
+
+__all__ = ["UploadPolicy", "current_upload_policy", "upload_docs_async"]
+
+class UploadPolicy(BaseModel):
+    chunk_bytes: int = 8 * 2 ** 20          # first chunk, next ones adapt to throughput
+    min_chunk_bytes: int = 2 ** 20
+    max_chunk_bytes: int = 64 * 2 ** 20
+    concurrency: int = 4                    # chunks in flight
+    target_latency: float = 2               # second per chunk
+    retries: int = 3                        # per chunk request
+    retry_delay: float = 0.5                # second, doubled on each retry
+
+    def adapt(self, size: int, latency: float) -> int:
+        """next chunk bytes: towards `target_latency`, at most twice as big or small at once"""
+        next_size = min(max(size * self.target_latency / max(latency, 1e-3), size / 2), size * 2)
+        return int(min(max(next_size, self.min_chunk_bytes), self.max_chunk_bytes))
+
+
+def current_upload_policy(policy: Optional[UploadPolicy] = None) -> UploadPolicy:
+    if policy is not None:
+        return policy
+    return Config.UPLOAD_POLICY if Config.UPLOAD_POLICY is not None else UploadPolicy()
+
+
+async def __post_docs(docs: List[Alias.Doc], policy: UploadPolicy, **kwargs) -> List[Alias.Id]:
+    """create `docs` by batch requests, retry only failed ones; return ids in order"""
+    codec = current_codec()
+    ids: List[Optional[Alias.Id]] = [None] * len(docs)
+    for attempt in range(policy.retries + 1):
+        missing = [i for i, id in enumerate(ids) if id is None]
+        operations = [BatchOperation(type="postDoc", data=codec.dumps({"data": docs[i], "name": None}).decode("utf-8"), alias=str(i)) for i in missing]
+        try:
+            error = None
+            for response in (await post_batch_async(BatchOperations(data=operations), **kwargs)).data:
+                if response.code < 400:
+                    ids[int(response.alias)] = response.data
+                else:
+                    error = f"code={response.code}: {response.data}"
+        except Exception as ex:
+            error = ex
+        if all(id is not None for id in ids):
+            return ids
+        if attempt == policy.retries:
+            raise Exception(f"chunk upload failed, {sum(id is None for id in ids)} docs left: {error}")
+        Config.logger.warning(f"chunk upload failed, retry {attempt + 1}/{policy.retries}: {error}")
+        await asyncio.sleep(policy.retry_delay * 2 ** attempt)
+
+
+async def __add_docs(id: Alias.Id, ids: List[Alias.Id], length: int, policy: UploadPolicy, **kwargs) -> None:
+    """add `ids` to collection `id` with `length` docs; after failure collection is read first and request repeated only if ids were not added"""
+    for attempt in range(policy.retries + 1):
+        collection = None
+        try:
+            if attempt > 0:
+                collection = await get_collections_id_async(id, length, len(ids), False, **kwargs)
+            if collection is None or collection.length == length:
+                await post_collections_id_add_async(id, DocsCollectionChange(data=ids), True, **kwargs)
+                return
+        except Exception as ex:
+            if attempt == policy.retries:
+                raise
+            Config.logger.warning(f"chunk add failed, retry {attempt + 1}/{policy.retries}: {ex}")
+            await asyncio.sleep(policy.retry_delay * 2 ** attempt)
+            continue
+        if collection.length == length + len(ids) and [doc.id for doc in collection.docs] == ids:
+            return  # previous request applied
+        raise Exception(f"collection {id} changed during upload: {collection.length} docs, expected {length} or {length + len(ids)}")
+
+
+class _Chunks:
+    """consecutive chunks of docs by size in bytes (at least one doc) from lists of docs"""
+
+    def __init__(self, source: AsyncIterator[List[Alias.Doc]]) -> None:
+        self.__source = source
+        self.__docs: List[Alias.Doc] = []
+        self.__offset = 0
+
+    async def next(self, size: int) -> Tuple[List[Alias.Doc], int]:
+        chunk = []
+        total = 0
+        while True:
+            if self.__offset == len(self.__docs):
+                self.__offset = 0
+                try:
+                    self.__docs = await self.__source.__anext__()
+                except StopAsyncIteration:
+                    self.__docs = []
+                    return chunk, total
+                continue
+            doc = self.__docs[self.__offset]
+            if len(chunk) > 0 and total + len(doc) > size:
+                return chunk, total
+            chunk.append(doc)
+            total += len(doc)
+            self.__offset += 1
+
+
+async def __single(docs: List[Alias.Doc]) -> AsyncIterator[List[Alias.Doc]]:
+    yield docs
+
+
+async def upload_docs_async(
+    docs: Union[List[Alias.Doc], AsyncIterator[List[Alias.Doc]]],
+    create: Callable[[List[Alias.Doc]], Awaitable[Alias.Id]],
+    policy: Optional[UploadPolicy] = None,
+    **kwargs,
+) -> Alias.Id:
+    """collection from `docs` (list or lists read on demand) by chunks: `create(first chunk)` gives collection id (not retried), other chunks are created as docs concurrently and added to it in order (failed requests retried by `policy`, adding - only if it was not applied); `kwargs` - auth and conn_url"""
+    policy = current_upload_policy(policy)
+    assert policy.concurrency > 0, "concurrency should be positive"
+    chunks = _Chunks(__single(docs) if isinstance(docs, list) else docs)
+    size = policy.chunk_bytes
+    first, first_bytes = await chunks.next(size)
+    tasks: Dict[asyncio.Future, Tuple[int, int, float]] = {}    # task -> chunk index, bytes, start time
+    tasks[asyncio.ensure_future(create(first))] = (0, first_bytes, time.monotonic())
+    results: Dict[int, Any] = {}
+    id = None
+    length = len(first)
+    index = 1
+    added = 1   # next chunk to add
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(tasks) < policy.concurrency:
+                chunk, chunk_bytes = await chunks.next(size)
+                if len(chunk) == 0:
+                    exhausted = True
+                    break
+                tasks[asyncio.ensure_future(__post_docs(chunk, policy, **kwargs))] = (index, chunk_bytes, time.monotonic())
+                index += 1
+            if len(tasks) == 0:
+                break
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                chunk_index, chunk_bytes, started = tasks.pop(task)
+                results[chunk_index] = task.result()
+                size = policy.adapt(max(chunk_bytes, 1), time.monotonic() - started)
+            if id is None and 0 in results:
+                id = results.pop(0)
+            while id is not None and added in results:
+                ids = results.pop(added)
+                await __add_docs(id, ids, length, policy, **kwargs)
+                length += len(ids)
+                added += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+    return id
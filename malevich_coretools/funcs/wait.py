@@ -0,0 +1,160 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from malevich_coretools.secondary import Config
+
+__all__ = ["WaitPolicy", "OperationEvent", "current_wait_policy", "wait_for", "as_completed"]
+
+T = TypeVar("T")
+
+__MAX_LISTENERS = 16    # threads for kafka listeners of all waits, others poll until a thread is free
+__listeners: Optional[ThreadPoolExecutor] = None
+__listeners_lock = threading.Lock()
+
+
+class WaitPolicy(BaseModel):
+    initial_interval: float = 0.5   # second
+    max_interval: float = 30        # second
+    multiplier: float = 2
+    jitter: bool = True
+    push: bool = True               # wake up by kafka end of operation logs, if `Config.KAFKA_HOST_PORT` set
+
+    def interval(self, attempt: int) -> float:
+        interval = min(self.initial_interval * (self.multiplier ** attempt), self.max_interval)
+        if self.jitter:
+            interval = interval / 2 + random.uniform(0, interval / 2)
+        return interval
+
+
+class OperationEvent:
+    """operation status: PENDING, IN_PROGRESS (has runs), SUCCESS (`result` - operation result) or FAILED (`result` - error)"""
+    __slots__ = ("operation_id", "status", "result", "statuses")
+
+    def __init__(self, operation_id: str, status: str, result: Optional[str] = None, statuses: Optional[Dict[str, str]] = None) -> None:
+        self.operation_id = operation_id
+        self.status = status
+        self.result = result
+        self.statuses = statuses    # run id -> run status, if requested
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("SUCCESS", "FAILED")
+
+    def __repr__(self) -> str:
+        return f"OperationEvent(operation_id={self.operation_id!r}, status={self.status!r})"
+
+
+def current_wait_policy(policy: Optional[WaitPolicy] = None) -> WaitPolicy:
+    if policy is not None:
+        return policy
+    return Config.WAIT_POLICY if Config.WAIT_POLICY is not None else WaitPolicy()
+
+
+def __listeners_executor() -> ThreadPoolExecutor:
+    """own bounded pool: blocking listeners do not take threads of the default executor"""
+    global __listeners
+    if __listeners is None:
+        with __listeners_lock:
+            if __listeners is None:
+                __listeners = ThreadPoolExecutor(__MAX_LISTENERS, thread_name_prefix="malevich-wait")
+    return __listeners
+
+
+def __listen(operation_id: str, kafka_host_port: str, wake: asyncio.Event, stop: threading.Event) -> "asyncio.Future":
+    from malevich_coretools.secondary.kafka_utils import wait_logs_end
+
+    loop = asyncio.get_running_loop()
+
+    def listen() -> None:
+        if stop.is_set():   # waited in queue until polling finished
+            return
+        try:
+            if wait_logs_end(operation_id, kafka_host_port, stop):
+                loop.call_soon_threadsafe(wake.set)
+        except Exception as ex:
+            Config.logger.warning(f"kafka wait for {operation_id} failed, polling only: {ex}")
+    return loop.run_in_executor(__listeners_executor(), listen)
+
+
+async def wait_for(poll: Callable[[], Awaitable[Optional[T]]], timeout: Optional[float] = None, policy: Optional[WaitPolicy] = None, operation_id: Optional[str] = None) -> T:
+    """call `poll` until it returns not None: exponential backoff with jitter between calls, woken up immediately by kafka when operation ends; deadline by monotonic clock, cancelled with the task"""
+    policy = current_wait_policy(policy)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    wake = asyncio.Event()
+    stop = threading.Event()
+    listener = None
+    if policy.push and operation_id is not None and Config.KAFKA_HOST_PORT is not None:
+        listener = __listen(operation_id, Config.KAFKA_HOST_PORT, wake, stop)
+    try:
+        attempt = 0
+        while True:
+            res = await poll()
+            if res is not None:
+                return res
+            delay = policy.interval(attempt)
+            attempt += 1
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError("wait get result timeout")
+                delay = min(delay, left)
+            try:
+                await asyncio.wait_for(wake.wait(), delay)
+                wake.clear()
+                attempt = 0     # operation ended, result should appear soon
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        stop.set()  # running listener closes its consumer within kafka poll timeout
+        if listener is not None:
+            listener.cancel()   # queued one is not started
+
+
+async def as_completed(poll: Callable[[List[str]], Awaitable[Dict[str, OperationEvent]]], operation_ids: Iterable[str], timeout: Optional[float] = None, policy: Optional[WaitPolicy] = None, on_event: Optional[Callable[[OperationEvent], None]] = None) -> AsyncIterator[OperationEvent]:
+    """one poller for all `operation_ids`: `poll` returns events of pending ids at once, finished ones are yielded as they come, status changes are passed to `on_event`; backoff by `policy` is reset on any change"""
+    policy = current_wait_policy(policy)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    statuses: Dict[str, Optional[str]] = dict.fromkeys(operation_ids)
+    pending = list(statuses)
+    attempt = 0
+    while len(pending) > 0:
+        events = await poll(pending)
+        changed = False
+        for operation_id in pending:
+            event = events.get(operation_id) or OperationEvent(operation_id, "PENDING")
+            if event.status != statuses[operation_id]:
+                statuses[operation_id] = event.status
+                changed = True
+                if on_event is not None:
+                    try:
+                        on_event(event)
+                    except Exception as ex:
+                        Config.logger.warning(f"operation event handler {on_event} failed: {ex}")
+            if event.done:
+                yield event
+        pending = [operation_id for operation_id in pending if statuses[operation_id] not in ("SUCCESS", "FAILED")]
+        if len(pending) == 0:
+            return
+        attempt = 0 if changed else attempt + 1
+        delay = policy.interval(attempt)
+        if deadline is not None:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TimeoutError(f"wait get result timeout, {len(pending)} operations pending")
+            delay = min(delay, left)
+        await asyncio.sleep(delay)
@@ -0,0 +1,94 @@
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, Union
+
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
+
+from malevich_coretools.secondary.config import Config
+
+__all__ = ["Codec", "OrjsonCodec", "MsgspecCodec", "current_codec", "codec_by_name"]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def _is_json_list(data: Union[str, bytes]) -> bool:
+    return data.lstrip()[:1] in ("[", b"[")
+
+
+class Codec:
+    """json codec for request and response bodies: models are encoded and decoded by pydantic in a single pass, other data - by `dumps`/`loads`"""
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def encode_model(self, model: BaseModel) -> bytes:
+        return pydantic_core.to_json(model)
+
+    def decode_model(self, data: Union[Dict[str, Any], List[Any], str, bytes], model: Type[BaseModel], is_list: Optional[bool] = False):  # noqa: ANN201
+        """`is_list` is None - detect by data"""
+        if isinstance(data, (str, bytes)):
+            if is_list is None:
+                is_list = _is_json_list(data)
+            if is_list:
+                return _list_adapter(model).validate_json(data)
+            return model.model_validate_json(data)
+
+        if is_list is None:
+            is_list = isinstance(data, list)
+        if is_list:
+            assert isinstance(data, list), data
+            return _list_adapter(model).validate_python(data)
+        assert isinstance(data, dict), data
+        return model.model_validate(data)
+
+
+class OrjsonCodec(Codec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+        self.__orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self.__orjson.dumps(data, option=self.__orjson.OPT_NON_STR_KEYS | self.__orjson.OPT_SERIALIZE_NUMPY)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self.__orjson.loads(data)
+
+
+class MsgspecCodec(Codec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+        self.__encoder = msgspec.json.Encoder()
+        self.__decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: Any) -> bytes:
+        return self.__encoder.encode(data)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self.__decoder.decode(data)
+
+
+__codecs = {codec.name: codec for codec in [Codec, OrjsonCodec, MsgspecCodec]}
+__default_codec = Codec()
+
+
+def codec_by_name(name: str) -> Codec:
+    """create codec by name: json, orjson (need orjson) or msgspec (need msgspec)"""
+    codec = __codecs.get(name)
+    assert codec is not None, f"unknown codec: {name}, expected one of {list(__codecs.keys())}"
+    return codec()
+
+
+def current_codec() -> Codec:
+    return __default_codec if Config.CODEC is None else Config.CODEC
@@ -15,6 +15,24 @@ class Config:
     VERBOSE = False
     WITH_WARNINGS = False
     BATCHER = None
+    POOL_SIZE = 10      # kept-alive connections per host
+    KEEP_ALIVE = True
+    ASYNC_POOL_SIZE = 100   # connections of all hosts, for each event loop
+    DNS_CACHE_TTL = 10      # second
+    CODEC = None            # secondary.codec.Codec, None - default json
+    REQUEST_POLICY = None   # funcs.transport.RequestPolicy, None - default
+    COMPRESSION = None      # request body compression: "gzip", "zstd" or None
+    COMPRESSION_THRESHOLD = 64 * 1024   # bytes, smaller bodies are sent as is
+    STREAM_CHUNK_SIZE = 256 * 1024      # bytes, read by chunks in streaming mode
+    SYNC_VIA_LOOP = False   # sync requests are sent by async implementation in one background event loop (funcs.loop), errors are aiohttp ones
+    WAIT_POLICY = None      # funcs.wait.WaitPolicy for long operation results, None - default
+    PAGE_POLICY = None      # funcs.paging.PagePolicy for paged collection fetch, None - default
+    UPLOAD_POLICY = None    # funcs.upload.UploadPolicy for chunked collection upload, None - default
+    SINGLE_FLIGHT = False   # concurrent identical core GET requests share one response
+    CACHE = None            # funcs.cache.ResponseCache, None - disabled
+    RATE_LIMITS = None      # lane -> funcs.limits.RateLimits per host, None - unlimited
+    METRICS_LISTENERS = []  # callables with secondary.metrics.RequestEvent or CodecEvent
+    SPAN_EXPORTERS = []     # callables with finished secondary.tracing.Span, empty - tracing disabled
 
     logging.basicConfig()
     logger = logging.getLogger("base-malevich-logger")
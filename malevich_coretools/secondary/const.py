@@ -1,7 +1,5 @@
 import urllib
-from typing import Dict, Optional
-
-import aiohttp
+from typing import Any, Dict, Optional
 
 from malevich_coretools.batch import DefferOperationInternal
 from malevich_coretools.secondary.helpers import bool_to_str
@@ -13,11 +11,20 @@ HEADERS_RAW = {'Content-type': 'text/plain; base64', 'Accept': 'application/json
 SLEEP_TIME = 0.1
 LONG_SLEEP_TIME = 1             # second
 WAIT_RESULT_TIMEOUT = 60 * 60   # hour
-AIOHTTP_TIMEOUT = aiohttp.ClientTimeout(total=60 * 10) # 10 min
-AIOHTTP_TIMEOUT_MINI = aiohttp.ClientTimeout(total=60 * 5) # 5 min
+__AIOHTTP_TIMEOUTS = {"AIOHTTP_TIMEOUT": 60 * 10, "AIOHTTP_TIMEOUT_MINI": 60 * 5}  # second, `aiohttp.ClientTimeout` created on first use
 POSSIBLE_APPS_PLATFORMS = {"base", "vast", "ws"}
 SCHEME_PATTERN = r"[a-zA-Z_]\w+"
 
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """aiohttp is imported on first use"""
+    total = __AIOHTTP_TIMEOUTS.get(name)
+    if total is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import aiohttp
+
+    globals()[name] = timeout = aiohttp.ClientTimeout(total=total)
+    return timeout
+
 # endpoints
 def with_wait(url, wait) -> str:
     return url if wait is None else f"{url}?wait={bool_to_str(wait)}"    # always first
@@ -1,6 +1,7 @@
 import json
 import random as rand
 import string
+import time
 from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from pydantic import BaseModel
@@ -13,7 +14,8 @@ from malevich_coretools.abstract.abstract import (
     LogsResult,
 )
 from malevich_coretools.secondary import Config
-from malevich_coretools.secondary.kafka_utils import handle_logs
+from malevich_coretools.secondary.codec import current_codec
+from malevich_coretools.secondary.metrics import CodecEvent, current_route, emit
 
 __all__ = ["to_json", "model_from_json", "rand_str", "bool_to_str", "show_logs", "show_logs_colored", "show_logs_func", "show_fail_app_info", "logs_streaming"]
 
@@ -36,17 +38,13 @@ def to_json(data: Union[Dict[str, Any], Alias.Json], condition_and_msg: Tuple[Ca
     return res
 
 
-def model_from_json(data: Union[Dict[str, Any], Alias.Json], model: BaseModel, is_list: Optional[bool] = False):  # noqa: ANN201
-    if isinstance(data, Alias.Json):
-        data = json.loads(data)
-    if is_list is None:
-        is_list = isinstance(data, list)
-    if is_list:
-        assert isinstance(data, list), data
-        return [model.model_validate(item) for item in data]
-    else:
-        assert isinstance(data, dict), data
-        return model.model_validate(data)
+def model_from_json(data: Union[Dict[str, Any], Alias.Json, bytes], model: BaseModel, is_list: Optional[bool] = False):  # noqa: ANN201
+    if not Config.METRICS_LISTENERS:
+        return current_codec().decode_model(data, model, is_list)
+    start = time.perf_counter()
+    res = current_codec().decode_model(data, model, is_list)
+    emit(CodecEvent(current_route(), "deserialize", time.perf_counter() - start, len(data) if isinstance(data, (str, bytes)) else 0))
+    return res
 
 
 def rand_str(size: int = 10, chars=string.ascii_letters) -> str:
@@ -208,6 +206,8 @@ def show_fail_app_info(data: str, err: bool):  # noqa: ANN201
 
 
 def logs_streaming(operation_id: str, kafka_host_port: Optional[str] = None, app_logs_show: Callable[[AppLogs], None] = show_logs_colored) -> None:
+    from malevich_coretools.secondary.kafka_utils import handle_logs
+
     colors_dict = {}
     for appLogs in handle_logs(operation_id, kafka_host_port=kafka_host_port):
         app_logs_show(appLogs, colors_dict=colors_dict)
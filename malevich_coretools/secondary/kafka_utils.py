@@ -1,3 +1,4 @@
+import threading
 from typing import Generator, Optional
 
 from kafka import KafkaConsumer
@@ -30,3 +31,20 @@ def handle_logs(operation_id: str, kafka_host_port: Optional[str] = None) -> Gen
             yield logs
     except KeyboardInterrupt:
         pass
+
+
+def wait_logs_end(operation_id: str, kafka_host_port: Optional[str] = None, stop: Optional[threading.Event] = None, poll_timeout: float = 0.5) -> bool:
+    """block until `end` of operation logs (True) or `stop` is set (False)"""
+    if kafka_host_port is None:
+        kafka_host_port = Config.KAFKA_HOST_PORT
+    assert kafka_host_port is not None, "kafka_host_port not set"
+
+    consumer = KafkaConsumer(__logs_topic(operation_id), bootstrap_servers=kafka_host_port)
+    try:
+        while stop is None or not stop.is_set():
+            for messages in consumer.poll(timeout_ms=int(poll_timeout * 1000)).values():
+                if any(message.value == b'end' for message in messages):
+                    return True
+        return False
+    finally:
+        consumer.close()
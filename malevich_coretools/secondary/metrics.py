@@ -0,0 +1,164 @@
+import math
+import threading
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+from malevich_coretools.secondary.config import Config
+
+__all__ = ["RequestEvent", "CodecEvent", "RouteMetrics", "MetricsRegistry", "emit", "url_route", "current_route", "set_route", "DEFAULT_BUCKETS"]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, math.inf)  # second
+
+
+class RequestEvent:
+    """one logical request (with all retries)"""
+    __slots__ = ("route", "method", "host", "status", "seconds", "bytes_sent", "bytes_received", "retries", "error")
+
+    def __init__(self, route: Optional[str], method: str, host: str, status: Optional[int], seconds: float, bytes_sent: int, bytes_received: int, retries: int, error: Optional[str] = None) -> None:
+        self.route = route
+        self.method = method
+        self.host = host
+        self.status = status
+        self.seconds = seconds
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.retries = retries
+        self.error = error
+
+
+class CodecEvent:
+    """body encoding ("serialize") or decoding ("deserialize")"""
+    __slots__ = ("route", "kind", "seconds", "bytes")
+
+    def __init__(self, route: Optional[str], kind: str, seconds: float, bytes: int) -> None:
+        self.route = route
+        self.kind = kind
+        self.seconds = seconds
+        self.bytes = bytes
+
+
+Event = Union[RequestEvent, CodecEvent]
+
+__route: ContextVar[Optional[str]] = ContextVar("malevich_route", default=None)
+
+
+def emit(event: Event) -> None:
+    for listener in list(Config.METRICS_LISTENERS):
+        try:
+            listener(event)
+        except Exception as ex:
+            Config.logger.warning(f"metrics listener {listener} failed: {ex}")
+
+
+def set_route(route: Optional[str]) -> None:
+    """route of the last request in current context, decoding of its response is attributed to it"""
+    __route.set(route)
+
+
+def current_route() -> Optional[str]:
+    return __route.get()
+
+
+def url_route(url: str) -> Tuple[str, Optional[str]]:
+    """(host, endpoint name from `secondary.const`) by url, host may have base path"""
+    from malevich_coretools.secondary.routes import route_name
+
+    parts = urlsplit(url)
+    path = parts.path.lstrip("/")
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    while True:
+        name = route_name(path)
+        if name is not None or "/" not in path:
+            return f"{parts.scheme}://{parts.netloc}", name
+        path = path.split("/", 1)[1]
+
+
+class RouteMetrics(BaseModel):
+    requests: int = 0
+    errors: int = 0                 # connection errors and timeouts
+    statuses: Dict[int, int] = {}
+    retries: int = 0
+    seconds: float = 0              # sum of latency
+    buckets: List[int] = []         # latency histogram, cumulative counts by `MetricsRegistry.buckets`
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    serialize_seconds: float = 0
+    deserialize_seconds: float = 0
+
+
+class MetricsRegistry:
+    """metrics by endpoint in process, add with `add_metrics_listener`"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.__lock = threading.Lock()
+        self.__routes: Dict[str, RouteMetrics] = {}
+
+    def __route(self, route: Optional[str]) -> RouteMetrics:
+        name = "unknown" if route is None else route
+        metrics = self.__routes.get(name)
+        if metrics is None:
+            metrics = self.__routes[name] = RouteMetrics(buckets=[0] * len(self.buckets))
+        return metrics
+
+    def __call__(self, event: Event) -> None:
+        with self.__lock:
+            metrics = self.__route(event.route)
+            if isinstance(event, CodecEvent):
+                if event.kind == "serialize":
+                    metrics.serialize_seconds += event.seconds
+                else:
+                    metrics.deserialize_seconds += event.seconds
+                return
+            metrics.requests += 1
+            metrics.retries += event.retries
+            metrics.seconds += event.seconds
+            metrics.bytes_sent += event.bytes_sent
+            metrics.bytes_received += event.bytes_received
+            if event.status is None:
+                metrics.errors += 1
+            else:
+                metrics.statuses[event.status] = metrics.statuses.get(event.status, 0) + 1
+            for i, bound in enumerate(self.buckets):
+                if event.seconds <= bound:
+                    metrics.buckets[i] += 1
+
+    def snapshot(self) -> Dict[str, RouteMetrics]:
+        with self.__lock:
+            return {route: metrics.model_copy(deep=True) for route, metrics in self.__routes.items()}
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__routes = {}
+
+    def prometheus(self, prefix: str = "malevich_client") -> str:
+        """metrics in prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name: str, kind: str, help: str, values: Callable[[str, RouteMetrics], List[str]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for route, metrics in snapshot.items():
+                lines.extend(values(route, metrics))
+
+        def buckets(route: str, metrics: RouteMetrics) -> List[str]:
+            res = []
+            for bound, count in zip(self.buckets, metrics.buckets):
+                le = "+Inf" if math.isinf(bound) else repr(float(bound))
+                res.append(f'{prefix}_request_duration_seconds_bucket{{route="{route}",le="{le}"}} {count}')
+            res.append(f'{prefix}_request_duration_seconds_sum{{route="{route}"}} {metrics.seconds}')
+            res.append(f'{prefix}_request_duration_seconds_count{{route="{route}"}} {metrics.requests}')
+            return res
+
+        metric("requests_total", "counter", "requests by endpoint and status", lambda route, metrics: [f'{prefix}_requests_total{{route="{route}",status="{status}"}} {count}' for status, count in metrics.statuses.items()] + ([f'{prefix}_requests_total{{route="{route}",status="error"}} {metrics.errors}'] if metrics.errors else []))
+        metric("request_duration_seconds", "histogram", "request latency with retries", buckets)
+        metric("retries_total", "counter", "retried requests", lambda route, metrics: [f'{prefix}_retries_total{{route="{route}"}} {metrics.retries}'])
+        metric("sent_bytes_total", "counter", "request body bytes", lambda route, metrics: [f'{prefix}_sent_bytes_total{{route="{route}"}} {metrics.bytes_sent}'])
+        metric("received_bytes_total", "counter", "response body bytes", lambda route, metrics: [f'{prefix}_received_bytes_total{{route="{route}"}} {metrics.bytes_received}'])
+        metric("codec_seconds_total", "counter", "body serialize and deserialize time", lambda route, metrics: [f'{prefix}_codec_seconds_total{{route="{route}",kind="serialize"}} {metrics.serialize_seconds}', f'{prefix}_codec_seconds_total{{route="{route}",kind="deserialize"}} {metrics.deserialize_seconds}'])
+        return "\n".join(lines) + "\n"
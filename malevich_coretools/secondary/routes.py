@@ -0,0 +1,54 @@
+import inspect
+import re
+from typing import List, Optional, Tuple
+
+from malevich_coretools.secondary import const
+
+__all__ = ["route_name", "route_prefix"]
+
+__ARG = "routeArg"
+
+
+def _templates() -> List[Tuple[str, str]]:
+    """(name, path regex) for endpoints from `const`, the most specific first"""
+    templates = []
+    for name, value in vars(const).items():
+        if not name.isupper() or name.endswith("_MAIN"):
+            continue
+        if inspect.isfunction(value):
+            args = [f"{__ARG}{i}" for i in range(len(inspect.signature(value).parameters))]
+            try:
+                value = value(*args)
+            except Exception:
+                continue
+        if not isinstance(value, str) or (value != "" and "/" not in value and value != const.PING):
+            continue
+        path = value.split("?", 1)[0]
+        literal = re.sub(rf"{__ARG}\d+", "", path)
+        pattern = re.sub(rf"{__ARG}\d+", "[^/]+", re.escape(path))
+        templates.append((len(literal), name, pattern))
+    templates.sort(key=lambda x: -x[0])     # stable: first defined name for the same path
+    return [(name, pattern) for _, name, pattern in templates]
+
+
+__names: List[str] = []
+__patterns: List[str] = []
+for __name, __pattern in _templates():
+    if __pattern not in __patterns:
+        __names.append(__name)
+        __patterns.append(__pattern)
+__routes = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in zip(__names, __patterns)))
+
+
+def route_name(path: str) -> Optional[str]:
+    """endpoint name from `secondary.const` by request path (DOCS_ID for api/v1/docs/123?wait=true), None if unknown"""
+    match = __routes.fullmatch(path.split("?", 1)[0])
+    return None if match is None else match.lastgroup
+
+
+def route_prefix(path: str) -> str:
+    """controller part of path: api/v1/docs for api/v1/docs/123"""
+    path = path.split("?", 1)[0]
+    if path.startswith(f"{const.API_VERSION}/"):
+        return "/".join(path.split("/", 3)[:3])
+    return path.split("/", 1)[0]
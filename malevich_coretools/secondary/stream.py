@@ -0,0 +1,122 @@
+import codecs
+import json
+import re
+from typing import Any, List, Optional, Union
+
+__all__ = ["JsonArrayReader"]
+
+__whitespace = re.compile(r"[ \t\n\r]*")
+__number_tail = re.compile(r"[0-9.eE+-]*")
+__decoder = json.JSONDecoder()
+
+_START, _KEY, _COLON, _VALUE, _AFTER_VALUE, _ARRAY, _AFTER_ITEM, _DONE = range(8)
+
+
+def _skip(buf: str, pos: int) -> int:
+    return __whitespace.match(buf, pos).end()
+
+
+def _raw_decode(buf: str, pos: int, final: bool) -> Optional[tuple]:
+    """(value, end) or None if value may be incomplete"""
+    try:
+        value, end = __decoder.raw_decode(buf, pos)
+    except json.JSONDecodeError:
+        if final:
+            raise
+        return None
+    if not final and __number_tail.match(buf, end).end() == len(buf):  # number may continue in the next chunk: "1." decoded as 1
+        return None
+    return value, end
+
+
+class JsonArrayReader:
+    """incremental parser of json object body: yields items of top-level array `key` as soon as they are received, other fields are collected to `fields`"""
+
+    def __init__(self, key: str) -> None:
+        self.__key = key
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buf = ""
+        self.__pos = 0
+        self.__state = _START
+        self.__current_key: Optional[str] = None
+        self.fields = {}
+
+    def feed(self, chunk: Union[str, bytes], final: bool = False) -> List[Any]:
+        """parse next `chunk` of body, return complete items; `final` - last chunk"""
+        if isinstance(chunk, bytes):
+            chunk = self.__decoder.decode(chunk, final)
+        if self.__pos > 0:
+            self.__buf = self.__buf[self.__pos:]
+            self.__pos = 0
+        self.__buf += chunk
+        items = []
+        while self.__step(items, final):
+            pass
+        if final and self.__state != _DONE:
+            raise ValueError(f"unexpected end of json body, expected array \"{self.__key}\"")
+        return items
+
+    def close(self) -> List[Any]:
+        return self.feed(b"", final=True)
+
+    def __step(self, items: List[Any], final: bool) -> bool:  # noqa: C901
+        buf = self.__buf
+        pos = _skip(buf, self.__pos)
+        if pos == len(buf):
+            self.__pos = pos
+            return False
+        char = buf[pos]
+        state = self.__state
+        if state == _START:
+            if char != "{":
+                raise ValueError(f"expected json object, found {char!r}")
+            self.__pos, self.__state = pos + 1, _KEY
+        elif state == _KEY:
+            if char == "}":
+                self.__pos, self.__state = pos + 1, _DONE
+                return True
+            res = _raw_decode(buf, pos, final)
+            if res is None:
+                return False
+            self.__current_key, self.__pos = res[0], res[1]
+            self.__state = _COLON
+        elif state == _COLON:
+            if char != ":":
+                raise ValueError(f"expected ':', found {char!r}")
+            self.__pos, self.__state = pos + 1, _VALUE
+        elif state == _VALUE:
+            if char == "[" and self.__current_key == self.__key:
+                self.__pos, self.__state = pos + 1, _ARRAY
+                return True
+            res = _raw_decode(buf, pos, final)
+            if res is None:
+                return False
+            self.fields[self.__current_key], self.__pos = res
+            self.__state = _AFTER_VALUE
+        elif state == _AFTER_VALUE:
+            if char == ",":
+                self.__pos, self.__state = pos + 1, _KEY
+            elif char == "}":
+                self.__pos, self.__state = pos + 1, _DONE
+            else:
+                raise ValueError(f"expected ',' or '}}', found {char!r}")
+        elif state in (_ARRAY, _AFTER_ITEM):
+            if char == "]":
+                self.__pos, self.__state = pos + 1, _AFTER_VALUE
+                return True
+            if state == _AFTER_ITEM:
+                if char != ",":
+                    raise ValueError(f"expected ',' or ']', found {char!r}")
+                pos = _skip(buf, pos + 1)
+                if pos == len(buf):
+                    self.__pos, self.__state = pos, _ARRAY
+                    return False
+            res = _raw_decode(buf, pos, final)
+            if res is None:
+                self.__pos, self.__state = pos, _ARRAY
+                return False
+            items.append(res[0])
+            self.__pos, self.__state = res[1], _AFTER_ITEM
+        else:
+            raise ValueError(f"unexpected data after json body: {char!r}")
+        return True
@@ -0,0 +1,122 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from malevich_coretools.secondary.config import Config
+
+__all__ = ["Span", "span", "traced", "current_span", "traceparent", "JsonLinesExporter"]
+
+F = TypeVar("F", bound=Callable)
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes", "start", "end", "error")
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.trace_id = os.urandom(16).hex() if parent is None else parent.trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = None if parent is None else parent.span_id
+        self.name = name
+        self.attributes = {} if attributes is None else attributes
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        """w3c trace context header value"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentId": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "end": self.end,
+            "duration": None if self.end is None else self.end - self.start,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+__span: ContextVar[Optional[Span]] = ContextVar("malevich_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return __span.get()
+
+
+def traceparent() -> Optional[str]:
+    """header for requests of current span, None - tracing disabled or no span"""
+    span = __span.get()
+    return None if span is None else span.traceparent
+
+
+def _export(span: Span) -> None:
+    for exporter in list(Config.SPAN_EXPORTERS):
+        try:
+            exporter(span)
+        except Exception as ex:
+            Config.logger.warning(f"span exporter {exporter} failed: {ex}")
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """client span: all requests inside (sync and async) send its `traceparent`, exported to `Config.SPAN_EXPORTERS` at the end; None if there are no exporters"""
+    if not Config.SPAN_EXPORTERS:
+        yield None
+        return
+    current = Span(name, __span.get(), attributes)
+    token = __span.set(current)
+    try:
+        yield current
+    except BaseException as ex:
+        current.error = repr(ex)
+        raise
+    finally:
+        __span.reset(token)
+        current.end = time.time()
+        _export(current)
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """run function in `span`, with `is_async=True` - returned coroutine when awaited"""
+    def decorator(fun: F) -> F:
+        span_name = fun.__name__ if name is None else name
+
+        async def await_in_span(coroutine: Any) -> Any:  # noqa: ANN401
+            with span(span_name):
+                return await coroutine
+
+        @functools.wraps(fun)
+        def wrapper(*args, **kwargs) -> Any:  # noqa: ANN401
+            if not Config.SPAN_EXPORTERS:
+                return fun(*args, **kwargs)
+            if kwargs.get("is_async", False):
+                res = fun(*args, **kwargs)
+                return await_in_span(res) if inspect.iscoroutine(res) else res
+            with span(span_name):
+                return fun(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class JsonLinesExporter:
+    """append finished spans to file `path`, one json per line"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.__lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self.__lock, open(self.path, "a") as f:
+            f.write(line + "\n")
@@ -0,0 +1 @@
+from .server import FakeCore, Fault  # noqa: F401
@@ -0,0 +1,31 @@
+"""pytest fixtures with `FakeCore`, enable with `pytest_plugins = ["malevich_coretools.testing.fixtures"]` in conftest.py"""
+from typing import Iterator
+
+import pytest
+
+from malevich_coretools.secondary import Config
+from malevich_coretools.testing.server import FakeCore
+
+__all__ = ["fake_core_server", "fake_core"]
+
+
+@pytest.fixture(scope="session")
+def fake_core_server() -> Iterator[FakeCore]:
+    """one server for session"""
+    with FakeCore() as server:
+        yield server
+
+
+@pytest.fixture
+def fake_core(fake_core_server: FakeCore) -> Iterator[FakeCore]:
+    """server with clean state, set as core and dm host with test credentials for the test"""
+    fake_core_server.reset()
+    fake_core_server.latency = {None: 0}
+    fake_core_server.operation_latency = 0
+    saved = Config.HOST_PORT, Config.DM_HOST_PORT, Config.CORE_USERNAME, Config.CORE_PASSWORD
+    Config.HOST_PORT = Config.DM_HOST_PORT = fake_core_server.url
+    Config.CORE_USERNAME, Config.CORE_PASSWORD = "test", "test"
+    try:
+        yield fake_core_server
+    finally:
+        Config.HOST_PORT, Config.DM_HOST_PORT, Config.CORE_USERNAME, Config.CORE_PASSWORD = saved
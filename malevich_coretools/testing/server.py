@@ -0,0 +1,793 @@
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from aiohttp import web
+from pydantic import BaseModel
+
+from malevich_coretools.secondary.routes import route_name
+
+__all__ = ["FakeCore", "Fault"]
+
+Result = Tuple[int, Union[str, bytes, List[str]]]     # status and body, list - streamed by chunks
+Handler = Callable[[Dict[str, str], Optional[bytes]], Awaitable[Result]]
+
+_USER_KINDS = {    # batch name -> (route, user id field)
+    "App": ("userApps", "appId"),
+    "Task": ("userTasks", "taskId"),
+    "Pipeline": ("userPipelines", "pipelineId"),
+    "Cfg": ("userCfgs", "cfgId"),
+}
+
+
+class Fault(BaseModel):
+    status: int = 500
+    body: str = "injected fault"
+    rate: float = 1.0                   # probability for each matched request
+    times: Optional[int] = None         # requests to fail, None - unlimited
+    headers: Dict[str, str] = {}        # e.g. {"Retry-After": "1"}
+    applied: bool = False               # request is handled before error (response lost)
+
+
+def _id() -> str:
+    return str(uuid.uuid4())
+
+
+def _json(data: Any) -> Result:  # noqa: ANN401
+    return 200, json.dumps(data)
+
+
+def _not_found(what: str) -> Result:
+    return 404, f"{what} not found"
+
+
+def _flag(vars: Dict[str, str], key: str, default: bool = False) -> bool:
+    value = vars.get(key)
+    return default if value is None else value.lower() == "true"
+
+
+def _int(vars: Dict[str, str], key: str, default: int) -> int:
+    value = vars.get(key)
+    return default if value is None else int(value)
+
+
+def _doc_data(data: Union[Dict[str, Any], str]) -> str:
+    return data if isinstance(data, str) else json.dumps(data)
+
+
+class FakeCore:
+    """in-process malevich-core and dm stand-in with in-memory state, for tests and load testing without a cluster
+
+    serves core routes from `secondary.const` (docs, collections, collection objects, schemes, user apps/tasks/pipelines/cfgs, task and pipeline runs, run statuses, operation results, batch) and dm `stream`, `continue`, `state` and `journal` on the same `url`;
+    `set_latency` and `fail` take endpoint name from `secondary.const` (None - all endpoints), runs finish after `operation_latency` seconds with `on_run` result
+    """
+
+    def __init__(self, latency: float = 0, operation_latency: float = 0, host: str = "127.0.0.1", port: int = 0, socket_path: Optional[str] = None) -> None:
+        self.operation_latency = operation_latency
+        self.on_run: Callable[[str, Dict[str, Any]], Dict[str, Any]] = lambda operation_id, data: {"operationId": operation_id, "runId": data.get("runId")}   # AppLogs json by operation id and request
+        self.latency: Dict[Optional[str], float] = {None: latency}
+        self.faults: Dict[Optional[str], Fault] = {}
+        self.calls: Dict[Optional[str], int] = {}    # requests by endpoint name
+        self.headers: Dict[Optional[str], Dict[str, str]] = {}  # last request headers by endpoint name
+        self.__host = host
+        self.__port = port
+        self.__socket_path = socket_path
+        self.__handlers: Dict[str, Handler] = {}
+        self.__routes: List[Tuple[str, str, str]] = []
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__runner: Optional[web.AppRunner] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.url: Optional[str] = None
+        self.reset()
+        self.__register()
+
+    def reset(self) -> None:
+        """forget all state, faults and counters"""
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.collections: Dict[str, Dict[str, Any]] = {}
+        self.objects: Dict[str, bytes] = {}
+        self.signatures: Dict[str, str] = {}
+        self.schemes: Dict[str, Dict[str, Any]] = {}
+        self.user: Dict[str, Dict[str, Tuple[str, Dict[str, Any]]]] = {kind: {} for kind in _USER_KINDS}     # kind -> user id -> (real id, data)
+        self.operations: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, Tuple[float, str]] = {}    # operation id -> (ready at monotonic time, AppLogs json)
+        self.run_ids: Dict[str, str] = {}   # operation id -> last run id
+        self.dm_streams: Dict[Tuple[str, str, str], List[str]] = {}
+        self.dm_states: Dict[Tuple[str, str, str], Any] = {}
+        self.dm_journals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.dm_continued: Dict[Tuple[str, str, str], str] = {}
+        self.faults.clear()
+        self.calls.clear()
+        self.headers.clear()
+
+    # injection
+
+    def set_latency(self, seconds: float, route: Optional[str] = None) -> None:
+        self.latency[route] = seconds
+
+    def fail(self, route: Optional[str] = None, status: int = 500, **kwargs) -> Fault:
+        """respond to `route` requests with error, kwargs - other `Fault` fields"""
+        fault = self.faults[route] = Fault(status=status, **kwargs)
+        return fault
+
+    def clear_faults(self) -> None:
+        self.faults.clear()
+
+    # state
+
+    def add_doc(self, data: Union[Dict[str, Any], str], name: Optional[str] = None) -> str:
+        id = _id()
+        self.docs[id] = {"data": _doc_data(data), "name": name}
+        return id
+
+    def add_collection(self, docs: List[Union[Dict[str, Any], str]], name: Optional[str] = None, operation_id: Optional[str] = None, run_id: Optional[str] = None, group_name: Optional[str] = None, metadata: Optional[str] = None) -> str:
+        """collection with new docs from `docs` rows"""
+        id = _id()
+        self.collections[id] = self.__collection([self.add_doc(doc) for doc in docs], name, metadata, operation_id, run_id, group_name)
+        return id
+
+    def add_object(self, path: str, data: bytes) -> None:
+        self.objects[path.strip("/")] = data
+
+    def add_scheme(self, name: str, data: Union[Dict[str, Any], str]) -> str:
+        id = _id()
+        self.schemes[id] = {"data": _doc_data(data), "name": name}
+        return id
+
+    def set_result(self, operation_id: str, app_logs: Union[BaseModel, Dict[str, Any], str]) -> None:
+        """finished run result"""
+        if isinstance(app_logs, BaseModel):
+            app_logs = app_logs.model_dump_json()
+        self.results[operation_id] = (time.monotonic(), _doc_data(app_logs))
+
+    def add_dm_stream(self, operation_id: str, run_id: str, bind_id: str, chunks: List[str]) -> None:
+        self.dm_streams[(operation_id, run_id, bind_id)] = chunks
+
+    def set_dm_state(self, operation_id: str, run_id: str, bind_id: str, state: Any) -> None:  # noqa: ANN401
+        self.dm_states[(operation_id, run_id, bind_id)] = state
+
+    def set_dm_journal(self, operation_id: str, run_id: str, key: str, value: Any) -> None:  # noqa: ANN401
+        """list `value` is streamed by items with `stream=true`"""
+        self.dm_journals.setdefault((operation_id, run_id), {})[key] = value
+
+    # docs
+
+    def __doc(self, id: str) -> Dict[str, Any]:
+        doc = self.docs[id]
+        return {"data": doc["data"], "name": doc["name"] or "", "id": id}
+
+    async def __get_docs(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json({"ids": list(self.docs)})
+
+    async def __get_doc_by_id(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["id"] not in self.docs:
+            return _not_found("doc")
+        return _json(self.__doc(vars["id"]))
+
+    async def __get_doc_by_name(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        for id, doc in self.docs.items():
+            if doc["name"] == vars["name"]:
+                return _json(self.__doc(id))
+        return _not_found("doc")
+
+    async def __post_doc(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        doc = json.loads(data)
+        id = vars.get("id", _id())
+        self.docs[id] = {"data": doc["data"], "name": doc.get("name")}
+        return 200, id
+
+    async def __delete_doc_by_id(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if self.docs.pop(vars["id"], None) is None:
+            return _not_found("doc")
+        return 200, ""
+
+    async def __delete_docs(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        self.docs.clear()
+        return 200, ""
+
+    # collections
+
+    def __collection(self, docs: List[str], name: Optional[str], metadata: Optional[str], operation_id: Optional[str] = None, run_id: Optional[str] = None, group_name: Optional[str] = None) -> Dict[str, Any]:
+        return {"docs": docs, "name": name, "metadata": metadata, "scheme": None, "operationId": operation_id, "runId": run_id, "groupName": group_name}
+
+    def __result_collection(self, id: str, offset: int = 0, limit: int = -1) -> Dict[str, Any]:
+        collection = self.collections[id]
+        docs = collection["docs"][offset:] if limit < 0 else collection["docs"][offset:offset + limit]
+        return {
+            "id": id,
+            "name": collection["name"],
+            "docs": [self.__doc(doc_id) for doc_id in docs if doc_id in self.docs],
+            "length": len(collection["docs"]),
+            "metadata": collection["metadata"],
+        }
+
+    def __find_collections(self, vars: Dict[str, str], field: str) -> List[str]:
+        return [id for id, collection in self.collections.items() if collection[field] == vars["name"] and all(vars.get(key) is None or collection[key] == vars[key] for key in ["operationId", "runId"])]
+
+    async def __get_collections(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json({"ownIds": list(self.collections), "sharedIds": []})
+
+    async def __get_collections_by_name(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json({"ownIds": self.__find_collections(vars, "name"), "sharedIds": []})
+
+    async def __get_collection_by_name(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        ids = self.__find_collections(vars, "name")
+        if len(ids) == 0:
+            return _not_found("collection")
+        return _json(self.__result_collection(ids[-1], _int(vars, "offset", 0), _int(vars, "limit", -1)))
+
+    async def __get_collections_ids_by_group_name(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json({"ids": self.__find_collections(vars, "groupName")})
+
+    async def __get_collections_by_group_name(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json({"data": [self.__result_collection(id) for id in self.__find_collections(vars, "groupName")]})
+
+    async def __get_collection_by_id(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["id"] not in self.collections:
+            return _not_found("collection")
+        res = self.__result_collection(vars["id"], _int(vars, "offset", 0), _int(vars, "limit", -1))
+        if _flag(vars, "raw"):
+            return _json([json.loads(doc["data"]) for doc in res["docs"]])
+        return _json(res)
+
+    async def __post_collection(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        collection = json.loads(data)
+        id = vars.get("id", _id())
+        self.collections[id] = self.__collection(collection["data"], collection.get("name"), collection.get("metadata"))
+        return 200, id
+
+    async def __post_collection_by_docs(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        collection = json.loads(data)
+        id = vars.get("id", _id())
+        self.collections[id] = self.__collection([self.add_doc(doc) for doc in collection["data"]], collection.get("name"), collection.get("metadata"))
+        return 200, id
+
+    async def __post_collection_add(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["id"] not in self.collections:
+            return _not_found("collection")
+        self.collections[vars["id"]]["docs"].extend(json.loads(data)["data"])
+        return 200, ""
+
+    async def __delete_collection_docs(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["id"] not in self.collections:
+            return _not_found("collection")
+        removed = set(json.loads(data)["data"])
+        collection = self.collections[vars["id"]]
+        collection["docs"] = [doc for doc in collection["docs"] if doc not in removed]
+        return 200, ""
+
+    async def __post_collection_copy(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["id"] not in self.collections:
+            return _not_found("collection")
+        collection = self.collections[vars["id"]]
+        docs = collection["docs"]
+        if _flag(vars, "fullCopy", True):
+            docs = [self.add_doc(self.docs[doc]["data"], self.docs[doc]["name"]) for doc in docs if doc in self.docs]
+        id = _id()
+        self.collections[id] = {**collection, "docs": list(docs)}
+        return 200, id
+
+    async def __post_collection_apply_scheme(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        code, id = await self.__post_collection_copy(vars, None)
+        if code == 200:
+            self.collections[id]["scheme"] = json.loads(data)["schemeName"]
+        return code, id
+
+    async def __post_collection_fix_scheme(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["id"] not in self.collections:
+            return _not_found("collection")
+        self.collections[vars["id"]]["scheme"] = None if data is None else json.loads(data)["schemeName"]
+        return 200, ""
+
+    async def __post_collection_metadata(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["id"] not in self.collections:
+            return _not_found("collection")
+        self.collections[vars["id"]]["metadata"] = json.loads(data).get("data")
+        return 200, ""
+
+    async def __delete_collection_by_id(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if self.collections.pop(vars["id"], None) is None:
+            return _not_found("collection")
+        return 200, ""
+
+    async def __delete_collections(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        self.collections.clear()
+        return 200, ""
+
+    # collection objects
+
+    async def __get_collection_objects(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        prefix = vars.get("path", "").strip("/")
+        prefix = f"{prefix}/" if prefix else ""
+        recursive = _flag(vars, "recursive")
+        files, directories = {}, set()
+        for path, content in self.objects.items():
+            if not path.startswith(prefix):
+                continue
+            name = path[len(prefix):]
+            if not recursive and "/" in name:
+                directories.add(name.split("/", 1)[0])
+            else:
+                files[name] = len(content)
+        return _json({"files": files, "directories": sorted(directories)})
+
+    async def __get_collection_object(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        content = self.objects.get(vars["path"].strip("/"))
+        if content is None:
+            return _not_found("collection object")
+        return 200, content
+
+    async def __post_collection_object(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        self.objects[vars["path"].strip("/")] = b"" if data is None else data
+        return 200, ""
+
+    async def __delete_collection_object(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if self.objects.pop(vars["path"].strip("/"), None) is None:
+            return _not_found("collection object")
+        return 200, ""
+
+    async def __delete_collection_objects(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        self.objects.clear()
+        return 200, ""
+
+    async def __presign(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        signature = _id()
+        self.signatures[signature] = vars["path"]
+        return 200, signature
+
+    async def __get_presigned(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["signature"] not in self.signatures:
+            return _not_found("signature")
+        return await self.__get_collection_object({"path": self.signatures[vars["signature"]]}, None)
+
+    async def __post_presigned(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if vars["signature"] not in self.signatures:
+            return _not_found("signature")
+        return await self.__post_collection_object({"path": self.signatures[vars["signature"]]}, data)
+
+    # schemes
+
+    def __scheme_id(self, id_or_name: str) -> Optional[str]:
+        if id_or_name in self.schemes:
+            return id_or_name
+        for id, scheme in self.schemes.items():
+            if scheme["name"] == id_or_name:
+                return id
+        return None
+
+    async def __get_schemes(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json({"ownIds": list(self.schemes), "sharedIds": []})
+
+    async def __get_scheme_by_id(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        id = self.__scheme_id(vars["id"])
+        if id is None:
+            return _not_found("scheme")
+        return _json({**self.schemes[id], "id": id})
+
+    async def __get_scheme_raw_by_id(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        id = self.__scheme_id(vars["id"])
+        if id is None:
+            return _not_found("scheme")
+        return 200, self.schemes[id]["data"]
+
+    async def __post_scheme(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        scheme = json.loads(data)
+        id = (self.__scheme_id(vars["id"]) or vars["id"]) if "id" in vars else _id()
+        self.schemes[id] = {"data": scheme["data"], "name": scheme["name"]}
+        return 200, id
+
+    async def __delete_scheme_by_id(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        id = self.__scheme_id(vars["id"])
+        if id is None:
+            return _not_found("scheme")
+        del self.schemes[id]
+        return 200, ""
+
+    async def __delete_schemes(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        self.schemes.clear()
+        return 200, ""
+
+    # user apps, tasks, pipelines, cfgs
+
+    def __user_handlers(self, kind: str) -> Dict[str, Handler]:
+        _, field = _USER_KINDS[kind]
+        entities = lambda: self.user[kind]
+        real_ids = lambda: {real_id: id for id, (real_id, _) in entities().items()}
+        ids = lambda values: {"ownIds": values, "sharedIds": []} if kind == "App" else {"ids": values}
+
+        def body(id: str) -> Result:
+            real_id, data = entities()[id]
+            if kind == "Cfg":
+                return _json({"data": data["cfg"], "cfgId": id, "id": real_id})
+            return _json(data)
+
+        async def get_all(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            return _json(ids(list(entities())))
+
+        async def get_all_real(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            return _json(ids([real_id for real_id, _ in entities().values()]))
+
+        async def get_map_ids(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            return _json(ids([{"id": id, "realId": real_id} for id, (real_id, _) in entities().items()]))
+
+        async def get_map_id(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            if vars["id"] not in entities():
+                return _not_found(kind)
+            return 200, entities()[vars["id"]][0]
+
+        async def get_by_id(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            if vars["id"] not in entities():
+                return _not_found(kind)
+            return body(vars["id"])
+
+        async def get_by_real_id(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            id = real_ids().get(vars["id"])
+            if id is None:
+                return _not_found(kind)
+            return body(id)
+
+        async def post(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            entity = json.loads(data)
+            id = vars.get("id", entity[field])
+            real_id = entities()[id][0] if id in entities() else _id()
+            entities()[id] = (real_id, entity)
+            return 200, real_id
+
+        async def delete(vars: Dict[str, str], data: Optional[bytes]) -> Result:
+            if "id" not in vars:
+                entities().clear()
+            elif entities().pop(vars["id"], None) is None:
+                return _not_found(kind)
+            return 200, ""
+
+        return {
+            f"get{kind}s": get_all,
+            f"get{kind}sReal": get_all_real,
+            f"get{kind}sMapIds": get_map_ids,
+            f"get{kind}sMapIdsById": get_map_id,
+            f"get{kind}ById": get_by_id,
+            f"get{kind}ByRealId": get_by_real_id,
+            f"post{kind}": post,
+            f"post{kind}ById": post,
+            f"delete{kind}s": delete,
+            f"delete{kind}ById": delete,
+        }
+
+    # runs
+
+    async def __run(self, operation_id: str, data: Dict[str, Any], wait: bool) -> Result:
+        result = json.dumps(self.on_run(operation_id, data))
+        self.results[operation_id] = (time.monotonic() + self.operation_latency, result)
+        self.run_ids[operation_id] = data.get("runId") or operation_id
+        if not wait:
+            return 200, operation_id
+        await asyncio.sleep(self.operation_latency)
+        return 200, result
+
+    async def __send_task(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        task = json.loads(data)
+        operation_id = _id()
+        self.operations[operation_id] = task
+        if not task.get("run", True):
+            return _json({"operationId": operation_id}) if _flag(vars, "wait") else (200, operation_id)
+        return await self.__run(operation_id, task, _flag(vars, "wait"))
+
+    async def __send_task_run(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        run = json.loads(data)
+        if run["operationId"] not in self.operations:
+            return _not_found("operation")
+        return await self.__run(run["operationId"], run, _flag(vars, "wait", run.get("withLogs", False)))
+
+    async def __send_pipeline(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        pipeline = json.loads(data)
+        operation_id = _id()
+        self.operations[operation_id] = pipeline
+        return await self.__run(operation_id, pipeline, _flag(vars, "wait"))
+
+    async def __send_task_stop(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        operation_id = json.loads(data)["operationId"]
+        if self.operations.pop(operation_id, None) is None:
+            return _not_found("operation")
+        return 200, operation_id
+
+    async def __send_task_stop_all(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        operation_ids = list(self.operations)
+        self.operations.clear()
+        return _json(operation_ids)
+
+    async def __ok(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return 200, ""
+
+    async def __get_operation_results(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json({"ids": list(self.results)})
+
+    async def __get_operation_result(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        ready, result = self.results.get(vars["id"], (None, None))
+        if ready is None or ready > time.monotonic():
+            return _not_found("operation result")
+        return 200, result
+
+    async def __get_statuses(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        operation_id = vars["operationId"]
+        if operation_id not in self.operations:
+            return _not_found("operation")
+        ready, _ = self.results.get(operation_id, (None, None))
+        if ready is None:
+            return _json({"data": {}})
+        return _json({"data": {self.run_ids.get(operation_id, operation_id): "IN_PROGRESS" if ready > time.monotonic() else "SUCCESS"}})
+
+    async def __delete_operation_result(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        if "id" not in vars:
+            self.results.clear()
+        elif self.results.pop(vars["id"], None) is None:
+            return _not_found("operation result")
+        return 200, ""
+
+    # batch
+
+    async def __batch(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        """stages in order, operations after its dependencies, placeholders replaced by dependencies results"""
+        operations = json.loads(data)["data"]
+        results: Dict[str, Tuple[int, str]] = {}
+        for stage in sorted({operation.get("stage", 0) for operation in operations}):
+            pending = [operation for operation in operations if operation.get("stage", 0) == stage]
+            while len(pending) > 0:
+                ready = [operation for operation in pending if all(dep in results for dep in operation.get("dependencies", []))]
+                if len(ready) == 0:
+                    for operation in pending:
+                        results[operation["alias"]] = (400, "wrong dependencies")
+                    break
+                for operation in ready:
+                    pending.remove(operation)
+                    results[operation["alias"]] = await self.__batch_operation(operation, results)
+        return _json({"data": [{"alias": operation["alias"], "data": results[operation["alias"]][1], "code": results[operation["alias"]][0]} for operation in operations]})
+
+    async def __batch_operation(self, operation: Dict[str, Any], results: Dict[str, Tuple[int, str]]) -> Tuple[int, str]:
+        if any(results[dep][0] >= 400 for dep in operation.get("dependencies", [])):
+            return 424, "dependency failed"
+        handler = self.__handlers.get(operation["type"])
+        if handler is None:
+            return 404, f"operation {operation['type']} not supported by FakeCore"
+        data = operation.get("data")
+        vars = {k: v for k, v in operation.get("vars", {}).items() if v != "None"}
+        for placeholder, alias in operation.get("placeholders", {}).items():
+            value = results[alias][1]
+            data = None if data is None else data.replace(placeholder, value)
+            vars = {k: v.replace(placeholder, value) for k, v in vars.items()}
+        try:
+            code, body = await handler(vars, None if data is None else data.encode("utf-8"))
+        except Exception as ex:
+            return 400, repr(ex)
+        if isinstance(body, list):
+            body = "".join(body)
+        return code, body.decode("utf-8", errors="replace") if isinstance(body, bytes) else body
+
+    # dm
+
+    async def __dm_stream(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        chunks = self.dm_streams.get((vars["operationId"], vars["runId"], vars["bindId"]))
+        if chunks is None:
+            return _not_found("stream")
+        return 200, chunks
+
+    async def __dm_continue(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        self.dm_continued[(vars["operationId"], vars["runId"], vars["id"])] = "" if data is None else data.decode("utf-8")
+        return 200, ""
+
+    async def __dm_state(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        key = (vars["operationId"], vars["runId"], vars["bindId"])
+        if key not in self.dm_states:
+            return _not_found("state")
+        state = self.dm_states[key]
+        try:
+            if "key" in vars:
+                state = state[vars["key"]]
+            if "index" in vars:
+                state = state[int(vars["index"])]
+        except (KeyError, IndexError, TypeError):
+            return _not_found("state")
+        return _json(state)
+
+    async def __dm_journal_list(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        return _json(list(self.dm_journals.get((vars["operationId"], vars["runId"]), {})))
+
+    async def __dm_journal(self, vars: Dict[str, str], data: Optional[bytes]) -> Result:
+        journal = self.dm_journals.get((vars["operationId"], vars["runId"]), {})
+        if vars["key"] not in journal:
+            return _not_found("journal")
+        value = journal[vars["key"]]
+        if _flag(vars, "stream") and isinstance(value, list):
+            return 200, [item if isinstance(item, str) else json.dumps(item) for item in value]
+        return _json(value)
+
+    # server
+
+    def __register(self) -> None:
+        def route(method: str, path: str, name: str, handler: Handler) -> None:
+            self.__handlers[name] = handler
+            self.__routes.append((method, path, name))
+
+        core = "/api/v1"
+        route("GET", "/", "home", self.__ok)
+        route("GET", "/ping", "ping", self.__ok)
+
+        route("GET", f"{core}/docs", "getDocs", self.__get_docs)
+        route("GET", f"{core}/docs/name/{{name}}", "getDocByName", self.__get_doc_by_name)
+        route("GET", f"{core}/docs/{{id}}", "getDocById", self.__get_doc_by_id)
+        route("POST", f"{core}/docs", "postDoc", self.__post_doc)
+        route("POST", f"{core}/docs/{{id}}", "postDocById", self.__post_doc)
+        route("DELETE", f"{core}/docs", "deleteDocs", self.__delete_docs)
+        route("DELETE", f"{core}/docs/{{id}}", "deleteDocById", self.__delete_doc_by_id)
+
+        route("GET", f"{core}/collections", "getCollections", self.__get_collections)
+        route("GET", f"{core}/collections/ids/name/{{name}}", "getCollectionsByNameAndOperationId", self.__get_collections_by_name)
+        route("GET", f"{core}/collections/name/{{name}}", "getCollectionByName", self.__get_collection_by_name)
+        route("GET", f"{core}/collections/ids/groupName/{{name}}", "getCollectionsIdsByGroupName", self.__get_collections_ids_by_group_name)
+        route("GET", f"{core}/collections/groupName/{{name}}", "getCollectionsByGroupName", self.__get_collections_by_group_name)
+        route("GET", f"{core}/collections/{{id}}", "getCollectionById", self.__get_collection_by_id)
+        route("POST", f"{core}/collections", "postCollection", self.__post_collection)
+        route("POST", f"{core}/collections/data", "postCollectionByDocs", self.__post_collection_by_docs)
+        route("POST", f"{core}/collections/data/{{id}}", "postCollectionByDocsAndId", self.__post_collection_by_docs)
+        route("POST", f"{core}/collections/{{id}}", "postCollectionById", self.__post_collection)
+        route("POST", f"{core}/collections/{{id}}/add", "postCollectionByIdAdd", self.__post_collection_add)
+        route("POST", f"{core}/collections/{{id}}/copy", "postCollectionByIdCopy", self.__post_collection_copy)
+        route("POST", f"{core}/collections/{{id}}/applyScheme", "postCollectionApplyScheme", self.__post_collection_apply_scheme)
+        route("POST", f"{core}/collections/{{id}}/fixScheme", "postCollectionFixScheme", self.__post_collection_fix_scheme)
+        route("POST", f"{core}/collections/{{id}}/unfixScheme", "postCollectionUnfixScheme", self.__post_collection_fix_scheme)
+        route("POST", f"{core}/collections/{{id}}/metadata", "postCollectionMetadata", self.__post_collection_metadata)
+        route("DELETE", f"{core}/collections", "deleteCollections", self.__delete_collections)
+        route("DELETE", f"{core}/collections/{{id}}/del", "deleteCollectionByIdDel", self.__delete_collection_docs)
+        route("DELETE", f"{core}/collections/{{id}}", "deleteCollectionById", self.__delete_collection_by_id)
+
+        route("GET", f"{core}/collectionObjects/all", "getCollectionObjects", self.__get_collection_objects)
+        route("GET", f"{core}/collectionObjects/presign/put", "presignCollectionObject", self.__presign)
+        route("GET", f"{core}/collectionObjects/presign/get", "presignGetCollectionObject", self.__presign)
+        route("GET", f"{core}/collectionObjects/presign", "getPresignCollectionObject", self.__get_presigned)
+        route("POST", f"{core}/collectionObjects/presign", "postPresignCollectionObject", self.__post_presigned)
+        route("GET", f"{core}/collectionObjects", "getCollectionObject", self.__get_collection_object)
+        route("POST", f"{core}/collectionObjects", "postCollectionObject", self.__post_collection_object)
+        route("DELETE", f"{core}/collectionObjects/all", "deleteCollectionObjects", self.__delete_collection_objects)
+        route("DELETE", f"{core}/collectionObjects", "deleteCollectionObjectByPath", self.__delete_collection_object)
+
+        route("GET", f"{core}/schemes", "getSchemes", self.__get_schemes)
+        route("GET", f"{core}/schemes/{{id}}/raw", "getSchemeRawById", self.__get_scheme_raw_by_id)
+        route("GET", f"{core}/schemes/{{id}}", "getSchemeById", self.__get_scheme_by_id)
+        route("POST", f"{core}/schemes", "postScheme", self.__post_scheme)
+        route("POST", f"{core}/schemes/{{id}}", "postSchemeById", self.__post_scheme)
+        route("DELETE", f"{core}/schemes", "deleteSchemes", self.__delete_schemes)
+        route("DELETE", f"{core}/schemes/{{id}}", "deleteSchemeById", self.__delete_scheme_by_id)
+
+        for kind, (prefix, _) in _USER_KINDS.items():
+            handlers = self.__user_handlers(kind)
+            route("GET", f"{core}/{prefix}", f"get{kind}s", handlers[f"get{kind}s"])
+            route("GET", f"{core}/{prefix}/realIds", f"get{kind}sReal", handlers[f"get{kind}sReal"])
+            route("GET", f"{core}/{prefix}/mapIds", f"get{kind}sMapIds", handlers[f"get{kind}sMapIds"])
+            route("GET", f"{core}/{prefix}/mapIds/{{id}}", f"get{kind}sMapIdsById", handlers[f"get{kind}sMapIdsById"])
+            route("GET", f"{core}/{prefix}/realIds/{{id}}", f"get{kind}ByRealId", handlers[f"get{kind}ByRealId"])
+            route("GET", f"{core}/{prefix}/{{id}}", f"get{kind}ById", handlers[f"get{kind}ById"])
+            route("POST", f"{core}/{prefix}", f"post{kind}", handlers[f"post{kind}"])
+            route("POST", f"{core}/{prefix}/{{id}}", f"post{kind}ById", handlers[f"post{kind}ById"])
+            route("DELETE", f"{core}/{prefix}", f"delete{kind}s", handlers[f"delete{kind}s"])
+            route("DELETE", f"{core}/{prefix}/{{id}}", f"delete{kind}ById", handlers[f"delete{kind}ById"])
+
+        route("POST", f"{core}/manager/task", "sendTask", self.__send_task)
+        route("POST", f"{core}/manager/task/run", "sendTaskRun", self.__send_task_run)
+        route("POST", f"{core}/manager/pipeline", "sendPipeline", self.__send_pipeline)
+        route("POST", f"{core}/manager/task/stop", "sendTaskStop", self.__send_task_stop)
+        route("POST", f"{core}/manager/task/stopAll", "sendTaskStopAll", self.__send_task_stop_all)
+        route("POST", f"{core}/manager/task/unschedule", "sendTaskUnschedule", self.__ok)
+        route("POST", f"{core}/manager/task/pause", "sendTaskPause", self.__ok)
+        route("POST", f"{core}/manager/task/resume", "sendTaskResume", self.__ok)
+        route("POST", f"{core}/manager/app/stop", "sendAppStop", self.__ok)
+        route("POST", f"{core}/manager/app/pause", "sendAppPause", self.__ok)
+        route("POST", f"{core}/manager/app/resume", "sendAppResume", self.__ok)
+        route("GET", f"{core}/operationResults", "getOperationResults", self.__get_operation_results)
+        route("GET", f"{core}/operationResults/{{id}}", "getOperationResultById", self.__get_operation_result)
+        route("DELETE", f"{core}/operationResults", "deleteOperationResults", self.__delete_operation_result)
+        route("DELETE", f"{core}/operationResults/{{id}}", "deleteOperationResultById", self.__delete_operation_result)
+
+        route("GET", f"{core}/run/statuses/{{operationId}}", "getStatuses", self.__get_statuses)
+
+        route("POST", f"{core}/batch", "batch", self.__batch)
+
+        route("GET", "/stream/{operationId}/{runId}/{bindId}", "dmStream", self.__dm_stream)
+        route("POST", "/continue/{operationId}/{runId}/{id}", "dmContinue", self.__dm_continue)
+        route("GET", "/state/{operationId}/{runId}/{bindId}", "dmState", self.__dm_state)
+        route("GET", "/journal/{operationId}/{runId}", "dmJournalList", self.__dm_journal_list)
+        route("GET", "/journal/{operationId}/{runId}/{key}", "dmJournal", self.__dm_journal)
+
+    def __fault(self, name: Optional[str]) -> Optional[Fault]:
+        fault = self.faults.get(name, self.faults.get(None))
+        if fault is None or fault.times == 0 or random.random() >= fault.rate:
+            return None
+        if fault.times is not None:
+            fault.times -= 1
+        return fault
+
+    def __app(self) -> web.Application:
+        @web.middleware
+        async def inject(request: web.Request, handler: Callable) -> web.StreamResponse:
+            name = route_name(request.path_qs.lstrip("/"))
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.headers[name] = dict(request.headers)
+            delay = self.latency.get(name, self.latency.get(None, 0))
+            if delay > 0:
+                await asyncio.sleep(delay)
+            fault = self.__fault(name)
+            if fault is not None:
+                if fault.applied:
+                    await handler(request)
+                return web.Response(status=fault.status, text=fault.body, headers=fault.headers)
+            return await handler(request)
+
+        def http(handler: Handler) -> Callable[[web.Request], Awaitable[web.StreamResponse]]:
+            async def serve(request: web.Request) -> web.StreamResponse:
+                vars = {**request.query, **request.match_info}
+                data = await request.read() if request.can_read_body else None
+                try:
+                    code, body = await handler(vars, data)
+                except Exception as ex:
+                    return web.Response(status=400, text=repr(ex))
+                if not isinstance(body, list):
+                    return web.Response(status=code, body=body.encode("utf-8") if isinstance(body, str) else body)
+                response = web.StreamResponse(status=code)
+                response.enable_chunked_encoding()
+                await response.prepare(request)
+                for chunk in body:
+                    await response.write(chunk.encode("utf-8"))
+                await response.write_eof()
+                return response
+            return serve
+
+        app = web.Application(client_max_size=1024 ** 3, middlewares=[inject])
+        for method, path, name in self.__routes:
+            app.router.add_route(method, path, http(self.__handlers[name]), name=name)
+        return app
+
+    def start(self) -> "FakeCore":
+        """serve in background thread"""
+        assert self.__loop is None, "already started"
+
+        async def serve() -> None:
+            self.__runner = web.AppRunner(self.__app(), access_log=None)
+            await self.__runner.setup()
+            if self.__socket_path is not None:
+                site = web.UnixSite(self.__runner, self.__socket_path)
+                await site.start()
+                self.url = "http://localhost/"
+            else:
+                site = web.TCPSite(self.__runner, self.__host, self.__port)
+                await site.start()
+                port = site._server.sockets[0].getsockname()[1]
+                self.url = f"http://{self.__host}:{port}/"
+
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target=self.__loop.run_forever, name="FakeCore", daemon=True)
+        self.__thread.start()
+        asyncio.run_coroutine_threadsafe(serve(), self.__loop).result()
+        return self
+
+    def stop(self) -> None:
+        if self.__loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.__runner.cleanup(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+        self.__loop = None
+        self.url = None
+
+    @property
+    def socket_path(self) -> Optional[str]:
+        """unix socket, clients should connect with `aiohttp.UnixConnector` or similar"""
+        return self.__socket_path
+
+    def __enter__(self) -> "FakeCore":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
@@ -3,18 +3,38 @@ import json
 import os
 import re
 import subprocess
-from typing import Coroutine, Literal, Type, Union, overload
-
-import pandas as pd
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Literal,
+    Type,
+    Union,
+    overload,
+)
 
+import malevich_coretools.funcs.arrow as fa
+import malevich_coretools.funcs.bulk as fb
 import malevich_coretools.funcs.funcs as f
 import malevich_coretools.funcs.helpers as fh
+import malevich_coretools.funcs.paging as fp
 from malevich_coretools.abstract import *  # noqa: F403
 from malevich_coretools.batch import (  # noqa: F401
     Batcher,
     BatcherRaiseOption,
     DefferOperation,
 )
+from malevich_coretools.funcs.arrow import COLLECTION_OBJECT_KEY  # noqa: F401
+from malevich_coretools.funcs.bulk import BulkResult
+from malevich_coretools.funcs.cache import (  # noqa: F401
+    DEFAULT_CACHE_TTLS,
+    CacheStats,
+    ResponseCache,
+)
 from malevich_coretools.funcs.helpers import (  # noqa: F401
     base_settings,
     create_app_settings,
@@ -28,13 +48,46 @@ from malevich_coretools.funcs.helpers import (  # noqa: F401
     raw_collection_from_df,
     raw_collection_from_file,
 )
+from malevich_coretools.funcs.limits import DEFAULT_LANE, RateLimits, lane  # noqa: F401
+from malevich_coretools.funcs.loop import background_loop
+from malevich_coretools.funcs.paging import PagePolicy
+from malevich_coretools.funcs.sessions import async_sessions, sync_sessions
+from malevich_coretools.funcs.transport import (  # noqa: F401
+    CircuitOpenError,
+    RequestPolicy,
+    _body_compressor,
+    compressor,
+    request_policy,
+)
+from malevich_coretools.funcs.upload import UploadPolicy
+from malevich_coretools.funcs.wait import OperationEvent, WaitPolicy
 from malevich_coretools.secondary import Config, to_json
+from malevich_coretools.secondary.codec import (  # noqa: F401
+    Codec,
+    codec_by_name,
+    current_codec,
+)
 from malevich_coretools.secondary.const import (
     POSSIBLE_APPS_PLATFORMS,
     SCHEME_PATTERN,
     WAIT_RESULT_TIMEOUT,
 )
 from malevich_coretools.secondary.helpers import rand_str
+from malevich_coretools.secondary.metrics import (  # noqa: F401
+    CodecEvent,
+    MetricsRegistry,
+    RequestEvent,
+    RouteMetrics,
+)
+from malevich_coretools.secondary.tracing import (  # noqa: F401
+    JsonLinesExporter,
+    Span,
+    span,
+    traced,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 __unique_digest_substring = "@sha256:"
 
@@ -94,6 +147,175 @@ def update_core_credentials(username: USERNAME, password: PASSWORD) -> None:
     Config.CORE_PASSWORD = password
 
 
+def set_pool_size(pool_size: int) -> None:
+    """set max kept-alive connections per host, applies to new sessions"""
+    assert pool_size > 0, "pool size should be positive"
+    Config.POOL_SIZE = pool_size
+    close_sessions()
+
+
+def set_keep_alive(keep_alive: bool) -> None:
+    """set reuse connections between requests or not, applies to new sessions"""
+    Config.KEEP_ALIVE = keep_alive
+    close_sessions()
+
+
+def set_request_policy(policy: Optional[RequestPolicy]) -> None:
+    """set timeouts, retries and circuit breaker for all requests, None - default; override for some calls with `request_policy` context"""
+    Config.REQUEST_POLICY = policy
+
+
+def set_compression(algorithm: Optional[str], threshold: Optional[int] = None) -> None:
+    """compress request bodies not less than `threshold` bytes with `algorithm` ("gzip" or "zstd", gzip if zstd is not installed), None - disable; compressed responses are always accepted"""
+    if algorithm is not None:
+        _body_compressor(algorithm)
+    Config.COMPRESSION = algorithm
+    if threshold is not None:
+        assert threshold >= 0, "wrong threshold"
+        Config.COMPRESSION_THRESHOLD = threshold
+
+
+def set_single_flight(single_flight: bool) -> None:
+    """collapse concurrent identical GET requests to core (by host, auth and path) into one, sync (between threads) and async (in event loop)"""
+    Config.SINGLE_FLIGHT = single_flight
+
+
+def set_sync_via_loop(sync_via_loop: bool) -> None:
+    """send sync requests by async implementation in one background event loop thread: all threads share its connection pool"""
+    Config.SYNC_VIA_LOOP = sync_via_loop
+
+
+def set_wait_policy(policy: Optional[WaitPolicy]) -> None:
+    """set polling intervals and kafka push for waiting long operation results, None - default"""
+    Config.WAIT_POLICY = policy
+
+
+def set_page_policy(policy: Optional[PagePolicy]) -> None:
+    """set page size, concurrency and memory budget for paged collection fetch (`paged=True`), None - default"""
+    Config.PAGE_POLICY = policy
+
+
+def set_upload_policy(policy: Optional[UploadPolicy]) -> None:
+    """set chunk size, concurrency and retries for chunked collection upload (`chunked=True`), None - default"""
+    Config.UPLOAD_POLICY = policy
+
+
+def set_cache(cache: Optional[ResponseCache]) -> None:
+    """cache responses of slow-changing core GET endpoints, e.g. `set_cache(ResponseCache())`, None - disable"""
+    Config.CACHE = cache
+
+
+def set_rate_limits(limits: Optional[Union[RateLimits, Dict[str, RateLimits]]]) -> None:
+    """limit requests to each host (core and dm): `RateLimits` for all requests or by lane name (set with `lane` context, "default" - for others), None - unlimited"""
+    if isinstance(limits, RateLimits):
+        limits = {DEFAULT_LANE: limits}
+    Config.RATE_LIMITS = limits
+
+
+def add_metrics_listener(listener: Callable[[Union[RequestEvent, CodecEvent]], None]) -> None:
+    """call `listener` after each request and body encoding/decoding, e.g. `MetricsRegistry()`"""
+    if listener not in Config.METRICS_LISTENERS:
+        Config.METRICS_LISTENERS = [*Config.METRICS_LISTENERS, listener]
+
+
+def remove_metrics_listener(listener: Callable[[Union[RequestEvent, CodecEvent]], None]) -> None:
+    Config.METRICS_LISTENERS = [x for x in Config.METRICS_LISTENERS if x is not listener]
+
+
+def add_span_exporter(exporter: Callable[[Span], None]) -> None:
+    """enable tracing: run, task and pipeline calls, Batcher commits and `span` blocks are exported to `exporter` (e.g. `JsonLinesExporter(path)`), their requests send `traceparent` header"""
+    if exporter not in Config.SPAN_EXPORTERS:
+        Config.SPAN_EXPORTERS = [*Config.SPAN_EXPORTERS, exporter]
+
+
+def remove_span_exporter(exporter: Callable[[Span], None]) -> None:
+    Config.SPAN_EXPORTERS = [x for x in Config.SPAN_EXPORTERS if x is not exporter]
+
+
+def set_codec(codec: Union[str, Codec]) -> None:
+    """set json codec for request and response bodies: `json` (default), `orjson`, `msgspec` or custom `Codec`"""
+    if isinstance(codec, str):
+        codec = codec_by_name(codec)
+    Config.CODEC = codec
+
+
+def close_sessions() -> None:
+    """close pooled connections of sync requests (and background event loop with them)"""
+    sync_sessions.close()
+    background_loop.close()
+
+
+async def close_sessions_async() -> None:
+    """close pooled connections of async requests in running event loop, on `asyncio.run` exit they are closed automatically"""
+    await async_sessions.aclose()
+
+
+@overload
+def bulk(
+    fn: Callable,
+    items: Iterable[Any],
+    *,
+    concurrency: int = 16,
+    ordered: bool = True,
+    on_error: Literal["collect", "raise"] = "collect",
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    batch_size: Optional[int] = None,
+    is_async: Literal[False] = False,
+    **kwargs,
+) -> BulkResult:
+    pass
+
+
+@overload
+def bulk(
+    fn: Callable,
+    items: Iterable[Any],
+    *,
+    concurrency: int = 16,
+    ordered: bool = True,
+    on_error: Literal["collect", "raise"] = "collect",
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    batch_size: Optional[int] = None,
+    is_async: Literal[True],
+    **kwargs,
+) -> Coroutine[Any, Any, BulkResult]:
+    pass
+
+
+def bulk(
+    fn: Callable,
+    items: Iterable[Any],
+    *,
+    concurrency: int = 16,
+    ordered: bool = True,
+    on_error: Literal["collect", "raise"] = "collect",
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    batch_size: Optional[int] = None,
+    is_async: bool = False,
+    **kwargs,
+) -> Union[BulkResult, Coroutine[Any, Any, BulkResult]]:
+    """call `fn` for each of `items` with bounded concurrency, e.g. `bulk(delete_collection, ids, conn_url=url)`
+
+    Functions with `is_async` (all api functions) are called with `is_async=True`, other async functions are awaited, sync ones run in threads. Sync call runs in background event loop (shared connection pool)
+
+    Args:
+        fn (Callable): function for one item
+        items (Iterable[Any]): items, taken lazily; tuple item - positional arguments
+        concurrency (int): calls (or batches) at once
+        ordered (bool): results in order of items (None for failed), else successful ones by completion
+        on_error (Literal["collect", "raise"]): collect errors to result or raise first one and cancel others
+        progress (Optional[Callable[[int, Optional[int]], None]]): called with (done items, total items if known)
+        batch_size (Optional[int]): if set and `fn` has `batcher`, items are sent by `Batcher` commits of `batch_size` operations
+        kwargs: passed to each `fn` call, e.g. `auth`, `conn_url`
+
+    Returns:
+        BulkResult: `results` and `errors` (item index -> exception)"""
+    coroutine = fb.bulk_async(fn, items, concurrency=concurrency, ordered=ordered, on_error=on_error, progress=progress, batch_size=batch_size, **kwargs)
+    if is_async:
+        return coroutine
+    return background_loop.run(coroutine)
+
+
 def digest_by_image(
     image_ref: str,
     username: Optional[str] = None,
@@ -549,6 +771,28 @@ def get_collections_by_name(
     )
 
 
+def __get_collection_paged(
+    get_first: Callable[[int, int], Coroutine[Any, Any, ResultCollection]],
+    offset: int,
+    limit: int,
+    paged: Union[bool, PagePolicy],
+    *,
+    auth: Optional[AUTH],
+    conn_url: Optional[str],
+    is_async: bool,
+) -> Union[ResultCollection, Coroutine[Any, Any, ResultCollection]]:
+    coroutine = fp.get_collection_paged_async(
+        get_first,
+        lambda id, offset, limit: f.get_collections_id_async(id, offset, limit, False, auth=auth, conn_url=conn_url),
+        offset,
+        limit,
+        paged if isinstance(paged, PagePolicy) else None,
+    )
+    if is_async:
+        return coroutine
+    return background_loop.run(coroutine)
+
+
 @overload
 def get_collection_by_name(
     name: str,
@@ -560,6 +804,7 @@ def get_collection_by_name(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[False] = False,
 ) -> ResultCollection:
     pass
@@ -576,6 +821,7 @@ def get_collection_by_name(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[True],
 ) -> Coroutine[Any, Any, ResultCollection]:
     pass
@@ -591,14 +837,20 @@ def get_collection_by_name(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: bool = False,
 ) -> Union[ResultCollection, Coroutine[Any, Any, ResultCollection]]:
-    """return collection by `name` and mb also `operation_id` and `run_id` with which it was saved. raise if there are multiple collections, pagination: unlimited - `limit` < 0"""
+    """return collection by `name` and mb also `operation_id` and `run_id` with which it was saved. raise if there are multiple collections, pagination: unlimited - `limit` < 0, `paged` - see `get_collection`"""
     assert not (
         operation_id is None and run_id is not None
     ), "if run_id set, operation_id should be set too"
     if batcher is None:
         batcher = Config.BATCHER
+    if paged is not False and batcher is None:
+        return __get_collection_paged(
+            lambda offset, limit: f.get_collection_name_async(name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url),
+            offset, limit, paged, auth=auth, conn_url=conn_url, is_async=is_async,
+        )
     if batcher is not None:
         return batcher.add("getCollectionByName", vars={"name": name, "operationId": operation_id, "runId": run_id, "offset": offset, "limit": limit}, result_model=ResultCollection)
     if is_async:
@@ -620,6 +872,7 @@ def get_collection(
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
     raw: Literal[False] = False,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[False] = False,
 ) -> ResultCollection:
     pass
@@ -635,6 +888,7 @@ def get_collection(
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
     raw: Literal[False] = False,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[True],
 ) -> Coroutine[Any, Any, ResultCollection]:
     pass
@@ -650,6 +904,7 @@ def get_collection(
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
     raw: Literal[True],
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[False] = False,
 ) -> Alias.Json:
     pass
@@ -665,6 +920,7 @@ def get_collection(
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
     raw: Literal[True],
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[True],
 ) -> Coroutine[Any, Any, Alias.Json]:
     pass
@@ -679,11 +935,17 @@ def get_collection(
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
     raw: bool = False,
+    paged: Union[bool, PagePolicy] = False,
     is_async: bool = False,
 ) -> Union[ResultCollection, Alias.Json, Coroutine[Any, Any, ResultCollection], Coroutine[Any, Any, Alias.Json]]:
-    """return collection by `id`, pagination: unlimited - `limit` < 0"""
+    """return collection by `id`, pagination: unlimited - `limit` < 0, `paged` - by concurrent pages (True or `PagePolicy`, see `set_page_policy`), ignored with `batcher` or `raw` (single request)"""
     if batcher is None:
         batcher = Config.BATCHER
+    if paged is not False and batcher is None and not raw:
+        return __get_collection_paged(
+            lambda offset, limit: f.get_collections_id_async(id, offset, limit, False, auth=auth, conn_url=conn_url),
+            offset, limit, paged, auth=auth, conn_url=conn_url, is_async=is_async,
+        )
     if batcher is not None:
         result_model = None if raw else ResultCollection
         return batcher.add("getCollectionById", vars={"id": id, "offset": offset, "limit": limit, "raw": raw}, result_model=result_model)
@@ -692,6 +954,246 @@ def get_collection(
     return f.get_collections_id(id, offset, limit, raw, auth=auth, conn_url=conn_url)
 
 
+@overload
+def stream_collection(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    rows: bool = False,
+    chunk_size: Optional[int] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Iterator[Union[ResultDoc, Dict[str, Any]]]:
+    pass
+
+
+@overload
+def stream_collection(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    rows: bool = False,
+    chunk_size: Optional[int] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, AsyncIterable[Union[ResultDoc, Dict[str, Any]]]]:
+    pass
+
+
+def stream_collection(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    rows: bool = False,
+    chunk_size: Optional[int] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Iterator[Union[ResultDoc, Dict[str, Any]]], Coroutine[Any, Any, AsyncIterable[Union[ResultDoc, Dict[str, Any]]]]]:
+    """iterate over collection docs by `id` as they are received, body read by `chunk_size` bytes (`Config.STREAM_CHUNK_SIZE` by default); `rows` - yield decoded docs data instead of `ResultDoc`, pagination: unlimited - `limit` < 0"""
+    if is_async:
+        return f.stream_collections_id_async(id, offset, limit, rows, auth=auth, conn_url=conn_url, chunk_size=chunk_size)
+    return f.stream_collections_id(id, offset, limit, rows, auth=auth, conn_url=conn_url, chunk_size=chunk_size)
+
+
+@overload
+def stream_collection_by_name(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    rows: bool = False,
+    chunk_size: Optional[int] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Iterator[Union[ResultDoc, Dict[str, Any]]]:
+    pass
+
+
+@overload
+def stream_collection_by_name(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    rows: bool = False,
+    chunk_size: Optional[int] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, AsyncIterable[Union[ResultDoc, Dict[str, Any]]]]:
+    pass
+
+
+def stream_collection_by_name(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    rows: bool = False,
+    chunk_size: Optional[int] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Iterator[Union[ResultDoc, Dict[str, Any]]], Coroutine[Any, Any, AsyncIterable[Union[ResultDoc, Dict[str, Any]]]]]:
+    """iterate over docs of collection by `name` and mb also `operation_id` and `run_id` as they are received, see `stream_collection`"""
+    assert not (
+        operation_id is None and run_id is not None
+    ), "if run_id set, operation_id should be set too"
+    if is_async:
+        return f.stream_collection_name_async(
+            name, operation_id, run_id, offset, limit, rows, auth=auth, conn_url=conn_url, chunk_size=chunk_size
+        )
+    return f.stream_collection_name(
+        name, operation_id, run_id, offset, limit, rows, auth=auth, conn_url=conn_url, chunk_size=chunk_size
+    )
+
+
+def __iter_collection_pages(
+    get_first: Callable[[int, int], Coroutine[Any, Any, ResultCollection]],
+    offset: int,
+    limit: int,
+    page_size: int,
+    prefetch: int,
+    transform: Callable[[ResultCollection], Any],
+    *,
+    auth: Optional[AUTH],
+    conn_url: Optional[str],
+    is_async: bool,
+) -> Union[Iterator[Any], AsyncIterator[Any]]:
+    pages = fp.iter_collection_pages_async(
+        get_first,
+        lambda id, offset, limit: f.get_collections_id_async(id, offset, limit, False, auth=auth, conn_url=conn_url),
+        offset,
+        limit,
+        page_size,
+        prefetch,
+    )
+    if is_async:
+        async def transformed() -> AsyncIterator[Any]:
+            async for page in pages:
+                yield transform(page)
+        return transformed()
+    return (transform(page) for page in background_loop.iterate(pages, maxsize=1))    # transform in caller thread
+
+
+@overload
+def iter_collection(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Iterator[List[ResultDoc]]:
+    pass
+
+
+@overload
+def iter_collection(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> AsyncIterator[List[ResultDoc]]:
+    pass
+
+
+def iter_collection(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Iterator[List[ResultDoc]], AsyncIterator[List[ResultDoc]]]:
+    """iterate over docs of collection by `id` by pages of `page_size` docs, next `prefetch` pages are requested while current one is processed, memory does not depend on collection size"""
+    return __iter_collection_pages(
+        lambda offset, limit: f.get_collections_id_async(id, offset, limit, False, auth=auth, conn_url=conn_url),
+        offset, limit, page_size, prefetch, lambda page: page.docs, auth=auth, conn_url=conn_url, is_async=is_async,
+    )
+
+
+@overload
+def iter_collection_by_name(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Iterator[List[ResultDoc]]:
+    pass
+
+
+@overload
+def iter_collection_by_name(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> AsyncIterator[List[ResultDoc]]:
+    pass
+
+
+def iter_collection_by_name(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Iterator[List[ResultDoc]], AsyncIterator[List[ResultDoc]]]:
+    """iterate over docs of collection by `name` and mb also `operation_id` and `run_id` by pages, see `iter_collection`"""
+    assert not (
+        operation_id is None and run_id is not None
+    ), "if run_id set, operation_id should be set too"
+    return __iter_collection_pages(
+        lambda offset, limit: f.get_collection_name_async(name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url),
+        offset, limit, page_size, prefetch, lambda page: page.docs, auth=auth, conn_url=conn_url, is_async=is_async,
+    )
+
+
 @overload
 def get_collections_ids_by_group_name(
     group_name: str,
@@ -2210,6 +2712,7 @@ def run_endpoint(
     pass
 
 
+@traced()
 def run_endpoint(
     hash: str,
     endpoint_override: Optional[EndpointOverride] = None,
@@ -6592,6 +7095,170 @@ def get_operation_result(
     return f.get_operationResults_id(id, auth=auth, conn_url=conn_url)
 
 
+@overload
+def wait_operation_result(
+    id: str,
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> str:
+    pass
+
+
+@overload
+def wait_operation_result(
+    id: str,
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, str]:
+    pass
+
+
+def wait_operation_result(
+    id: str,
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[str, Coroutine[Any, Any, str]]:
+    """wait and return result by operation `id`: polls with backoff by `policy` (`set_wait_policy`), woken up by kafka if kafka host port set; `timeout` in seconds, None - unlimited. Cancelled with async task, sync - on interrupt"""
+    if is_async:
+        return f.wait_operationResults_id_async(id, timeout, policy, auth=auth, conn_url=conn_url)
+    return f.wait_operationResults_id(id, timeout, policy, auth=auth, conn_url=conn_url)
+
+
+@overload
+def as_completed(
+    operation_ids: Iterable[str],
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    with_statuses: bool = False,
+    on_event: Optional[Callable[[OperationEvent], None]] = None,
+    batch_size: int = 100,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Iterator[OperationEvent]:
+    pass
+
+
+@overload
+def as_completed(
+    operation_ids: Iterable[str],
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    with_statuses: bool = False,
+    on_event: Optional[Callable[[OperationEvent], None]] = None,
+    batch_size: int = 100,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> AsyncIterator[OperationEvent]:
+    pass
+
+
+def as_completed(
+    operation_ids: Iterable[str],
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    with_statuses: bool = False,
+    on_event: Optional[Callable[[OperationEvent], None]] = None,
+    batch_size: int = 100,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Iterator[OperationEvent], AsyncIterator[OperationEvent]]:
+    """yield finished operations (`OperationEvent` with status SUCCESS or FAILED and `result`) as they finish
+
+    One poller checks all pending operations with batch requests of `batch_size` operations, backoff by `policy` between checks (reset on any status change)
+
+    Args:
+        operation_ids (Iterable[str]): operation ids, e.g. from `task_full(..., wait=False)`
+        timeout (Optional[float]): seconds for all operations, None - unlimited, raise TimeoutError
+        policy (Optional[WaitPolicy]): polling intervals, `set_wait_policy` by default
+        with_statuses (bool): also get runs statuses (IN_PROGRESS events with `statuses`)
+        on_event (Optional[Callable[[OperationEvent], None]]): called on each status change (in background loop thread for sync call)
+        batch_size (int): operations in one batch request
+        auth (Optional[AUTH]): redefined auth if not None"""
+    if is_async:
+        return f.as_completed_operationResults_async(operation_ids, timeout, policy, with_statuses, on_event, batch_size, auth=auth, conn_url=conn_url)
+    return f.as_completed_operationResults(operation_ids, timeout, policy, with_statuses, on_event, batch_size, auth=auth, conn_url=conn_url)
+
+
+async def __wait_many_async(
+    operation_ids: List[str],
+    timeout: Optional[float],
+    **kwargs,
+) -> Dict[str, OperationEvent]:
+    events = {event.operation_id: event async for event in as_completed(operation_ids, timeout, is_async=True, **kwargs)}
+    return {operation_id: events[operation_id] for operation_id in operation_ids}
+
+
+@overload
+def wait_many(
+    operation_ids: Iterable[str],
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    with_statuses: bool = False,
+    on_event: Optional[Callable[[OperationEvent], None]] = None,
+    batch_size: int = 100,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Dict[str, OperationEvent]:
+    pass
+
+
+@overload
+def wait_many(
+    operation_ids: Iterable[str],
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    with_statuses: bool = False,
+    on_event: Optional[Callable[[OperationEvent], None]] = None,
+    batch_size: int = 100,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, Dict[str, OperationEvent]]:
+    pass
+
+
+def wait_many(
+    operation_ids: Iterable[str],
+    timeout: Optional[float] = WAIT_RESULT_TIMEOUT,
+    *,
+    policy: Optional[WaitPolicy] = None,
+    with_statuses: bool = False,
+    on_event: Optional[Callable[[OperationEvent], None]] = None,
+    batch_size: int = 100,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Dict[str, OperationEvent], Coroutine[Any, Any, Dict[str, OperationEvent]]]:
+    """wait all operations, return operation id -> finished `OperationEvent` (check `status`, `result`) in order of `operation_ids`; arguments as in `as_completed`"""
+    operation_ids = list(dict.fromkeys(operation_ids))
+    kwargs = {"policy": policy, "with_statuses": with_statuses, "on_event": on_event, "batch_size": batch_size, "auth": auth, "conn_url": conn_url}
+    if is_async:
+        return __wait_many_async(operation_ids, timeout, **kwargs)
+    events = {event.operation_id: event for event in as_completed(operation_ids, timeout, **kwargs)}
+    return {operation_id: events[operation_id] for operation_id in operation_ids}
+
+
 @overload
 def delete_operations_results(
     wait: bool = True,
@@ -7668,6 +8335,7 @@ def task_full(
     pass
 
 
+@traced()
 def task_full(
     task_id: str,
     cfg_id: str,
@@ -7839,6 +8507,7 @@ def task_prepare(
     pass
 
 
+@traced()
 def task_prepare(
     task_id: str,
     cfg_id: Optional[str] = None,
@@ -8008,6 +8677,7 @@ def task_run(
     pass
 
 
+@traced()
 def task_run(
     operation_id: str,
     cfg_id: Optional[str] = None,
@@ -8150,6 +8820,7 @@ def pipeline_full(
     pass
 
 
+@traced()
 def pipeline_full(
     pipeline_id: str,
     cfg_id: str,
@@ -8313,6 +8984,7 @@ def pipeline_prepare(
     pass
 
 
+@traced()
 def pipeline_prepare(
     pipeline_id: str,
     cfg_id: str,
@@ -8492,6 +9164,7 @@ def task_stop(
     pass
 
 
+@traced()
 def task_stop(
     operation_id: str,
     with_logs: bool = False,
@@ -8559,6 +9232,7 @@ def task_stop_all(
     pass
 
 
+@traced()
 def task_stop_all(
     with_logs: bool = False,
     info_url: Optional[str] = None,
@@ -8613,6 +9287,7 @@ def task_resume(
     pass
 
 
+@traced()
 def task_resume(
     operation_id: str,
     with_show: bool = True,
@@ -8666,6 +9341,7 @@ def task_pause(
     pass
 
 
+@traced()
 def task_pause(
     operation_id: str,
     with_show: bool = True,
@@ -10312,6 +10988,9 @@ def create_collection_from_file(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     is_async: Literal[False] = False,
 ) -> Alias.Id:
     pass
@@ -10326,6 +11005,9 @@ def create_collection_from_file(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     is_async: Literal[True],
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
@@ -10339,12 +11021,15 @@ def create_collection_from_file(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     is_async: bool = False,
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
-    """create collection\n
+    """create collection from csv, jsonl or parquet file (`format` by extension if not set), `chunked` - read and upload by chunks as they are ready (True or `UploadPolicy`), csv parsed in `processes` if set\n
     return collection id"""
     return fh.create_collection_from_file_df(
-        filename, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async
+        filename, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async, chunked=chunked, format=format, processes=processes
     )
 
 
@@ -10358,6 +11043,9 @@ def update_collection_from_file(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     is_async: Literal[False] = False,
 ) -> Alias.Id:
     pass
@@ -10373,6 +11061,9 @@ def update_collection_from_file(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     is_async: Literal[True],
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
@@ -10387,24 +11078,28 @@ def update_collection_from_file(
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
+    format: Optional[str] = None,
+    processes: Optional[int] = None,
     is_async: bool = False,
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
-    """create collection\n
+    """update collection by id from file, see `create_collection_from_file`\n
     return collection id"""
     return fh.update_collection_from_file_df(
-        id, filename, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async
+        id, filename, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async, chunked=chunked, format=format, processes=processes
     )
 
 
 @overload
 def create_collection_from_df(
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str] = None,
     metadata: Optional[Union[Dict[str, Any], str]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
     is_async: Literal[False] = False,
 ) -> Alias.Id:
     pass
@@ -10412,45 +11107,48 @@ def create_collection_from_df(
 
 @overload
 def create_collection_from_df(
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str] = None,
     metadata: Optional[Union[Dict[str, Any], str]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
     is_async: Literal[True],
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
 
 
 def create_collection_from_df(
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str] = None,
     metadata: Optional[Union[Dict[str, Any], str]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
     is_async: bool = False,
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
-    """create collection\n
+    """create collection, `chunked` - by concurrent chunks (True or `UploadPolicy`, see `set_upload_policy`)\n
     return collection id"""
     return fh.create_collection_from_df(
-        data, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async
+        data, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async, chunked=chunked
     )
 
 
 @overload
 def update_collection_from_df(
     id: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str] = None,
     metadata: Optional[Union[Dict[str, Any], str]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
     is_async: Literal[False] = False,
 ) -> Alias.Id:
     pass
@@ -10459,13 +11157,14 @@ def update_collection_from_df(
 @overload
 def update_collection_from_df(
     id: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str] = None,
     metadata: Optional[Union[Dict[str, Any], str]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
     is_async: Literal[True],
 ) -> Coroutine[Any, Any, Alias.Id]:
     pass
@@ -10473,19 +11172,20 @@ def update_collection_from_df(
 
 def update_collection_from_df(
     id: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     name: Optional[str] = None,
     metadata: Optional[Union[Dict[str, Any], str]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    chunked: Union[bool, UploadPolicy] = False,
     is_async: bool = False,
 ) -> Union[Alias.Id, Coroutine[Any, Any, Alias.Id]]:
-    """update collection by id\n
+    """update collection by id, `chunked` - see `create_collection_from_df`\n
     return collection id"""
     return fh.update_collection_from_df(
-        id, data, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async
+        id, data, name, metadata, auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async, chunked=chunked
     )
 
 
@@ -10493,15 +11193,16 @@ async def get_collection_to_df_async(
     id: str,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
-) -> pd.DataFrame:
-    """return df from collection by `id`, pagination: unlimited - `limit` < 0"""
-    collection = await get_collection(id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, is_async=True)
-    records = list(map(lambda x: json.loads(x.data), collection.docs))
-    return pd.DataFrame.from_records(records)
+    paged: Union[bool, PagePolicy] = False,
+) -> "pd.DataFrame":
+    """return df from collection by `id`, pagination: unlimited - `limit` < 0, `dtypes` - column dtypes ("scheme" - by collection scheme)"""
+    collection = await get_collection(id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, paged=paged, is_async=True)
+    return fh.collection_to_df(collection, dtypes)
 
 
 @overload
@@ -10509,12 +11210,14 @@ def get_collection_to_df(
     id: str,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[False] = False,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     pass
 
 
@@ -10523,12 +11226,14 @@ def get_collection_to_df(
     id: str,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[True],
-) -> Coroutine[Any, Any, pd.DataFrame]:
+) -> Coroutine[Any, Any, "pd.DataFrame"]:
     pass
 
 
@@ -10536,18 +11241,19 @@ def get_collection_to_df(
     id: str,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: bool = False,
-) -> Union[pd.DataFrame, Coroutine[Any, Any, pd.DataFrame]]:
-    """return df from collection by `id`, pagination: unlimited - `limit` < 0"""
+) -> Union["pd.DataFrame", Coroutine[Any, Any, "pd.DataFrame"]]:
+    """return df from collection by `id`, pagination: unlimited - `limit` < 0, `dtypes` - column dtypes ("scheme" - by collection scheme)"""
     if is_async:
-        return get_collection_to_df_async(id, offset, limit, conn_url=conn_url, batcher=batcher)
-    collection = get_collection(id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, is_async=False)
-    records = list(map(lambda x: json.loads(x.data), collection.docs))
-    return pd.DataFrame.from_records(records)
+        return get_collection_to_df_async(id, offset, limit, dtypes, auth=auth, conn_url=conn_url, batcher=batcher, paged=paged)
+    collection = get_collection(id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, paged=paged, is_async=False)
+    return fh.collection_to_df(collection, dtypes)
 
 
 async def get_collection_by_name_to_df_async(
@@ -10556,17 +11262,18 @@ async def get_collection_by_name_to_df_async(
     run_id: Optional[str] = None,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
-) -> pd.DataFrame:
-    """return df from collection by `name` and mb also `operation_id` and `run_id` with which it was saved. raise if there are multiple collections, pagination: unlimited - `limit` < 0"""
+    paged: Union[bool, PagePolicy] = False,
+) -> "pd.DataFrame":
+    """return df from collection by `name` and mb also `operation_id` and `run_id` with which it was saved. raise if there are multiple collections, pagination: unlimited - `limit` < 0, `dtypes` - column dtypes ("scheme" - by collection scheme)"""
     collection = await get_collection_by_name(
-        name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, is_async=True
+        name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, paged=paged, is_async=True
     )
-    records = list(map(lambda x: json.loads(x.data), collection.docs))
-    return pd.DataFrame.from_records(records)
+    return fh.collection_to_df(collection, dtypes)
 
 
 @overload
@@ -10576,12 +11283,14 @@ def get_collection_by_name_to_df(
     run_id: Optional[str] = None,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[False] = False,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     pass
 
 
@@ -10592,12 +11301,14 @@ def get_collection_by_name_to_df(
     run_id: Optional[str] = None,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: Literal[True],
-) -> Coroutine[Any, Any, pd.DataFrame]:
+) -> Coroutine[Any, Any, "pd.DataFrame"]:
     pass
 
 
@@ -10607,22 +11318,134 @@ def get_collection_by_name_to_df(
     run_id: Optional[str] = None,
     offset: int = 0,
     limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
+    paged: Union[bool, PagePolicy] = False,
     is_async: bool = False,
-) -> Union[pd.DataFrame, Coroutine[Any, Any, pd.DataFrame]]:
-    """return df from collection by `name` and mb also `operation_id` and `run_id` with which it was saved. raise if there are multiple collections, pagination: unlimited - `limit` < 0"""
+) -> Union["pd.DataFrame", Coroutine[Any, Any, "pd.DataFrame"]]:
+    """return df from collection by `name` and mb also `operation_id` and `run_id` with which it was saved. raise if there are multiple collections, pagination: unlimited - `limit` < 0, `dtypes` - column dtypes ("scheme" - by collection scheme)"""
     if is_async:
         return get_collection_by_name_to_df_async(
-            name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher
+            name, operation_id, run_id, offset, limit, dtypes, auth=auth, conn_url=conn_url, batcher=batcher, paged=paged
         )
     collection = get_collection_by_name(
-        name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, is_async=False
+        name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url, batcher=batcher, paged=paged, is_async=False
+    )
+    return fh.collection_to_df(collection, dtypes)
+
+
+@overload
+def iter_collection_df(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Iterator["pd.DataFrame"]:
+    pass
+
+
+@overload
+def iter_collection_df(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> AsyncIterator["pd.DataFrame"]:
+    pass
+
+
+def iter_collection_df(
+    id: str,
+    offset: int = 0,
+    limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Iterator["pd.DataFrame"], AsyncIterator["pd.DataFrame"]]:
+    """iterate over collection by `id` as df chunks of `page_size` rows, see `iter_collection` and `get_collection_to_df`"""
+    return __iter_collection_pages(
+        lambda offset, limit: f.get_collections_id_async(id, offset, limit, False, auth=auth, conn_url=conn_url),
+        offset, limit, page_size, prefetch, lambda page: fh.collection_to_df(page, dtypes), auth=auth, conn_url=conn_url, is_async=is_async,
+    )
+
+
+@overload
+def iter_collection_by_name_df(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Iterator["pd.DataFrame"]:
+    pass
+
+
+@overload
+def iter_collection_by_name_df(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> AsyncIterator["pd.DataFrame"]:
+    pass
+
+
+def iter_collection_by_name_df(
+    name: str,
+    operation_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = -1,
+    dtypes: Optional[Union[Dict[str, Any], Literal["scheme"]]] = None,
+    *,
+    page_size: int = 10_000,
+    prefetch: int = 1,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Iterator["pd.DataFrame"], AsyncIterator["pd.DataFrame"]]:
+    """iterate over collection by `name` and mb also `operation_id` and `run_id` as df chunks of `page_size` rows, see `iter_collection_df`"""
+    assert not (
+        operation_id is None and run_id is not None
+    ), "if run_id set, operation_id should be set too"
+    return __iter_collection_pages(
+        lambda offset, limit: f.get_collection_name_async(name, operation_id, run_id, offset, limit, auth=auth, conn_url=conn_url),
+        offset, limit, page_size, prefetch, lambda page: fh.collection_to_df(page, dtypes), auth=auth, conn_url=conn_url, is_async=is_async,
     )
-    records = list(map(lambda x: json.loads(x.data), collection.docs))
-    return pd.DataFrame.from_records(records)
 
 
 @overload
@@ -10669,7 +11492,7 @@ def update_collection_object_from_file(
 @overload
 def update_collection_object_from_df(
     path: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
@@ -10682,7 +11505,7 @@ def update_collection_object_from_df(
 @overload
 def update_collection_object_from_df(
     path: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
@@ -10694,17 +11517,213 @@ def update_collection_object_from_df(
 
 def update_collection_object_from_df(
     path: str,
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     *,
     auth: Optional[AUTH] = None,
     conn_url: Optional[str] = None,
     batcher: Optional[Batcher] = None,
     is_async: bool = False,
 ) -> Union[Alias.Info, Coroutine[Any, Any, Alias.Info]]:
-    """update collection object: with `path` by data from dataframe"""
-    buffer = io.StringIO()
-    data = data.to_csv(buffer, index=False)
-    return update_collection_object(path, buffer.getvalue().encode('utf-8'), auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async)
+    """update collection object: with `path` by data from dataframe as csv, see also `upload_df_parquet` and `upload_df_feather`"""
+    buffer = io.BytesIO()
+    data.to_csv(buffer, index=False, encoding="utf-8")
+    return update_collection_object(path, buffer.getbuffer(), auth=auth, conn_url=conn_url, batcher=batcher, is_async=is_async)
+
+
+def __upload_df_object(
+    path: str,
+    data: Union[bytes, memoryview],
+    format: str,
+    collection_id: Optional[str],
+    *,
+    auth: Optional[AUTH],
+    conn_url: Optional[str],
+    is_async: bool,
+) -> Union[Alias.Info, Coroutine[Any, Any, Alias.Info]]:
+    if is_async:
+        async def upload() -> Alias.Info:
+            info = await f.post_collections_object_async(path, data, False, wait=True, auth=auth, conn_url=conn_url)
+            if collection_id is not None:
+                metadata = (await f.get_collections_id_async(collection_id, 0, 0, False, auth=auth, conn_url=conn_url)).metadata
+                await f.post_collections_metadata_async(collection_id, CollectionMetadata(data=fa.link_metadata(metadata, path, format)), wait=True, auth=auth, conn_url=conn_url)
+            return info
+        return upload()
+    info = f.post_collections_object(path, data, False, wait=True, auth=auth, conn_url=conn_url)
+    if collection_id is not None:
+        metadata = f.get_collections_id(collection_id, 0, 0, False, auth=auth, conn_url=conn_url).metadata
+        f.post_collections_metadata(collection_id, CollectionMetadata(data=fa.link_metadata(metadata, path, format)), wait=True, auth=auth, conn_url=conn_url)
+    return info
+
+
+def __download_df_object(
+    path: str,
+    decode: Callable[[bytes], "pd.DataFrame"],
+    *,
+    auth: Optional[AUTH],
+    conn_url: Optional[str],
+    is_async: bool,
+) -> Union["pd.DataFrame", Coroutine[Any, Any, "pd.DataFrame"]]:
+    if is_async:
+        async def download() -> "pd.DataFrame":
+            return decode(await f.get_collection_object_async(path, auth=auth, conn_url=conn_url))
+        return download()
+    return decode(f.get_collection_object(path, auth=auth, conn_url=conn_url))
+
+
+@overload
+def upload_df_parquet(
+    path: str,
+    data: "pd.DataFrame",
+    *,
+    compression: Optional[str] = "snappy",
+    collection_id: Optional[str] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Alias.Info:
+    pass
+
+
+@overload
+def upload_df_parquet(
+    path: str,
+    data: "pd.DataFrame",
+    *,
+    compression: Optional[str] = "snappy",
+    collection_id: Optional[str] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, Alias.Info]:
+    pass
+
+
+def upload_df_parquet(
+    path: str,
+    data: "pd.DataFrame",
+    *,
+    compression: Optional[str] = "snappy",
+    collection_id: Optional[str] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Alias.Info, Coroutine[Any, Any, Alias.Info]]:
+    """update collection object with `path` by dataframe as parquet (need pyarrow), index dropped; `collection_id` - link object in the collection metadata (`COLLECTION_OBJECT_KEY`)"""
+    return __upload_df_object(path, fa.df_to_parquet(data, compression), "parquet", collection_id, auth=auth, conn_url=conn_url, is_async=is_async)
+
+
+@overload
+def upload_df_feather(
+    path: str,
+    data: "pd.DataFrame",
+    *,
+    compression: Optional[str] = "lz4",
+    collection_id: Optional[str] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> Alias.Info:
+    pass
+
+
+@overload
+def upload_df_feather(
+    path: str,
+    data: "pd.DataFrame",
+    *,
+    compression: Optional[str] = "lz4",
+    collection_id: Optional[str] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, Alias.Info]:
+    pass
+
+
+def upload_df_feather(
+    path: str,
+    data: "pd.DataFrame",
+    *,
+    compression: Optional[str] = "lz4",
+    collection_id: Optional[str] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union[Alias.Info, Coroutine[Any, Any, Alias.Info]]:
+    """update collection object with `path` by dataframe as feather - arrow ipc file (need pyarrow), see `upload_df_parquet`"""
+    return __upload_df_object(path, fa.df_to_feather(data, compression), "feather", collection_id, auth=auth, conn_url=conn_url, is_async=is_async)
+
+
+@overload
+def download_df_parquet(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> "pd.DataFrame":
+    pass
+
+
+@overload
+def download_df_parquet(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, "pd.DataFrame"]:
+    pass
+
+
+def download_df_parquet(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union["pd.DataFrame", Coroutine[Any, Any, "pd.DataFrame"]]:
+    """return df from parquet collection object by `path` (need pyarrow), only `columns` if set"""
+    return __download_df_object(path, lambda data: fa.df_from_parquet(data, columns), auth=auth, conn_url=conn_url, is_async=is_async)
+
+
+@overload
+def download_df_feather(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[False] = False,
+) -> "pd.DataFrame":
+    pass
+
+
+@overload
+def download_df_feather(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: Literal[True],
+) -> Coroutine[Any, Any, "pd.DataFrame"]:
+    pass
+
+
+def download_df_feather(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    auth: Optional[AUTH] = None,
+    conn_url: Optional[str] = None,
+    is_async: bool = False,
+) -> Union["pd.DataFrame", Coroutine[Any, Any, "pd.DataFrame"]]:
+    """return df from feather collection object by `path` (need pyarrow), only `columns` if set"""
+    return __download_df_object(path, lambda data: fa.df_from_feather(data, columns), auth=auth, conn_url=conn_url, is_async=is_async)
 
 
 @overload
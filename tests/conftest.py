@@ -0,0 +1,18 @@
+from typing import Iterator
+
+import pytest
+
+from malevich_coretools.secondary import Config
+from malevich_coretools.testing import FakeCore
+
+pytest_plugins = ["malevich_coretools.testing.fixtures"]
+
+
+@pytest.fixture
+def own_core(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeCore]:
+    """server of the test only: host state (circuit breaker) is not shared with other tests"""
+    with FakeCore() as server:
+        monkeypatch.setattr(Config, "HOST_PORT", server.url)
+        monkeypatch.setattr(Config, "CORE_USERNAME", "test")
+        monkeypatch.setattr(Config, "CORE_PASSWORD", "test")
+        yield server
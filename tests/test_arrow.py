@@ -0,0 +1,32 @@
+import asyncio
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import malevich_coretools as mc
+from malevich_coretools.testing import FakeCore
+
+DF = pd.DataFrame({"i": range(1000), "f": np.linspace(0, 1, 1000), "s": [f"v{i}" for i in range(1000)]})
+
+
+@pytest.mark.parametrize("upload,download", [("upload_df_parquet", "download_df_parquet"), ("upload_df_feather", "download_df_feather")])
+def test_round_trip(fake_core: FakeCore, upload: str, download: str) -> None:
+    pytest.importorskip("pyarrow")
+    id = fake_core.add_collection([{"a": 1}])
+    getattr(mc, upload)("data/df", DF, collection_id=id)
+    pd.testing.assert_frame_equal(getattr(mc, download)("data/df"), DF)
+    assert getattr(mc, download)("data/df", columns=["s"])["s"].tolist() == DF["s"].tolist()
+    assert "data/df" in mc.get_collection(id).metadata
+
+    asyncio.run(getattr(mc, upload)("data/df2", DF, is_async=True))
+    pd.testing.assert_frame_equal(asyncio.run(getattr(mc, download)("data/df2", is_async=True)), DF)
+
+
+def test_csv_object(fake_core: FakeCore) -> None:
+    mc.update_collection_object_from_df("data/df.csv", DF)
+    pd.testing.assert_frame_equal(pd.read_csv(io.BytesIO(fake_core.objects["data/df.csv"])), DF)
+    with mc.Batcher():
+        mc.update_collection_object_from_df("data/df2.csv", DF.head(3))
+    assert fake_core.objects["data/df2.csv"] == DF.head(3).to_csv(index=False).encode()
@@ -0,0 +1,78 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from malevich_coretools.abstract.abstract import DocWithName
+from malevich_coretools.funcs import funcs as f
+from malevich_coretools.funcs.cache import DEFAULT_CACHE_TTLS, ResponseCache
+from malevich_coretools.secondary import Config
+from malevich_coretools.testing import FakeCore
+
+TTL = 0.3
+
+
+@pytest.fixture(params=[False, True], ids=["memory", "disk"])
+def cache(request: pytest.FixtureRequest, fake_core: FakeCore, monkeypatch: pytest.MonkeyPatch, tmp_path: str) -> Iterator[ResponseCache]:
+    cache = ResponseCache(ttls={**DEFAULT_CACHE_TTLS, "DOCS_ID": TTL}, path=str(tmp_path) if request.param else None)
+    monkeypatch.setattr(Config, "CACHE", cache)
+    yield cache
+
+
+def test_hit_until_ttl(fake_core: FakeCore, cache: ResponseCache) -> None:
+    id = fake_core.add_doc({"a": 1})
+    assert f.get_docs_id(id).data == f.get_docs_id(id).data
+    assert fake_core.calls["DOCS_ID"] == 1
+    time.sleep(TTL)
+    f.get_docs_id(id)
+    assert fake_core.calls["DOCS_ID"] == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_async_shares_cache(fake_core: FakeCore, cache: ResponseCache) -> None:
+    id = fake_core.add_doc({"a": 1})
+    f.get_docs_id(id)
+    asyncio.run(f.get_docs_id_async(id))
+    assert fake_core.calls["DOCS_ID"] == 1
+
+
+def test_not_cached_route(fake_core: FakeCore, cache: ResponseCache) -> None:
+    f.get_docs()
+    f.get_docs()
+    assert fake_core.calls["DOCS"] == 2
+
+
+def test_write_invalidates_controller(fake_core: FakeCore, cache: ResponseCache) -> None:
+    id = fake_core.add_doc({"a": 1})
+    f.get_docs_id(id)
+    f.post_docs_id(id, DocWithName(data='{"a": 2}', name=None), False)
+    assert f.get_docs_id(id).data == '{"a": 2}'
+    assert fake_core.calls["DOCS_ID"] == 3   # get, post, get
+
+
+def test_write_other_controller_kept(fake_core: FakeCore, cache: ResponseCache) -> None:
+    id = fake_core.add_doc({"a": 1})
+    f.get_docs_id(id)
+    fake_core.add_collection([{"a": 1}])
+    f.delete_collections(False)
+    f.get_docs_id(id)
+    assert fake_core.calls["DOCS_ID"] == 1
+
+
+def test_disk_entry_has_no_credentials(fake_core: FakeCore, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(Config, "CACHE", ResponseCache(path=str(tmp_path)))
+    monkeypatch.setattr(Config, "CORE_PASSWORD", "secret-password")
+    id = fake_core.add_doc({"a": 1})
+    f.get_docs_id(id)
+    files = [path for path in tmp_path.rglob("*") if path.is_file()]
+    assert len(files) == 1
+    data = files[0].read_bytes()
+    assert b"secret-password" not in data and Config.CORE_USERNAME.encode() not in data
+    assert json.loads(data.split(b"\n", 1)[0])["expires"] > time.time()
+    monkeypatch.setattr(Config, "CACHE", ResponseCache(path=str(tmp_path)))   # read back by new process
+    assert f.get_docs_id(id).data == '{"a": 1}'
+    assert fake_core.calls["DOCS_ID"] == 1
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import random
+
+import pandas as pd
+import pytest
+
+import malevich_coretools as mc
+from malevich_coretools.testing import FakeCore
+
+PAGES = mc.PagePolicy(page_size=7, min_page_size=3, max_page_size=20, concurrency=4)
+CHUNKS = mc.UploadPolicy(chunk_bytes=200, min_chunk_bytes=100, max_chunk_bytes=400, concurrency=4, retries=5, retry_delay=0.01)
+
+
+def _df(n: int) -> pd.DataFrame:
+    return pd.DataFrame({"i": range(n), "s": [f"v{i}" for i in range(n)]})
+
+
+@pytest.mark.parametrize("offset,limit", [(0, -1), (5, -1), (3, 50), (0, 1000)])
+def test_paged_order(fake_core: FakeCore, offset: int, limit: int) -> None:
+    id = fake_core.add_collection([{"i": i} for i in range(100)])
+    expected = mc.get_collection(id, offset, limit)
+    paged = mc.get_collection(id, offset, limit, paged=PAGES)
+    assert [doc.id for doc in paged.docs] == [doc.id for doc in expected.docs]
+    assert fake_core.calls["COLLECTIONS_ID"] > 2
+    assert asyncio.run(mc.get_collection(id, offset, limit, paged=PAGES, is_async=True)).docs == expected.docs
+
+
+def test_paged_raw_single_request(fake_core: FakeCore) -> None:
+    id = fake_core.add_collection([{"i": i} for i in range(100)])
+    assert mc.get_collection(id, raw=True, paged=PAGES) == mc.get_collection(id, raw=True)
+    assert fake_core.calls["COLLECTIONS_ID"] == 2
+
+
+def test_paged_in_batcher_single_request(fake_core: FakeCore) -> None:
+    id = fake_core.add_collection([{"i": i} for i in range(100)], name="c")
+    with mc.Batcher():
+        by_id = mc.get_collection(id, paged=PAGES)
+        by_name = mc.get_collection_by_name("c", paged=PAGES)
+    assert len(by_id.get().docs) == len(by_name.get().docs) == 100
+    assert fake_core.calls["BATCH"] == 1 and "COLLECTIONS_ID" not in fake_core.calls
+
+
+def test_iter_order(fake_core: FakeCore) -> None:
+    id = fake_core.add_collection([{"i": i} for i in range(50)])
+    pages = list(mc.iter_collection(id, page_size=8, prefetch=2))
+    assert [len(docs) for docs in pages] == [8] * 6 + [2]
+    assert [json.loads(doc.data)["i"] for docs in pages for doc in docs] == list(range(50))
+    dfs = list(mc.iter_collection_df(id, 10, page_size=15))
+    assert pd.concat(dfs, ignore_index=True)["i"].tolist() == list(range(10, 50))
+
+
+def test_chunked_upload_order(fake_core: FakeCore) -> None:
+    random.seed(0)
+    fake_core.fail("BATCH", status=500, rate=0.3)   # retried chunks finish out of order
+    df = _df(300)
+    id = mc.create_collection_from_df(df, name="chunked", chunked=CHUNKS)
+    fake_core.clear_faults()
+    assert fake_core.calls["COLLECTIONS_ID_ADD"] > 3
+    pd.testing.assert_frame_equal(mc.get_collection_to_df(id), df)
+    id = asyncio.run(mc.create_collection_from_df(df, chunked=CHUNKS, is_async=True))
+    pd.testing.assert_frame_equal(mc.get_collection_to_df(id), df)
+
+
+def test_chunked_update(fake_core: FakeCore) -> None:
+    id = mc.create_collection_from_df(_df(10))
+    assert mc.update_collection_from_df(id, _df(100), chunked=CHUNKS) == id
+    pd.testing.assert_frame_equal(mc.get_collection_to_df(id), _df(100))
+
+
+def test_chunked_add_response_lost(fake_core: FakeCore) -> None:
+    fake_core.fail("COLLECTIONS_ID_ADD", status=500, times=2, applied=True)
+    id = mc.create_collection_from_df(_df(300), chunked=CHUNKS)
+    pd.testing.assert_frame_equal(mc.get_collection_to_df(id), _df(300))
+
+
+def test_chunked_create_not_retried(fake_core: FakeCore) -> None:
+    fake_core.fail("COLLECTIONS_DATA", status=500, times=1, applied=True)
+    with pytest.raises(Exception):
+        mc.create_collection_from_df(_df(300), chunked=CHUNKS)
+    assert fake_core.calls["COLLECTIONS_DATA"] == 1
+    assert len(fake_core.collections) == 1
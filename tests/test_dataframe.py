@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from malevich_coretools.abstract.abstract import ResultCollection, ResultDoc, Scheme
+from malevich_coretools.funcs.helpers import (
+    collection_to_df,
+    df_to_docs,
+    docs_to_df,
+    scheme_dtypes,
+)
+from malevich_coretools.secondary import Config
+from malevich_coretools.secondary.codec import codec_by_name
+
+FRAMES = {
+    "objects": pd.DataFrame({"s": ["a", None, "ы\"\n"], "i": [1, 2, 3], "o": [[1], {"k": 1}, None]}),
+    "nan": pd.DataFrame({"s": ["a", "b", "c"], "f": [1.5, np.nan, -2.0]}),
+    "dates": pd.DataFrame({"s": ["a", "b"], "d": pd.to_datetime(["2024-01-01 00:00:00", "2024-01-02 03:04:05"]), "t": pd.to_timedelta([1, 2], unit="s")}),
+    "bools": pd.DataFrame({"s": ["a", "b"], "b": [True, False]}),
+    "columns": pd.DataFrame({1: ["a", "b"], "x y": [1, 2]}),
+    "empty": pd.DataFrame({"s": pd.Series([], dtype=object)}),
+}
+
+
+@pytest.mark.parametrize("name", FRAMES)
+def test_df_to_docs_as_iterrows(name: str) -> None:
+    data = FRAMES[name]
+    assert df_to_docs(data, chunk_size=2) == [row.to_json() for _, row in data.iterrows()]
+
+
+def test_df_to_docs_numeric_upcast() -> None:
+    data = pd.DataFrame({"i": [1, 2], "f": np.array([0.5, 1.5], dtype="float32"), "u": np.array([2, 3], dtype="uint8")})
+    docs = df_to_docs(data, chunk_size=1)
+    assert docs == [row.to_json() for _, row in data.iterrows()]
+    assert docs[0] == '{"i":1.0,"f":0.5,"u":2.0}'
+    assert df_to_docs(data[["i", "u"]]) == ['{"i":1,"u":2}', '{"i":2,"u":3}']
+
+
+def _collection(docs: list, scheme: dict) -> ResultCollection:
+    return ResultCollection(
+        id="id",
+        docs=[ResultDoc(id=str(i), name="", data=json.dumps(doc)) for i, doc in enumerate(docs)],
+        length=len(docs),
+        scheme=Scheme(id="scheme", name="scheme", data=json.dumps(scheme)),
+    )
+
+
+@pytest.mark.parametrize("docs", [
+    [{"a": i, "s": str(i), "f": i} for i in range(5)],
+    [{"a": 1, "s": "x"}, {"a": None, "s": "y", "f": 1.5, "z": [1]}],
+    [{"a": 1}, {"a": 2}, {"b": "x"}],
+    [{"a": 2 ** 64}, {"a": -1}],
+    [],
+])
+def test_docs_to_df_as_from_records(docs: list) -> None:
+    expected = pd.DataFrame.from_records(docs)
+    pd.testing.assert_frame_equal(docs_to_df([json.dumps(doc) for doc in docs], chunk_size=2), expected)
+    collection = _collection(docs, {"a": "int", "s": "str", "f": "float"})
+    pd.testing.assert_frame_equal(collection_to_df(collection), expected)
+
+
+def test_scheme_dtypes_opt_in() -> None:
+    collection = _collection([{"a": 1, "s": "x", "f": 1}, {"a": None, "s": "y", "f": 2}], {"properties": {"a": {"type": "integer"}, "s": {"type": "string"}, "f": {"type": "number"}}})
+    assert scheme_dtypes(collection.scheme) == {"a": "Int64", "s": "string", "f": "float64"}
+    data = collection_to_df(collection, "scheme")
+    assert data.dtypes.to_dict() == {"a": pd.Int64Dtype(), "s": pd.StringDtype(), "f": np.dtype("float64")}
+    assert collection_to_df(collection, {"f": "float32"})["f"].dtype == np.float32
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_docs_to_df_codec(name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip(name)
+    monkeypatch.setattr(Config, "CODEC", codec_by_name(name))
+    docs = [{"i": i, "f": i / 3, "s": str(i), "n": None if i % 2 else i} for i in range(5)]
+    pd.testing.assert_frame_equal(docs_to_df([json.dumps(doc) for doc in docs], chunk_size=2), pd.DataFrame.from_records(docs))
@@ -0,0 +1,71 @@
+import random
+import time
+
+import pandas as pd
+import pytest
+
+import malevich_coretools as mc
+from malevich_coretools.funcs import funcs as f
+from malevich_coretools.funcs.transport import RequestPolicy, request_policy
+from malevich_coretools.secondary import Config
+from malevich_coretools.testing import FakeCore
+
+NO_RETRY = RequestPolicy(retries=0, circuit_failures=0)
+
+
+def test_fixture_sets_config(fake_core: FakeCore) -> None:
+    assert Config.HOST_PORT == Config.DM_HOST_PORT == fake_core.url
+    assert fake_core.calls == {}
+    assert fake_core.collections == {}
+
+
+def test_state(fake_core: FakeCore) -> None:
+    doc = fake_core.add_doc({"a": 1}, name="doc")
+    id = fake_core.add_collection([{"i": 1}, {"i": 2}], name="c")
+    fake_core.add_object("path/file", b"bytes")
+    assert f.get_docs_name("doc").id == doc
+    assert [doc.data for doc in mc.get_collection_by_name("c").docs] == ['{"i": 1}', '{"i": 2}']
+    assert mc.get_collection(id, 1, 1).length == 2
+    assert mc.get_collection_object("path/file") == b"bytes"
+    fake_core.reset()
+    assert fake_core.docs == {} and fake_core.objects == {}
+
+
+def test_fault_times(fake_core: FakeCore) -> None:
+    fake_core.fail("DOCS", status=418, times=2)
+    with request_policy(NO_RETRY):
+        for _ in range(2):
+            with pytest.raises(Exception):
+                f.get_docs()
+        f.get_docs()
+    assert fake_core.calls["DOCS"] == 3
+
+
+def test_fault_rate(fake_core: FakeCore) -> None:
+    random.seed(1)
+    fake_core.fail("DOCS", status=500, rate=0.5)
+    failed = 0
+    with request_policy(NO_RETRY):
+        for _ in range(40):
+            try:
+                f.get_docs()
+            except Exception:
+                failed += 1
+    assert 5 < failed < 35
+
+
+def test_fault_applied(fake_core: FakeCore) -> None:
+    fake_core.fail("COLLECTIONS_DATA", status=500, times=1, applied=True)
+    with request_policy(NO_RETRY), pytest.raises(Exception):
+        mc.create_collection_from_df(pd.DataFrame({"a": [1]}))
+    assert len(fake_core.collections) == 1   # handled, response lost
+
+
+def test_latency(fake_core: FakeCore) -> None:
+    fake_core.set_latency(0.2, "DOCS")
+    start = time.monotonic()
+    f.get_docs()
+    assert time.monotonic() - start >= 0.2
+    start = time.monotonic()
+    mc.get_collections()
+    assert time.monotonic() - start < 0.2
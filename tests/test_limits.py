@@ -0,0 +1,52 @@
+import asyncio
+from typing import Iterator, Optional
+
+import pytest
+
+from malevich_coretools import RateLimits, set_rate_limits
+from malevich_coretools.funcs import limits
+from malevich_coretools.funcs.sessions import async_sessions, sync_sessions
+from malevich_coretools.funcs.transport import request, request_async
+from malevich_coretools.testing import FakeCore
+
+
+@pytest.fixture
+def one_in_flight() -> Iterator[None]:
+    set_rate_limits(RateLimits(max_in_flight=1))
+    yield
+    set_rate_limits(None)
+
+
+def in_flight(url: str, loop: Optional[asyncio.AbstractEventLoop] = None) -> int:
+    limiter = limits._limiter(url)
+    semaphore = limiter._Limiter__semaphore if loop is None else limiter._Limiter__loop_semaphores[loop]
+    return 1 - semaphore._value
+
+
+def test_stream_holds_slot(fake_core: FakeCore, one_in_flight: None) -> None:
+    url = f"{fake_core.url}/api/v1/collections"
+    with request(sync_sessions.get(fake_core.url), "GET", url, stream=True) as response:
+        assert in_flight(url) == 1
+        response.content
+    assert in_flight(url) == 0
+    request(sync_sessions.get(fake_core.url), "GET", url)
+    assert in_flight(url) == 0
+
+
+def test_stream_holds_slot_async(fake_core: FakeCore, one_in_flight: None) -> None:
+    url = f"{fake_core.url}/api/v1/collections"
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        async with await request_async(async_sessions.get(fake_core.url), "GET", url, stream=True) as response:
+            assert in_flight(url, loop) == 1
+            await response.read()
+            assert in_flight(url, loop) == 1
+        assert in_flight(url, loop) == 0
+        await request_async(async_sessions.get(fake_core.url), "GET", url)
+        assert in_flight(url, loop) == 0
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(run())
+    loop.close()
+    assert len(limits._limiter(url)._Limiter__loop_semaphores) == 0
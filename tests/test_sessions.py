@@ -0,0 +1,29 @@
+import asyncio
+from typing import Tuple
+
+import malevich_coretools as mc
+from malevich_coretools.funcs.sessions import async_sessions
+from malevich_coretools.testing import FakeCore
+
+
+def test_sessions_closed_on_loop_close(fake_core: FakeCore) -> None:
+    loop = asyncio.new_event_loop()
+    async def run() -> object:
+        await mc.get_collections(is_async=True)
+        return async_sessions.get(fake_core.url)
+
+    session = loop.run_until_complete(run())
+    assert not session.closed
+    loop.close()
+    assert session.closed and loop.is_closed()
+    assert loop not in async_sessions._AsyncSessionRegistry__loops
+
+
+def test_sessions_closed_by_asyncio_run(fake_core: FakeCore) -> None:
+    async def run() -> Tuple[object, asyncio.AbstractEventLoop]:
+        await mc.get_collections(is_async=True)
+        return async_sessions.get(fake_core.url), asyncio.get_running_loop()
+
+    session, loop = asyncio.run(run())
+    assert session.closed
+    assert loop not in async_sessions._AsyncSessionRegistry__loops
@@ -0,0 +1,51 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from malevich_coretools.funcs import funcs as f
+from malevich_coretools.secondary import Config
+from malevich_coretools.testing import FakeCore
+
+
+@pytest.fixture
+def single_flight(fake_core: FakeCore, monkeypatch: pytest.MonkeyPatch) -> FakeCore:
+    monkeypatch.setattr(Config, "SINGLE_FLIGHT", True)
+    fake_core.add_doc({"a": 1})
+    fake_core.set_latency(0.2, "DOCS")
+    return fake_core
+
+
+def test_threads_coalesced(single_flight: FakeCore) -> None:
+    with ThreadPoolExecutor(16) as pool:
+        results = list(pool.map(lambda _: f.get_docs(), range(16)))
+    assert single_flight.calls["DOCS"] == 1
+    assert all(result == results[0] for result in results)
+    assert len(results[0].ids) == 1
+
+
+def test_async_coalesced_and_caller_cancelled(single_flight: FakeCore) -> None:
+    async def run() -> list:
+        tasks = [asyncio.ensure_future(f.get_docs_async()) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        tasks[0].cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert all(len(result.ids) == 1 for result in results[1:])
+    assert single_flight.calls["DOCS"] == 1
+
+
+def test_sequential_not_coalesced(single_flight: FakeCore) -> None:
+    f.get_docs()
+    f.get_docs()
+    assert single_flight.calls["DOCS"] == 2
+
+
+def test_error_shared(single_flight: FakeCore) -> None:
+    single_flight.fail("DOCS", status=500, times=1)
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(f.get_docs) for _ in range(4)]
+    assert all(future.exception() is not None for future in futures)
+    assert single_flight.calls["DOCS"] == 1
@@ -0,0 +1,74 @@
+import json
+import random
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from malevich_coretools.secondary.stream import JsonArrayReader
+
+BODY = {
+    "id": "collection",
+    "length": -12.5e-3,
+    "data": [1, -2, 3.25, 1e10, -4.5E+2, 0.0, "7", True, None, {"a": [1.5, 2e-3]}, [], "ы\n\"", 123456789012345678901234567890],
+    "n": 2e2,
+    "flag": False,
+    "last": 10,
+}
+
+
+def read(chunks: List[bytes]) -> Tuple[List[Any], Dict[str, Any]]:
+    reader = JsonArrayReader("data")
+    items = []
+    for chunk in chunks:
+        items.extend(reader.feed(chunk))
+    items.extend(reader.close())
+    return items, reader.fields
+
+
+def split(data: bytes, count: int, rand: random.Random) -> List[bytes]:
+    cuts = sorted(rand.sample(range(1, len(data)), min(count, len(data) - 1)))
+    return [data[start:end] for start, end in zip([0, *cuts], [*cuts, len(data)])]
+
+
+def test_whole_body() -> None:
+    items, fields = read([json.dumps(BODY).encode()])
+    assert items == BODY["data"]
+    assert fields == {key: value for key, value in BODY.items() if key != "data"}
+
+
+@pytest.mark.parametrize("chunks", [
+    [b'{"data":[1.', b"5]}"],
+    [b'{"data":[1e', b"-", b"3]}"],
+    [b'{"data":[2E+', b"1,", b"3]}"],
+    [b'{"data":[-', b"1]}"],
+])
+def test_number_split(chunks: List[bytes]) -> None:
+    items, _ = read(chunks)
+    assert items == json.loads(b"".join(chunks))["data"]
+
+
+def test_field_number_split() -> None:
+    _, fields = read([b'{"n":2e', b'2,"data":[],"m":1', b"0}"])
+    assert fields == {"n": 200.0, "m": 10}
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_chunk_boundaries(seed: int) -> None:
+    rand = random.Random(seed)
+    data = json.dumps(BODY, indent=rand.choice([None, 1]), ensure_ascii=False).encode()
+    items, fields = read(split(data, rand.randint(1, len(data) // 2), rand))
+    assert items == BODY["data"]
+    assert fields == {key: value for key, value in BODY.items() if key != "data"}
+
+
+def test_every_boundary() -> None:
+    data = json.dumps(BODY).encode()
+    for cut in range(1, len(data)):
+        items, fields = read([data[:cut], data[cut:]])
+        assert items == BODY["data"], cut
+        assert fields["n"] == BODY["n"], cut
+
+
+def test_incomplete_body() -> None:
+    with pytest.raises(ValueError):
+        read([b'{"data":[1,2'])
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Iterator
+
+import pytest
+import requests
+
+import malevich_coretools as mc
+from malevich_coretools import set_compression
+from malevich_coretools.abstract.abstract import DocWithName
+from malevich_coretools.funcs import funcs as f
+from malevich_coretools.funcs import transport
+from malevich_coretools.funcs.transport import (
+    CircuitOpenError,
+    RequestPolicy,
+    long_wait_policy,
+    request,
+    request_policy,
+)
+from malevich_coretools.secondary import Config
+from malevich_coretools.testing import FakeCore
+
+FAST = RequestPolicy(backoff_factor=0.01, jitter=False)
+CIRCUIT = RequestPolicy(retries=0, circuit_failures=2, circuit_reset=0.2)
+
+
+class _Session:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+    def request(self, *args: Any, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        raise self.error
+
+
+def _open(core: FakeCore) -> None:
+    core.fail("DOCS", status=502)
+    for _ in range(CIRCUIT.circuit_failures):
+        with pytest.raises(Exception):
+            f.get_docs()
+    with pytest.raises(CircuitOpenError):
+        f.get_docs()
+    core.clear_faults()
+
+
+def test_retry_idempotent(own_core: FakeCore) -> None:
+    own_core.fail("DOCS", status=503, times=2)
+    with request_policy(FAST):
+        assert f.get_docs().ids == []
+    assert own_core.calls["DOCS"] == 3
+
+
+def test_retry_exhausted(own_core: FakeCore) -> None:
+    own_core.fail("DOCS", status=502, times=10)
+    with request_policy(FAST.model_copy(update={"circuit_failures": 0})), pytest.raises(Exception):
+        f.get_docs()
+    assert own_core.calls["DOCS"] == FAST.retries + 1
+
+
+def test_post_not_retried(own_core: FakeCore) -> None:
+    own_core.fail("DOCS", status=502, times=1)
+    with request_policy(FAST), pytest.raises(Exception):
+        f.post_docs(DocWithName(data="{}", name=None), False)
+    assert own_core.calls["DOCS"] == 1
+    own_core.fail("DOCS", status=503, times=1)     # not processed, safe to repeat
+    with request_policy(FAST):
+        f.post_docs(DocWithName(data="{}", name=None), False)
+    assert own_core.calls["DOCS"] == 3
+
+
+def test_circuit_open_half_open_closed(own_core: FakeCore) -> None:
+    with request_policy(CIRCUIT):
+        _open(own_core)
+        calls = own_core.calls["DOCS"]
+        time.sleep(CIRCUIT.circuit_reset)
+        f.get_docs()    # trial
+        f.get_docs()
+    assert own_core.calls["DOCS"] == calls + 2
+
+
+def test_circuit_trial_failure_reopens(own_core: FakeCore) -> None:
+    with request_policy(CIRCUIT):
+        _open(own_core)
+        time.sleep(CIRCUIT.circuit_reset)
+        own_core.fail("DOCS", status=502, times=1)
+        with pytest.raises(Exception):
+            f.get_docs()
+        with pytest.raises(CircuitOpenError):
+            f.get_docs()
+
+
+@pytest.mark.parametrize("error,failure", [(ValueError("encoding"), True), (KeyboardInterrupt(), False)])
+def test_circuit_trial_released(own_core: FakeCore, error: BaseException, failure: bool) -> None:
+    url = f"{own_core.url}api/v1/docs"
+    with request_policy(CIRCUIT):
+        _open(own_core)
+        time.sleep(CIRCUIT.circuit_reset)
+        with pytest.raises(type(error)):
+            request(_Session(error), "GET", url)
+        if failure:
+            with pytest.raises(CircuitOpenError):
+                f.get_docs()
+            time.sleep(CIRCUIT.circuit_reset)
+        f.get_docs()
+
+
+def test_circuit_trial_cancelled(own_core: FakeCore) -> None:
+    async def run() -> None:
+        with request_policy(CIRCUIT):
+            own_core.set_latency(1, "DOCS")
+            trial = asyncio.ensure_future(f.get_docs_async())
+            await asyncio.sleep(0.1)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            own_core.set_latency(0, "DOCS")
+            await f.get_docs_async()
+
+    with request_policy(CIRCUIT):
+        _open(own_core)
+    time.sleep(CIRCUIT.circuit_reset)
+    asyncio.run(run())
+
+
+def test_read_timeout(own_core: FakeCore) -> None:
+    own_core.set_latency(1, "DOCS")
+    policy = RequestPolicy(read_timeout=0.2, retries=0, circuit_failures=0)
+    with request_policy(policy):
+        with pytest.raises(requests.Timeout):
+            f.get_docs()
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(f.get_docs_async())
+        with request_policy(long_wait_policy()):
+            assert f.get_docs().ids == []
+    assert RequestPolicy().read_timeout is not None
+
+
+@pytest.fixture
+def compression() -> Iterator[None]:
+    threshold = Config.COMPRESSION_THRESHOLD
+    yield
+    set_compression(None, threshold)
+
+
+def test_gzip_upload(fake_core: FakeCore, compression: None) -> None:
+    docs = [json.dumps({"i": i, "s": "text" * 10}) for i in range(100)]
+    set_compression("gzip", 0)
+    id = mc.create_collection_by_docs(docs)
+    assert fake_core.headers["COLLECTIONS_DATA"]["Content-Encoding"] == "gzip"
+    assert [doc.data for doc in mc.get_collection(id).docs] == docs
+    asyncio.run(mc.create_collection_by_docs(docs, is_async=True))
+    assert fake_core.headers["COLLECTIONS_DATA"]["Content-Encoding"] == "gzip"
+
+
+def test_small_body_not_compressed(fake_core: FakeCore, compression: None) -> None:
+    set_compression("gzip", 1024 * 1024)
+    mc.create_collection_by_docs(["{}"])
+    assert "Content-Encoding" not in fake_core.headers["COLLECTIONS_DATA"]
+
+
+def test_zstd_fallback(fake_core: FakeCore, compression: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    for module in ["zstandard", "compression", "compression.zstd"]:
+        monkeypatch.setitem(sys.modules, module, None)
+    monkeypatch.setattr(transport, "__body_compressors", {})
+    set_compression("zstd", 0)
+    id = mc.create_collection_by_docs(['{"a": 1}'])
+    assert fake_core.headers["COLLECTIONS_DATA"]["Content-Encoding"] == "gzip"
+    assert mc.get_collection(id).docs[0].data == '{"a": 1}'
@@ -0,0 +1,72 @@
+import asyncio
+from typing import List
+
+import pytest
+
+import malevich_coretools as mc
+from malevich_coretools.funcs import funcs as f
+from malevich_coretools.testing import FakeCore
+
+POLICY = mc.WaitPolicy(initial_interval=0.02, max_interval=0.1)
+
+
+def _run(core: FakeCore, latencies: List[float]) -> List[str]:
+    ids = []
+    for latency in latencies:
+        core.operation_latency = latency
+        ids.append(mc.task_prepare("task").operationId)
+        mc.task_run(ids[-1], wait=False)
+    return ids
+
+
+def test_as_completed_order(fake_core: FakeCore) -> None:
+    ids = _run(fake_core, [0.6, 0.1, 0.35])
+    events = []
+    done = [event.operation_id for event in mc.as_completed(ids, policy=POLICY, on_event=events.append)]
+    assert done == [ids[1], ids[2], ids[0]]
+    assert {event.status for event in events} >= {"SUCCESS"}
+    assert fake_core.calls.get("OPERATION_RESULTS_ID") is None    # polled by batch requests
+
+
+def test_as_completed_async(fake_core: FakeCore) -> None:
+    ids = _run(fake_core, [0.2, 0.05])
+
+    async def run() -> List[str]:
+        return [event.operation_id async for event in mc.as_completed(ids, policy=POLICY, is_async=True)]
+
+    assert asyncio.run(run()) == [ids[1], ids[0]]
+
+
+def test_wait_many(fake_core: FakeCore) -> None:
+    ids = _run(fake_core, [0.2, 0.05, 0.1])
+    events = mc.wait_many([*ids, ids[0]], policy=POLICY)
+    assert list(events) == ids
+    assert all(event.status == "SUCCESS" and event.result is not None for event in events.values())
+    ids = _run(fake_core, [0.1, 0.05])
+    assert list(asyncio.run(mc.wait_many(ids, policy=POLICY, is_async=True))) == ids
+
+
+def test_wait_many_timeout(fake_core: FakeCore) -> None:
+    ids = _run(fake_core, [5])
+    with pytest.raises(TimeoutError):
+        mc.wait_many(ids, timeout=0.2, policy=POLICY)
+
+
+@pytest.mark.parametrize("code,status", [(200, "SUCCESS"), (404, "PENDING"), (429, "PENDING"), (502, "PENDING"), (500, "PENDING"), (400, "FAILED"), (403, "FAILED")])
+def test_result_status(code: int, status: str) -> None:
+    assert f.__result_status(code) == status
+
+
+def test_wait_result_pending_on_server_error(own_core: FakeCore) -> None:
+    id = _run(own_core, [0.1])[0]
+    own_core.fail("OPERATION_RESULTS_ID", status=500, times=3)
+    assert mc.wait_operation_result(id, policy=POLICY) is not None
+    assert own_core.calls["OPERATION_RESULTS_ID"] > 3
+
+
+def test_wait_result_failed(own_core: FakeCore) -> None:
+    id = _run(own_core, [0.1])[0]
+    own_core.fail("OPERATION_RESULTS_ID", status=403)
+    with pytest.raises(Exception):
+        mc.wait_operation_result(id, timeout=5, policy=POLICY)
+    assert own_core.calls["OPERATION_RESULTS_ID"] == 1